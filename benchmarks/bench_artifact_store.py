@@ -0,0 +1,117 @@
+"""Benchmark the cold start and the memory of N independent app processes (spawned, not forked) sharing the same model artifact, with and without the artifact store.
+Memory is measured as the sum of the proportional set size (PSS) of the processes, so the memory mapped pages are counted once. Linux only.
+
+    python benchmarks/bench_artifact_store.py --artifact-mb 256 --processes 4
+"""
+
+import argparse
+import logging
+import multiprocessing
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro_datasets.pickle import PickleDataset
+
+from kedro_boot.framework.compiler.specs import CompilationSpec, MaterializationSpec
+from kedro_boot.framework.session import KedroBootSession
+
+
+def score(features, model, lookup):
+    return float(model[: len(features)] @ features) + float(lookup["bias"].iloc[0])
+
+
+def serve(tmp_dir: str, store_dir: Optional[str], ready, stop) -> None:
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+    start = time.perf_counter()
+    session = KedroBootSession(
+        pipeline=pipeline(
+            [node(score, ["features", "model", "lookup"], "score")],
+            namespace="predict",
+        ),
+        catalog=DataCatalog(
+            {
+                "predict.features": MemoryDataset(),
+                "predict.model": PickleDataset(filepath=f"{tmp_dir}/model.pkl"),
+                "predict.lookup": PickleDataset(filepath=f"{tmp_dir}/lookup.pkl"),
+                "predict.score": MemoryDataset(),
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="bench",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [CompilationSpec(namespace="predict", inputs=["features"], outputs=["score"])],
+        materialization_spec=MaterializationSpec(store_dir=store_dir),
+    )
+    session.run(namespace="predict", inputs={"features": np.ones(8)})
+    ready.put(time.perf_counter() - start)
+    stop.wait()
+
+
+def pss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/smaps_rollup") as smaps:
+        for line in smaps:
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def start_processes(tmp_dir: str, store_dir: Optional[str], processes: int) -> tuple:
+    context = multiprocessing.get_context("spawn")
+    ready, stop = context.Queue(), context.Event()
+    workers = [
+        context.Process(target=serve, args=(tmp_dir, store_dir, ready, stop))
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    compile_times = [ready.get() for _ in workers]
+    memory = sum(pss_mb(worker.pid) for worker in workers)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return max(compile_times), memory
+
+
+def main(artifact_mb: int, processes: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        PickleDataset(filepath=f"{tmp_dir}/model.pkl").save(
+            np.random.rand(artifact_mb * 1024 * 1024 // 8)
+        )
+        PickleDataset(filepath=f"{tmp_dir}/lookup.pkl").save(
+            pd.DataFrame({"bias": np.random.rand(1_000_000)})
+        )
+        store_dir = str(Path(tmp_dir) / "store")
+
+        print(f"{processes} predict processes with a {artifact_mb} MB model artifact")
+        for label, process_store_dir in [
+            ("process memory", None),
+            ("artifact store, cold", store_dir),
+            ("artifact store, warm", store_dir),
+        ]:
+            compile_time, memory = start_processes(
+                tmp_dir, process_store_dir, processes
+            )
+            print(
+                f"  {label:20} : slowest compile {compile_time:6.2f} s   PSS {memory:8.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--artifact-mb", type=int, default=256)
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+    main(args.artifact_mb, args.processes)
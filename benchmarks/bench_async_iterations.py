@@ -0,0 +1,117 @@
+"""Benchmark the latency of fast namespace requests served by an event loop, while a slow namespace is requested concurrently.
+Iterations are either run in the event loop (blocking ``run``) or on the session iteration executor (``arun``).
+
+    python benchmarks/bench_async_iterations.py --requests 400 --slow-ratio 0.1
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import statistics
+import time
+import warnings
+
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline, node, pipeline
+
+from kedro_boot.framework.compiler.specs import CompilationSpec
+from kedro_boot.framework.session import KedroBootSession
+
+SLOW_LATENCY = 0.05
+
+
+def fast(x):
+    return x + 1
+
+
+def slow(x):
+    # Stand-in for a slow I/O bound pipeline (remote model, database)
+    time.sleep(SLOW_LATENCY)
+    return x + 1
+
+
+def build_session(max_workers: int) -> KedroBootSession:
+    session = KedroBootSession(
+        pipeline=Pipeline(
+            [
+                pipeline([node(fast, "x", "y")], namespace="fast"),
+                pipeline([node(slow, "x", "y")], namespace="slow"),
+            ]
+        ),
+        catalog=DataCatalog(
+            {
+                f"{namespace}.{dataset}": MemoryDataset()
+                for namespace in ["fast", "slow"]
+                for dataset in ["x", "y"]
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="bench",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [
+            CompilationSpec(
+                namespace=namespace, inputs=["x"], outputs=["y"], runner="compiled"
+            )
+            for namespace in ["fast", "slow"]
+        ]
+    )
+    session.set_iteration_executor(max_workers=max_workers)
+    return session
+
+
+async def serve(
+    session: KedroBootSession, requests: int, slow_ratio: float, use_arun: bool
+) -> list:
+    fast_latencies = []
+
+    async def handle(namespace: str, arrival: float) -> None:
+        if use_arun:
+            await session.arun(namespace=namespace, inputs={"x": 1})
+        else:
+            session.run(namespace=namespace, inputs={"x": 1})
+        if namespace == "fast":
+            fast_latencies.append(time.perf_counter() - arrival)
+
+    random.seed(0)
+    tasks = []
+    start = time.perf_counter()
+    for request in range(requests):
+        namespace = "slow" if random.random() < slow_ratio else "fast"
+        # Requests arrive every millisecond. The latency is measured from the scheduled arrival, as a blocked event loop delays the accept of the next requests
+        arrival = start + request * 0.001
+        await asyncio.sleep(max(0, arrival - time.perf_counter()))
+        tasks.append(asyncio.create_task(handle(namespace, arrival)))
+    await asyncio.gather(*tasks)
+    return fast_latencies
+
+
+def main(requests: int, slow_ratio: float, max_workers: int) -> None:
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    print(
+        f"fast namespace latency, with slow ({SLOW_LATENCY * 1e3:.0f} ms) requests ({requests} requests)"
+    )
+    for label, use_arun in [("run (blocking)", False), ("arun", True)]:
+        for ratio in [0.0, slow_ratio]:
+            session = build_session(max_workers)
+            latencies = asyncio.run(serve(session, requests, ratio, use_arun))
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"  {label:15} {ratio:4.0%} slow : p50 {quantiles[49] * 1e3:8.2f} ms   p99 {quantiles[98] * 1e3:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--slow-ratio", type=float, default=0.1)
+    parser.add_argument("--max-workers", type=int, default=16)
+    args = parser.parse_args()
+    main(args.requests, args.slow_ratio, args.max_workers)
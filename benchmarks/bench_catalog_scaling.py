@@ -0,0 +1,101 @@
+"""Benchmark the iteration render latency of a namespace against the number of unmanaged datasets of its catalog.
+
+    python benchmarks/bench_catalog_scaling.py --sizes 10 100 1000
+"""
+
+import argparse
+import copy
+import logging
+import timeit
+import warnings
+
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro_datasets.json import JSONDataset
+
+from kedro_boot.framework.compiler.specs import CompilationSpec
+from kedro_boot.framework.context import KedroBootContext
+
+
+def predict(features, *unmanaged):
+    return features
+
+
+def build_context(num_unmanaged: int) -> KedroBootContext:
+    unmanaged_names = [f"unmanaged_{i}" for i in range(num_unmanaged)]
+    namespace_pipeline = pipeline(
+        [node(predict, ["features", *unmanaged_names], "predictions")],
+        namespace="inference",
+    )
+    catalog = DataCatalog(
+        {
+            "inference.features": MemoryDataset(),
+            "inference.predictions": MemoryDataset(),
+            **{
+                f"inference.{name}": JSONDataset(filepath=f"data/{name}.json")
+                for name in unmanaged_names
+            },
+        }
+    )
+    context = KedroBootContext(pipeline=namespace_pipeline, catalog=catalog)
+    context.compile(
+        [
+            CompilationSpec(
+                namespace="inference",
+                inputs=["features"],
+                outputs=["predictions"],
+                infer_artifacts=False,
+            )
+        ]
+    )
+    return context
+
+
+def full_catalog_render(context: KedroBootContext, namespace: str) -> DataCatalog:
+    # Per iteration cost of rebuilding and deep copying the whole namespace catalog
+    catalog_assembly = context._namespaces_registry[namespace]["catalog"]
+    rendered_catalog = DataCatalog()
+    rendered_catalog.add_all(
+        {
+            "inference.features": MemoryDataset([1, 2, 3]),
+            **copy.deepcopy(catalog_assembly.outputs),
+            **catalog_assembly.parameters,
+            **catalog_assembly.artifacts,
+            **copy.deepcopy(catalog_assembly.unmanaged),
+        }
+    )
+    return rendered_catalog
+
+
+def main(sizes, repeat: int) -> None:
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    print(f"{'unmanaged':>10} {'full catalog (ms)':>18} {'layered (ms)':>13}")
+    for size in sizes:
+        context = build_context(size)
+        layered = min(
+            timeit.repeat(
+                lambda: context.render(
+                    namespace="inference", inputs={"features": [1, 2, 3]}
+                ),
+                number=10,
+                repeat=repeat,
+            )
+        )
+        full = min(
+            timeit.repeat(
+                lambda: full_catalog_render(context, "inference"),
+                number=10,
+                repeat=repeat,
+            )
+        )
+        print(f"{size:>10} {full * 100:>18.3f} {layered * 100:>13.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.sizes, args.repeat)
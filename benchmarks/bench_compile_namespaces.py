@@ -0,0 +1,107 @@
+"""Benchmark how the catalog compilation scales with the number of namespaces of a generated pipeline.
+Each namespace is a small chain of nodes with its own input, parameter and output datasets. The namespaces pipelines are filtered once per namespace (previous behavior) or indexed in a single pass.
+
+    python benchmarks/bench_compile_namespaces.py --namespaces 250 500 1000 2000
+"""
+
+import argparse
+import logging
+import time
+import warnings
+
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline, node, pipeline
+
+from kedro_boot.framework.compiler.specs import (
+    CompilationSpec,
+    filter_pipeline,
+    index_pipeline_namespaces,
+)
+from kedro_boot.framework.session import KedroBootSession
+
+
+def scale(features, factor):
+    return features * factor
+
+
+def shift(features, offset):
+    return features + offset
+
+
+def build_session(namespaces: int) -> KedroBootSession:
+    namespace_pipeline = pipeline(
+        [
+            node(scale, ["features", "params:factor"], "scaled"),
+            node(shift, ["scaled", "params:offset"], "prediction"),
+        ]
+    )
+    namespaces_pipeline = Pipeline(
+        [
+            pipeline(namespace_pipeline, namespace=f"tenant_{index}")
+            for index in range(namespaces)
+        ]
+    )
+    datasets = {}
+    for index in range(namespaces):
+        datasets.update(
+            {
+                f"tenant_{index}.features": MemoryDataset(),
+                f"params:tenant_{index}.factor": MemoryDataset(2),
+                f"params:tenant_{index}.offset": MemoryDataset(1),
+                f"tenant_{index}.scaled": MemoryDataset(),
+                f"tenant_{index}.prediction": MemoryDataset(),
+            }
+        )
+    return KedroBootSession(
+        pipeline=namespaces_pipeline,
+        catalog=DataCatalog(datasets),
+        hook_manager=_NullPluginManager(),
+        session_id="bench",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+
+
+def main(namespaces_counts: list) -> None:
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+    print(
+        "namespaces   filter per namespace   single pass index   compile (inferred specs)"
+    )
+    for namespaces in namespaces_counts:
+        session = build_session(namespaces)
+        namespace_names = [f"tenant_{index}" for index in range(namespaces)]
+
+        start_time = time.perf_counter()
+        for namespace in namespace_names:
+            filter_pipeline(session._context.pipeline, namespace)
+        filter_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        index_pipeline_namespaces(session._context.pipeline)
+        index_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        session.compile()
+        compile_time = time.perf_counter() - start_time
+        assert (
+            len(CompilationSpec.infer_compilation_specs(session._context.pipeline))
+            == namespaces
+        )
+        assert session.run(namespace="tenant_0", inputs={"features": 1}) == 3
+
+        print(
+            f"{namespaces:10}   {filter_time:18.3f} s   {index_time:15.3f} s   "
+            f"{compile_time:8.2f} s ({compile_time / namespaces * 1000:.2f} ms per namespace)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--namespaces", type=int, nargs="+", default=[250, 500, 1000, 2000]
+    )
+    args = parser.parse_args()
+    main(args.namespaces)
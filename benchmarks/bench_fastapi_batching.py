@@ -0,0 +1,138 @@
+"""Benchmark the throughput of a FastAPI prediction route receiving concurrent single-row requests, with and without micro-batching.
+
+    python benchmarks/bench_fastapi_batching.py --requests 512 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import List
+
+import httpx
+from fastapi import FastAPI
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro_datasets.pandas import CSVDataset
+from pydantic import BaseModel
+
+from kedro_boot.app.fastapi.session import (
+    KedroFastApi,
+    KedroFastApiSession,
+    kedro_fastapi_session,
+)
+from kedro_boot.framework.session import KedroBootSession
+
+INFERENCE_LATENCY = 0.002
+
+
+class ShuttleFeature(BaseModel):
+    engines: int
+    passenger_capacity: int
+    crew: float
+
+
+class ShuttlePrediction(BaseModel):
+    price: float
+
+
+def predict(features):
+    # Vectorized inference costs about the same on 1 or 64 rows
+    time.sleep(INFERENCE_LATENCY)
+    return (
+        features["engines"] * 1000.0
+        + features["passenger_capacity"] * 10.0
+        + features["crew"]
+    ).to_frame("price")
+
+
+def build_app(batching: dict, tmp_dir: str) -> FastAPI:
+    session = KedroBootSession(
+        pipeline=pipeline(
+            [node(predict, "features", "predict_price")], namespace="predict_price"
+        ),
+        catalog=DataCatalog(
+            {
+                "predict_price.features": CSVDataset(
+                    filepath=str(Path(tmp_dir) / "features.csv")
+                ),
+                "predict_price.predict_price": MemoryDataset(),
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="bench",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+
+    app = FastAPI()
+
+    @app.post("/predict", operation_id="predict_price")
+    def predict_price(
+        features: List[ShuttleFeature], kedro_run: KedroFastApi
+    ) -> List[ShuttlePrediction]:
+        return kedro_run.to_dict(orient="records")
+
+    fastapi_session = KedroFastApiSession(session, batching=batching)
+    fastapi_session.compile(app)
+    app.dependency_overrides[kedro_fastapi_session] = fastapi_session
+    return app
+
+
+async def send_requests(app: FastAPI, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    payload = [{"engines": 2, "passenger_capacity": 4, "crew": 3.0}]
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+
+        async def send() -> None:
+            async with semaphore:
+                response = await client.post("/predict", json=payload)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*[send() for _ in range(requests)])
+        return time.perf_counter() - start
+
+
+def main(requests: int, concurrency: int, max_batch_size: int, max_wait_ms: float):
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    print(
+        f"predict_price route, {requests} single-row requests, {concurrency} concurrent"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, batching in [
+            ("no batching", {}),
+            (
+                f"batching {max_batch_size} rows / {max_wait_ms} ms",
+                {
+                    "predict_price": {
+                        "max_batch_size": max_batch_size,
+                        "max_wait_ms": max_wait_ms,
+                    }
+                },
+            ),
+        ]:
+            duration = asyncio.run(
+                send_requests(build_app(batching, tmp_dir), requests, concurrency)
+            )
+            print(f"  {label:28} : {requests / duration:8.1f} requests/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=512)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    args = parser.parse_args()
+    main(args.requests, args.concurrency, args.max_batch_size, args.max_wait_ms)
@@ -0,0 +1,107 @@
+"""Benchmark the per iteration latency of a tiny namespace with project hooks registered, for each hook mode.
+
+    python benchmarks/bench_hook_modes.py --iterations 2000
+"""
+
+import argparse
+import logging
+import random
+import time
+import warnings
+
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks import hook_impl
+from kedro.framework.hooks.manager import _create_hook_manager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+
+from kedro_boot.framework.compiler.specs import CompilationSpec
+from kedro_boot.framework.session import KedroBootSession
+
+
+class TrackingHooks:
+    """Stand-in for the tracking and logging hooks of a project"""
+
+    def __init__(self):
+        self.events = []
+
+    @hook_impl
+    def before_node_run(self, node, inputs):
+        self.events.append((node.name, list(inputs)))
+
+    @hook_impl
+    def after_node_run(self, node, outputs):
+        self.events.append((node.name, list(outputs)))
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name, data):
+        self.events.append((dataset_name, type(data)))
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name, data):
+        self.events.append((dataset_name, type(data)))
+
+
+def simulate_distance(radius: float):
+    x = random.uniform(0, radius)
+    y = random.uniform(0, radius)
+    return x**2 + y**2
+
+
+def build_session(runner: str, hook_mode: str) -> KedroBootSession:
+    hook_manager = _create_hook_manager()
+    hook_manager.register(TrackingHooks())
+    session = KedroBootSession(
+        pipeline=pipeline(
+            [node(simulate_distance, "params:radius", "distance")],
+            namespace="simulate_distance",
+        ),
+        catalog=DataCatalog(
+            {
+                "params:simulate_distance.radius": MemoryDataset(1),
+                "simulate_distance.distance": MemoryDataset(),
+            }
+        ),
+        hook_manager=hook_manager,
+        session_id="bench",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [
+            CompilationSpec(
+                namespace="simulate_distance",
+                outputs=["distance"],
+                parameters=["radius"],
+                runner=runner,
+                hook_mode=hook_mode,
+                hook_sampling=100,
+            )
+        ]
+    )
+    return session
+
+
+def time_iterations(session: KedroBootSession, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        session.run(namespace="simulate_distance", parameters={"radius": 1})
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int) -> None:
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    print(f"simulate_distance iteration with project hooks ({iterations} iterations)")
+    for runner in ["sequential", "compiled"]:
+        for hook_mode in ["full", "sampled", "off"]:
+            latency = time_iterations(build_session(runner, hook_mode), iterations)
+            print(f"  {runner:10} runner, {hook_mode:7} hooks : {latency:9.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,58 @@
+"""Benchmark the conversion of a list of records request payload into a pandas input dataset.
+
+Compare the columnar fast path of the pandas input converter, with and without the dtypes of a route data model, with ``pd.json_normalize``.
+
+    python benchmarks/bench_input_conversion.py --rows 10000 --columns 20
+"""
+
+import argparse
+import random
+import timeit
+
+import pandas as pd
+
+from kedro_boot.framework.renderer.converters import TypedRecords, pandas_converter
+
+
+def build_records(num_rows: int, num_columns: int) -> list:
+    return [
+        {
+            "id": i,
+            "category": random.choice(["a", "b", "c"]),
+            **{f"feature_{j}": random.random() for j in range(num_columns)},
+        }
+        for i in range(num_rows)
+    ]
+
+
+def main(num_rows: int, num_columns: int, repeat: int) -> None:
+    records = build_records(num_rows, num_columns)
+    typed_records = TypedRecords(
+        records,
+        {"id": "int64", **{f"feature_{j}": "float64" for j in range(num_columns)}},
+    )
+
+    def time_it(func) -> float:
+        return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+    json_normalize = time_it(lambda: pd.json_normalize(records))
+    converter = time_it(lambda: pandas_converter(records))
+    typed_converter = time_it(lambda: pandas_converter(typed_records))
+
+    print(f"{num_rows} records x {num_columns + 2} columns (best of {repeat})")
+    print(f"  json_normalize : {json_normalize:9.3f} ms")
+    print(
+        f"  converter      : {converter:9.3f} ms  (x{json_normalize / converter:.1f})"
+    )
+    print(
+        f"  typed converter: {typed_converter:9.3f} ms  (x{json_normalize / typed_converter:.1f})"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.columns, args.repeat)
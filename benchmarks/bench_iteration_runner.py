@@ -0,0 +1,80 @@
+"""Benchmark the per iteration latency of a tiny namespace (the monte carlo ``simulate_distance`` example), with the sequential runner and with the compiled executor.
+
+    python benchmarks/bench_iteration_runner.py --iterations 2000
+"""
+
+import argparse
+import logging
+import random
+import time
+import warnings
+
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+
+from kedro_boot.framework.compiler.specs import CompilationSpec
+from kedro_boot.framework.session import KedroBootSession
+
+
+def simulate_distance(radius: float):
+    x = random.uniform(0, radius)
+    y = random.uniform(0, radius)
+    return x**2 + y**2
+
+
+def build_session(runner: str) -> KedroBootSession:
+    session = KedroBootSession(
+        pipeline=pipeline(
+            [node(simulate_distance, "params:radius", "distance")],
+            namespace="simulate_distance",
+        ),
+        catalog=DataCatalog(
+            {
+                "params:simulate_distance.radius": MemoryDataset(1),
+                "simulate_distance.distance": MemoryDataset(),
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="bench",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [
+            CompilationSpec(
+                namespace="simulate_distance",
+                outputs=["distance"],
+                parameters=["radius"],
+                runner=runner,
+            )
+        ]
+    )
+    return session
+
+
+def time_iterations(session: KedroBootSession, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        session.run(namespace="simulate_distance", parameters={"radius": 1})
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main(iterations: int) -> None:
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    sequential = time_iterations(build_session("sequential"), iterations)
+    compiled = time_iterations(build_session("compiled"), iterations)
+
+    print(f"simulate_distance iteration ({iterations} iterations)")
+    print(f"  sequential runner : {sequential:9.1f} us")
+    print(f"  compiled executor : {compiled:9.1f} us  (x{sequential / compiled:.1f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.iterations)
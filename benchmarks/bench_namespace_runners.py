@@ -0,0 +1,101 @@
+"""Benchmark the per iteration latency of a namespace with four independent I/O-bound scoring branches, for each namespace runner.
+
+    python benchmarks/bench_namespace_runners.py --iterations 50 --io-latency 0.005
+"""
+
+import argparse
+import logging
+import time
+import warnings
+
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+
+from kedro_boot.framework.compiler.specs import IO_BOUND_TAG, CompilationSpec
+from kedro_boot.framework.session import KedroBootSession
+
+BRANCHES = 4
+
+
+def build_session(runner: str, io_latency: float) -> KedroBootSession:
+    def score(x, weight):
+        # Stand-in for a remote model or feature store call
+        time.sleep(io_latency)
+        return x * weight
+
+    def total(*scores):
+        return sum(scores)
+
+    session = KedroBootSession(
+        pipeline=pipeline(
+            [
+                node(
+                    score,
+                    ["features", f"params:w{branch}"],
+                    f"score{branch}",
+                    tags=[IO_BOUND_TAG],
+                )
+                for branch in range(BRANCHES)
+            ]
+            + [node(total, [f"score{branch}" for branch in range(BRANCHES)], "total")],
+            namespace="evaluation",
+        ),
+        catalog=DataCatalog(
+            {
+                "evaluation.features": MemoryDataset(),
+                "evaluation.total": MemoryDataset(),
+                **{
+                    f"params:evaluation.w{branch}": MemoryDataset(branch)
+                    for branch in range(BRANCHES)
+                },
+                **{
+                    f"evaluation.score{branch}": MemoryDataset()
+                    for branch in range(BRANCHES)
+                },
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="bench",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [
+            CompilationSpec(
+                namespace="evaluation",
+                inputs=["features"],
+                outputs=["total"],
+                runner=runner,
+            )
+        ]
+    )
+    return session
+
+
+def time_iterations(session: KedroBootSession, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        session.run(namespace="evaluation", inputs={"features": 1})
+    return (time.perf_counter() - start) / iterations * 1e3
+
+
+def main(iterations: int, io_latency: float) -> None:
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    print(
+        f"evaluation iteration, {BRANCHES} branches of {io_latency * 1e3:.1f} ms ({iterations} iterations)"
+    )
+    for runner in ["sequential", "compiled", "thread", "auto"]:
+        latency = time_iterations(build_session(runner, io_latency), iterations)
+        print(f"  {runner:10} runner : {latency:7.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--io-latency", type=float, default=0.005)
+    args = parser.parse_args()
+    main(args.iterations, args.io_latency)
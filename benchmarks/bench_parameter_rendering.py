@@ -0,0 +1,54 @@
+"""Benchmark the rendering of a large nested parameters tree overridden at iteration time.
+
+Compare the compile time snapshot with overlay merging against the deepcopy, load and update path.
+
+    python benchmarks/bench_parameter_rendering.py --keys 5000
+"""
+
+import argparse
+import copy
+import timeit
+
+from kedro.io import MemoryDataset
+
+from kedro_boot.framework.renderer.plan import ParameterRenderPlan
+from kedro_boot.framework.renderer.renderer import _recursive_dict_update
+
+
+def build_parameters(num_keys: int, group_size: int = 50) -> dict:
+    return {
+        f"group_{group}": {
+            f"param_{i}": {"value": i, "bounds": [0, i]}
+            for i in range(group * group_size, min((group + 1) * group_size, num_keys))
+        }
+        for group in range((num_keys + group_size - 1) // group_size)
+    }
+
+
+def legacy_render(dataset: MemoryDataset, overrides: dict) -> MemoryDataset:
+    rendered_dataset = copy.deepcopy(dataset)
+    return MemoryDataset(_recursive_dict_update(rendered_dataset.load(), overrides))
+
+
+def main(num_keys: int, repeat: int) -> None:
+    dataset = MemoryDataset(build_parameters(num_keys))
+    overrides = {"group_0": {"param_0": {"value": -1}}}
+    parameter_render_plan = ParameterRenderPlan({"parameters": dataset})
+
+    def time_it(func) -> float:
+        return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+    legacy = time_it(lambda: legacy_render(dataset, overrides))
+    overlay = time_it(lambda: parameter_render_plan.render("parameters", overrides))
+
+    print(f"{num_keys} parameters (best of {repeat})")
+    print(f"  legacy  : {legacy:9.3f} ms")
+    print(f"  overlay : {overlay:9.3f} ms  (x{legacy / overlay:.0f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.keys, args.repeat)
@@ -0,0 +1,122 @@
+"""Benchmark the startup time and the memory of N forked app workers, when each worker compiles the catalog (default gunicorn mode) and when the master compiles it before forking them (preload mode).
+Memory is measured as the sum of the proportional set size (PSS) of the master and the workers, so the pages shared copy-on-write are counted once. Linux only.
+
+    python benchmarks/bench_preload_workers.py --artifact-mb 512 --workers 1 4 8
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro_datasets.pickle import PickleDataset
+
+from kedro_boot.framework.compiler.specs import CompilationSpec
+from kedro_boot.framework.session import KedroBootSession
+from kedro_boot.utils import freeze_heap_before_fork
+
+
+def score(features, model):
+    return float(model[: len(features)] @ features)
+
+
+def build_session(model_path: str) -> KedroBootSession:
+    return KedroBootSession(
+        pipeline=pipeline(
+            [node(score, ["features", "model"], "score")], namespace="predict"
+        ),
+        catalog=DataCatalog(
+            {
+                "predict.features": MemoryDataset(),
+                "predict.model": PickleDataset(filepath=model_path),
+                "predict.score": MemoryDataset(),
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="bench",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+
+
+def compile_session(session: KedroBootSession) -> None:
+    session.compile(
+        [CompilationSpec(namespace="predict", inputs=["features"], outputs=["score"])]
+    )
+
+
+def pss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/smaps_rollup") as smaps:
+        for line in smaps:
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def start_workers(model_path: str, workers: int, preload: bool) -> tuple:
+    start = time.perf_counter()
+    session = build_session(model_path)
+    if preload:
+        compile_session(session)
+        freeze_heap_before_fork()
+
+    ready_read, ready_write = os.pipe()
+    exit_read, exit_write = os.pipe()
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            if not preload:
+                compile_session(session)
+            # Serve a request, as a ready worker would
+            session.run(namespace="predict", inputs={"features": np.ones(8)})
+            os.write(ready_write, b"r")
+            os.read(exit_read, 1)
+            os._exit(0)
+        pids.append(pid)
+
+    for _ in range(workers):
+        os.read(ready_read, 1)
+    startup_time = time.perf_counter() - start
+
+    memory = pss_mb(os.getpid()) + sum(pss_mb(pid) for pid in pids)
+
+    os.write(exit_write, b"e" * workers)
+    for pid in pids:
+        os.waitpid(pid, 0)
+    return startup_time, memory
+
+
+def main(artifact_mb: int, workers_counts: list) -> None:
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = str(Path(tmp_dir) / "model.pkl")
+        PickleDataset(filepath=model_path).save(
+            np.random.rand(artifact_mb * 1024 * 1024 // 8)
+        )
+
+        print(f"predict workers with a {artifact_mb} MB model artifact")
+        for workers in workers_counts:
+            for label, preload in [("per worker compile", False), ("preload", True)]:
+                startup_time, memory = start_workers(model_path, workers, preload)
+                print(
+                    f"  {workers} workers, {label:18} : startup {startup_time:6.2f} s   PSS {memory:8.1f} MB"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--artifact-mb", type=int, default=512)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+    main(args.artifact_mb, args.workers)
@@ -0,0 +1,48 @@
+"""Benchmark the monte carlo ``simulate_distance`` samples run one by one with ``KedroBootSession.run``, and as a batch with ``KedroBootSession.run_batch``.
+
+    python benchmarks/bench_run_batch.py --num-samples 2000
+"""
+
+import argparse
+import logging
+import time
+import warnings
+
+from bench_iteration_runner import build_session
+
+
+def time_loop(num_samples: int, runner: str) -> float:
+    session = build_session(runner)
+    start = time.perf_counter()
+    for _ in range(num_samples):
+        session.run(namespace="simulate_distance", parameters={"radius": 1})
+    return time.perf_counter() - start
+
+
+def time_batch(num_samples: int, runner: str) -> float:
+    session = build_session(runner)
+    start = time.perf_counter()
+    session.run_batch(
+        namespace="simulate_distance", parameters_list=[{"radius": 1}] * num_samples
+    )
+    return time.perf_counter() - start
+
+
+def main(num_samples: int) -> None:
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    print(f"simulate_distance samples ({num_samples} samples)")
+    for runner in ["sequential", "compiled"]:
+        loop = time_loop(num_samples, runner)
+        batch = time_batch(num_samples, runner)
+        print(
+            f"  {runner:10} runner : run loop {loop * 1e3:8.1f} ms   run_batch {batch * 1e3:8.1f} ms  (x{loop / batch:.2f})"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-samples", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.num_samples)
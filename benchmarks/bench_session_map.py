@@ -0,0 +1,101 @@
+"""Benchmark the scaling of ``KedroBootSession.map`` over a monte carlo parameter grid, for a CPU bound namespace, with thread and process pools.
+
+    python benchmarks/bench_session_map.py --grid-size 32 --num-samples 20000
+"""
+
+import argparse
+import logging
+import os
+import random
+import time
+import warnings
+
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+
+from kedro_boot.framework.compiler.specs import CompilationSpec
+from kedro_boot.framework.session import KedroBootSession
+
+
+def estimate_pi(radius: float, num_samples: int):
+    inside = 0
+    for _ in range(num_samples):
+        x = random.uniform(0, radius)
+        y = random.uniform(0, radius)
+        inside += x**2 + y**2 <= radius**2
+    return 4 * inside / num_samples
+
+
+def build_session() -> KedroBootSession:
+    session = KedroBootSession(
+        pipeline=pipeline(
+            [node(estimate_pi, ["params:radius", "params:num_samples"], "pi")],
+            namespace="estimate_pi",
+        ),
+        catalog=DataCatalog(
+            {
+                "params:estimate_pi.radius": MemoryDataset(1),
+                "params:estimate_pi.num_samples": MemoryDataset(1),
+                "estimate_pi.pi": MemoryDataset(),
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="bench",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [
+            CompilationSpec(
+                namespace="estimate_pi",
+                outputs=["pi"],
+                parameters=["radius", "num_samples"],
+            )
+        ]
+    )
+    return session
+
+
+def time_map(
+    session: KedroBootSession, grid: dict, executor: str, max_workers: int
+) -> float:
+    start = time.perf_counter()
+    for _ in session.map(
+        namespace="estimate_pi", grid=grid, executor=executor, max_workers=max_workers
+    ):
+        pass
+    return time.perf_counter() - start
+
+
+def main(grid_size: int, num_samples: int) -> None:
+    logging.disable(logging.WARNING)
+    warnings.simplefilter("ignore")
+
+    session = build_session()
+    grid = {
+        "radius": [1 + index for index in range(grid_size)],
+        "num_samples": [num_samples],
+    }
+    cores = os.cpu_count() or 1
+    workers_counts = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+
+    print(
+        f"estimate_pi grid of {grid_size} points ({num_samples} samples, {cores} cores)"
+    )
+    serial = time_map(session, grid, "thread", 1)
+    for executor in ["thread", "process"]:
+        for max_workers in workers_counts:
+            duration = time_map(session, grid, executor, max_workers)
+            print(
+                f"  {executor:7} x{max_workers:<3} : {duration * 1e3:9.1f} ms  (speedup x{serial / duration:.2f})"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--grid-size", type=int, default=32)
+    parser.add_argument("--num-samples", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.grid_size, args.num_samples)
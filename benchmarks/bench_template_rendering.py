@@ -0,0 +1,78 @@
+"""Benchmark the rendering of ``itertime_params`` templates on a catalog with hundreds of templated entries.
+
+Compare the kedro boot template engine with the OmegaConf rendering path.
+
+    python benchmarks/bench_template_rendering.py --datasets 500
+"""
+
+import argparse
+import copy
+import timeit
+
+from kedro_datasets.json import JSONDataset
+
+from kedro_boot.framework.renderer.plan import TemplateRenderPlan
+from kedro_boot.framework.renderer.renderer import (
+    recursively_render_parametrized_dataset_template,
+)
+from kedro_boot.framework.renderer.template import (
+    compile_template,
+    render_with_omegaconf,
+)
+
+
+def build_catalog_templates(num_datasets: int) -> dict:
+    return {
+        f"dataset_{i}": JSONDataset(
+            filepath=f"data/${{oc.select:tenant,default}}/dataset_{i}_${{oc.select:eval_date,01_01_1960}}.json"
+        )
+        for i in range(num_datasets)
+    }
+
+
+def legacy_render(catalog_templates: dict, template_args: dict) -> dict:
+    rendered_datasets = {}
+    for dataset_name, dataset_value in catalog_templates.items():
+        rendered_dataset_value = copy.deepcopy(dataset_value)
+        recursively_render_parametrized_dataset_template(
+            rendered_dataset_value, template_args
+        )
+        rendered_datasets[dataset_name] = rendered_dataset_value
+    return rendered_datasets
+
+
+def main(num_datasets: int, repeat: int) -> None:
+    template_args = {"tenant": "acme", "eval_date": "2024_01_01", "run_id": "1234"}
+    catalog_templates = build_catalog_templates(num_datasets)
+    templates = [str(dataset._filepath) for dataset in catalog_templates.values()]
+    template_render_plan = TemplateRenderPlan(catalog_templates)
+
+    def time_it(func) -> float:
+        return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+    omegaconf_strings = time_it(
+        lambda: [render_with_omegaconf(t, template_args) for t in templates]
+    )
+    engine_strings = time_it(
+        lambda: [compile_template(t).render(template_args) for t in templates]
+    )
+    legacy_catalog = time_it(lambda: legacy_render(catalog_templates, template_args))
+    plan_catalog = time_it(lambda: template_render_plan.render(template_args))
+
+    print(f"{num_datasets} templated datasets (best of {repeat})")
+    print(f"  strings  - OmegaConf : {omegaconf_strings:9.3f} ms")
+    print(
+        f"  strings  - engine    : {engine_strings:9.3f} ms  (x{omegaconf_strings / engine_strings:.0f})"
+    )
+    print(f"  catalog  - legacy    : {legacy_catalog:9.3f} ms")
+    print(
+        f"  catalog  - plan      : {plan_catalog:9.3f} ms  (x{legacy_catalog / plan_catalog:.0f})"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--datasets", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.datasets, args.repeat)
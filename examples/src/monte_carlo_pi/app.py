@@ -12,12 +12,10 @@ class MonteCarloApp(AbstractKedroBootApp):
         num_samples = monte_carlo_params["num_samples"]
         radius = monte_carlo_params["radius"]
 
-        distances = []
-        for _ in range(num_samples):
-            distance = kedro_boot_session.run(
-                namespace="simulate_distance", parameters={"radius": radius}
-            )
-            distances.append(distance)
+        distances = kedro_boot_session.run_batch(
+            namespace="simulate_distance",
+            parameters_list=[{"radius": radius}] * num_samples,
+        )
 
         estimated_pi = kedro_boot_session.run(
             namespace="estimate_pi",
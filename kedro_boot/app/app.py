@@ -1,15 +1,16 @@
 """``AbstractKedroBootApp`` is the base class for all kedro boot app implementations.
 """
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, List, Optional
 
 from kedro.config import OmegaConfigLoader
 from kedro.io import DataCatalog
+from kedro.utils import load_obj
 from pluggy import PluginManager
 
 from kedro.pipeline.pipeline import Pipeline
 from kedro_boot.framework.session import KedroBootSession
-from kedro_boot.framework.compiler.specs import CompilationSpec
+from kedro_boot.framework.compiler.specs import CompilationSpec, MaterializationSpec
 
 
 class AbstractKedroBootApp(ABC):
@@ -17,8 +18,15 @@ class AbstractKedroBootApp(ABC):
 
     LAZY_COMPILE = False
 
-    def __init__(self, compilation_specs: List[CompilationSpec] = None) -> None:
+    def __init__(
+        self,
+        compilation_specs: List[CompilationSpec] = None,
+        materialization_spec: MaterializationSpec = None,
+        snapshot_path: Optional[str] = None,
+    ) -> None:
         self._compilation_specs = compilation_specs
+        self._materialization_spec = materialization_spec
+        self._snapshot_path = snapshot_path
 
     def run(
         self,
@@ -28,6 +36,7 @@ class AbstractKedroBootApp(ABC):
         session_id: str,
         app_runtime_params: dict,
         config_loader: OmegaConfigLoader,
+        run_params: Optional[dict] = None,
     ) -> Any:
         """Create a ``KedroBootSession`` then run the kedro boot app
 
@@ -38,6 +47,7 @@ class AbstractKedroBootApp(ABC):
             session_id: The id of the kedro session.
             app_runtime_params (dict): params given by an App specific CLI
             config_loader (OmegaConfigLoader): kedro ``OmegaConfigLoader`` object
+            run_params (dict): ``run_params`` of the kedro run, given to the pipeline hooks of the iterations
 
         Returns:
             Any: the return value of the kedro boot app run method
@@ -52,13 +62,34 @@ class AbstractKedroBootApp(ABC):
             session_id=session_id,
             app_runtime_params=app_runtime_params,
             config_loader=config_loader,
+            run_params=run_params,
         )
 
         if not self.LAZY_COMPILE:
-            session.compile(compilation_specs=self._compilation_specs)
+            session.compile(
+                compilation_specs=self._compilation_specs,
+                materialization_spec=self._materialization_spec,
+                snapshot_path=self._snapshot_path,
+            )
 
         return self._run(session)
 
+    def compile(
+        self, session: KedroBootSession, snapshot_path: Optional[str] = None
+    ) -> None:
+        """Compile the catalog of a session with the specs the app would build at start, without starting the artifacts background tasks. Used by the compile command to write the snapshot loaded by the app.
+
+        Args:
+            session (KedroBootSession): kedro boot session
+            snapshot_path (str): Compiled snapshot file. Default to None, the snapshot path of the app
+        """
+        session.compile(
+            compilation_specs=self._compilation_specs,
+            materialization_spec=self._materialization_spec,
+            snapshot_path=snapshot_path or self._snapshot_path,
+            start_background_tasks=False,
+        )
+
     @abstractmethod
     def _run(self, session: KedroBootSession) -> Any:
         """The abstract interface for running kedro boot apps, assuming that the
@@ -71,10 +102,24 @@ class AbstractKedroBootApp(ABC):
 
 
 class CompileApp(AbstractKedroBootApp):
-    """An App used to perform Dry Run."""
+    """An App used to perform Dry Run. With a snapshot path, the compiled catalog is written in a snapshot loaded by the next apps starts. With a target app, the catalog is compiled with the specs of the target app, so the snapshot matches them."""
+
+    LAZY_COMPILE = True
 
     def _run(self, session: KedroBootSession) -> Any:
-        pass
+        snapshot_path = self._snapshot_path or session.app_runtime_params.get(
+            "snapshot_path"
+        )
+        target_app_class = session.app_runtime_params.get("app")
+        if target_app_class:
+            target_app = load_obj(target_app_class)()
+            if not isinstance(target_app, AbstractKedroBootApp):
+                raise TypeError(
+                    f"The compiled app must be a subclass of AbstractKedroBootApp, got {type(target_app).__name__}"
+                )
+            target_app.compile(session, snapshot_path)
+        else:
+            self.compile(session, snapshot_path)
 
 
 class BooterApp(AbstractKedroBootApp):
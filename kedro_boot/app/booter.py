@@ -17,6 +17,7 @@ def boot_project(
     project_path: Optional[Union[Path, str, None]] = None,
     kedro_args: dict = None,
     compilation_specs: List[CompilationSpec] = None,
+    snapshot_path: Optional[str] = None,
 ) -> KedroBootSession:
     project_path = project_path or Path(project_path or Path.cwd()).resolve()
 
@@ -28,6 +29,7 @@ def boot_project(
         kedro_session_create_args=kedro_session_create_args,
         kedro_args=kedro_args,
         compilation_specs=compilation_specs,
+        snapshot_path=snapshot_path,
     )
 
 
@@ -35,16 +37,22 @@ def boot_package(
     package_name: Optional[str],
     kedro_args: dict = None,
     compilation_specs: List[CompilationSpec] = None,
+    snapshot_path: Optional[str] = None,
 ) -> KedroBootSession:
     configure_project(package_name)
 
-    return boot_session(kedro_args=kedro_args, compilation_specs=compilation_specs)
+    return boot_session(
+        kedro_args=kedro_args,
+        compilation_specs=compilation_specs,
+        snapshot_path=snapshot_path,
+    )
 
 
 def boot_session(
     kedro_session_create_args: dict = None,
     kedro_args: dict = None,
     compilation_specs: List[CompilationSpec] = None,
+    snapshot_path: Optional[str] = None,
 ):
     kedro_session_create_args = kedro_session_create_args or {}
     kedro_session_create_args["save_on_close"] = False
@@ -54,7 +62,10 @@ def boot_session(
     kedro_booter = create_kedro_booter(
         kedro_session_create_args=kedro_session_create_args,
         app_class=BooterApp,
-        app_args={"compilation_specs": compilation_specs},
+        app_args={
+            "compilation_specs": compilation_specs,
+            "snapshot_path": snapshot_path,
+        },
     )
 
     return kedro_booter(**kedro_args)
@@ -5,6 +5,8 @@ from kedro.config import MissingConfigException
 from kedro.utils import load_obj
 
 from kedro_boot.app import AbstractKedroBootApp
+from kedro_boot.framework.compiler.specs import MaterializationSpec
+from kedro_boot.utils import freeze_heap_before_fork
 from kedro_boot.framework.session import KedroBootSession
 
 LOGGER = logging.getLogger(__name__)
@@ -30,32 +32,61 @@ class FastApiApp(AbstractKedroBootApp):
 
         return server_options
 
-    def _run(self, kedro_boot_session: KedroBootSession):
-        try:
-            import uvicorn
-            from pyctuator.pyctuator import Pyctuator
-            from kedro_boot.app.fastapi.session import (
-                KedroFastApiSession,
-                kedro_fastapi_session,
-            )
-        except (ImportError, ModuleNotFoundError) as e:
-            raise FastApiAppException(
-                f"{e.msg}. If you're using the Kedro FastAPI Server, you should consider installing fastapi extra dependencies 'pip install kedro-boot[fastapi]'"
-            )
-
+    def get_fastapi_config(self, kedro_boot_session: KedroBootSession) -> dict:
         kedro_boot_session.config_loader.config_patterns.update(
             {"fastapi": ["fastapi*/"]}
         )
 
         try:
-            server_file_options = kedro_boot_session.config_loader["fastapi"].get(
-                "server", {}
-            )
+            return kedro_boot_session.config_loader["fastapi"]
         except MissingConfigException:
             LOGGER.warning(
                 "No 'fastapi.yml' nor 'fastapi.yaml' config file found in environment. Default configuration will be used"
             )
-            server_file_options = {}
+            return {}
+
+    def create_fastapi_session(
+        self,
+        kedro_boot_session: KedroBootSession,
+        fastapi_config: dict,
+        snapshot_path: str = None,
+    ):
+        from kedro_boot.app.fastapi.session import KedroFastApiSession
+
+        return KedroFastApiSession(
+            kedro_boot_session,
+            runners=fastapi_config.get("runners", {}),
+            hook_modes=fastapi_config.get("hook_modes", {}),
+            iterations=fastapi_config.get("iterations", {}),
+            batching=fastapi_config.get("batching", {}),
+            materialization_spec=self._materialization_spec
+            or MaterializationSpec(**fastapi_config.get("artifacts", {})),
+            snapshot_path=snapshot_path
+            or self._snapshot_path
+            or fastapi_config.get("snapshot_path"),
+        )
+
+    def compile(self, kedro_boot_session: KedroBootSession, snapshot_path: str = None):
+        """Compile the catalog with the specs of the fastapi app routes, as the app does at start. The fastapi app is the one of the 'server.app' config, the starter runner app by default."""
+        fastapi_config = self.get_fastapi_config(kedro_boot_session)
+        app = self.load_app(fastapi_config.get("server", {}).get("app"))
+        self.create_fastapi_session(
+            kedro_boot_session, fastapi_config, snapshot_path
+        ).compile(app, start_background_tasks=False)
+
+    def _run(self, kedro_boot_session: KedroBootSession):
+        try:
+            import uvicorn
+            from pyctuator.pyctuator import Pyctuator
+            from kedro_boot.app.fastapi.health import ArtifactsHealthProvider
+            from kedro_boot.app.fastapi.session import kedro_fastapi_session
+        except (ImportError, ModuleNotFoundError) as e:
+            raise FastApiAppException(
+                f"{e.msg}. If you're using the Kedro FastAPI Server, you should consider installing fastapi extra dependencies 'pip install kedro-boot[fastapi]'"
+            )
+
+        fastapi_config = self.get_fastapi_config(kedro_boot_session)
+        server_file_options = fastapi_config.get("server", {})
 
         configs = self.get_configs(
             server_cli_options=kedro_boot_session.app_runtime_params,
@@ -63,13 +94,14 @@ class FastApiApp(AbstractKedroBootApp):
         )
         app = self.load_app(configs.pop("app", None))
 
-        Pyctuator(
+        pyctuator = Pyctuator(
             app,
             "Kedro FastAPI Pyctuator",
             app_url=None,
             pyctuator_endpoint_url="/actuator",
             registration_url=None,
         )
+        pyctuator.register_health_provider(ArtifactsHealthProvider(kedro_boot_session))
 
         if platform.system().lower() == "windows":
             LOGGER.info(
@@ -86,7 +118,9 @@ class FastApiApp(AbstractKedroBootApp):
             if configs.get("extra_uvicorn"):
                 configs.pop("extra_uvicorn")
 
-            kedro_fastapi_materialized_session = KedroFastApiSession(kedro_boot_session)
+            kedro_fastapi_materialized_session = self.create_fastapi_session(
+                kedro_boot_session, fastapi_config
+            )
             kedro_fastapi_materialized_session.compile(app)
             app.dependency_overrides[
                 kedro_fastapi_session
@@ -110,9 +144,22 @@ class FastApiApp(AbstractKedroBootApp):
             if configs.get("port"):
                 configs.pop("port")
 
-            app.dependency_overrides[kedro_fastapi_session] = KedroFastApiSession(
-                kedro_boot_session
+            kedro_fastapi_materialized_session = self.create_fastapi_session(
+                kedro_boot_session, fastapi_config
             )
+            app.dependency_overrides[
+                kedro_fastapi_session
+            ] = kedro_fastapi_materialized_session
+
+            if configs.get("preload_app"):
+                # Compile the catalog and materialize the artifacts once in the master, the forked workers share them copy-on-write. The artifacts threads are started in the workers
+                LOGGER.info(
+                    "Preload mode: compiling the catalog in the gunicorn master before forking the workers"
+                )
+                kedro_fastapi_materialized_session.compile(
+                    app, start_background_tasks=False
+                )
+                freeze_heap_before_fork()
 
             GunicornApp(app, configs).run()
 
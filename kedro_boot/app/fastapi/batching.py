@@ -0,0 +1,193 @@
+"""Micro-batching of the concurrent requests of a FastAPI route into one pipeline run"""
+
+import asyncio
+import logging
+import sys
+import typing
+
+LOGGER = logging.getLogger(__name__)
+
+RunBatch = typing.Callable[
+    [typing.List[dict], dict, dict], typing.Awaitable[typing.Any]
+]
+
+
+class MicroBatcher:
+    """``MicroBatcher`` collect the records of the concurrent requests of a route, and run them as one pipeline iteration.
+
+    A batch is run when it reaches ``max_batch_size`` records, or ``max_wait_ms`` after its first request. Only the requests sharing the same query and path params are batched together.
+    The rows of the iteration outputs are split back to each request, following the number of records it sent.
+    """
+
+    def __init__(
+        self,
+        run_batch: RunBatch,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        """Init the ``MicroBatcher``.
+
+        Args:
+            run_batch (RunBatch): coroutine function running an iteration with the batch records, parameters and itertime params
+            max_batch_size (int): maximum number of records of a batch
+            max_wait_ms (float): maximum time a request waits for the batch to fill up, in milliseconds
+        """
+        if max_batch_size < 1:
+            raise MicroBatcherError(
+                f"max_batch_size should be a positive integer, {max_batch_size} given instead"
+            )
+        if max_wait_ms < 0:
+            raise MicroBatcherError(
+                f"max_wait_ms should be a positive number, {max_wait_ms} given instead"
+            )
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        # Pending batches indexed by their parameters and itertime params. Only accessed from the event loop thread
+        self._batches: typing.Dict[typing.Any, "_Batch"] = {}
+        # Running batches. The event loop only keeps weak references to its tasks
+        self._tasks: typing.Set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        records: typing.Union[dict, typing.List[dict]],
+        parameters: typing.Optional[dict] = None,
+        itertime_params: typing.Optional[dict] = None,
+    ) -> typing.Any:
+        """Add the records of a request to a batch, and wait for its rows of the batch outputs.
+
+        Args:
+            records (Union[dict, List[dict]]): a record or a list of records
+            parameters (dict): request parameters
+            itertime_params (dict): request itertime params
+
+        Returns:
+            Any: the outputs rows of the request records
+        """
+        parameters = parameters or {}
+        itertime_params = itertime_params or {}
+        records = [records] if isinstance(records, dict) else list(records)
+
+        batch_key = (
+            tuple(sorted(parameters.items())),
+            tuple(sorted(itertime_params.items())),
+        )
+        batch = self._batches.get(batch_key)
+        if batch is None or batch.size + len(records) > self.max_batch_size:
+            if batch is not None:
+                self._flush(batch_key)
+            batch = _Batch(parameters, itertime_params)
+            self._batches[batch_key] = batch
+            batch.timer = asyncio.get_running_loop().call_later(
+                self.max_wait_ms / 1000, self._flush, batch_key, batch
+            )
+
+        future = batch.add(records)
+        if batch.size >= self.max_batch_size:
+            self._flush(batch_key)
+
+        return await future
+
+    def _flush(self, batch_key: typing.Any, batch: "_Batch" = None) -> None:
+        # A timer may fire after its batch was flushed by a full batch
+        if batch is not None and self._batches.get(batch_key) is not batch:
+            return
+        batch = self._batches.pop(batch_key)
+        batch.timer.cancel()
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """Run the pending batches without waiting for their window to close, then wait for all the running batches."""
+        for batch_key in list(self._batches):
+            self._flush(batch_key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, batch: "_Batch") -> None:
+        try:
+            outputs = await self.run_batch(
+                batch.records, batch.parameters, batch.itertime_params
+            )
+            outputs_rows = split_rows(outputs, batch.offsets)
+        except Exception as exc:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        LOGGER.debug(
+            f"Ran a batch of {batch.size} records from {len(batch.futures)} requests"
+        )
+        for future, rows in zip(batch.futures, outputs_rows):
+            if not future.done():
+                future.set_result(rows)
+
+
+class _Batch:
+    def __init__(self, parameters: dict, itertime_params: dict) -> None:
+        self.parameters = parameters
+        self.itertime_params = itertime_params
+        self.records = []
+        self.offsets = [0]
+        self.futures = []
+        self.timer = None
+
+    @property
+    def size(self) -> int:
+        return len(self.records)
+
+    def add(self, records: typing.List[dict]) -> asyncio.Future:
+        self.records.extend(records)
+        self.offsets.append(len(self.records))
+        future = asyncio.get_running_loop().create_future()
+        self.futures.append(future)
+        return future
+
+
+def split_rows(data: typing.Any, offsets: typing.List[int]) -> typing.List[typing.Any]:
+    """Split the rows of a batch output, following the offsets of each request records.
+
+    Args:
+        data (Any): batch output. A list, a tuple, a numpy array, a pandas DataFrame or Series, or a dict of them (ex: multiple outputs)
+        offsets (List[int]): start offset of each request records, followed by the batch size
+
+    Returns:
+        List[Any]: outputs rows of each request
+    """
+    if isinstance(data, dict):
+        splitted_values = {
+            key: split_rows(value, offsets) for key, value in data.items()
+        }
+        return [
+            {key: values[index] for key, values in splitted_values.items()}
+            for index in range(len(offsets) - 1)
+        ]
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(data, (pd.DataFrame, pd.Series)):
+        check_rows_number(data, offsets)
+        return [
+            data.iloc[start:end].reset_index(drop=True)
+            for start, end in zip(offsets, offsets[1:])
+        ]
+
+    if isinstance(data, (str, bytes)) or not hasattr(data, "__getitem__"):
+        raise MicroBatcherError(
+            f"The batch output of type {type(data).__name__} cannot be split into rows. Batched routes should return one row per input record"
+        )
+
+    check_rows_number(data, offsets)
+    return [data[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+def check_rows_number(data: typing.Any, offsets: typing.List[int]) -> None:
+    if len(data) != offsets[-1]:
+        raise MicroBatcherError(
+            f"The batch output has {len(data)} rows for {offsets[-1]} input records. Batched routes should return one row per input record"
+        )
+
+
+class MicroBatcherError(Exception):
+    """Error raised in micro-batching operations"""
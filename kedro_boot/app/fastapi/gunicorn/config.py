@@ -8,7 +8,13 @@ LOGGER = logging.getLogger(__name__)
 
 def post_worker_init(worker):
     fastapi_app = worker.app.wsgi()
-    fastapi_app.dependency_overrides[kedro_fastapi_session].compile(fastapi_app)
+    fastapi_session = fastapi_app.dependency_overrides[kedro_fastapi_session]
+    # In preload mode, the catalog is compiled by the master before forking the workers
+    if not fastapi_session.is_compiled:
+        fastapi_session.compile(fastapi_app)
+    else:
+        # The master deferred the artifacts threads, as they would not survive the fork
+        fastapi_session.start_background_tasks()
     LOGGER.info(
         "Kedro Boot Catalog compilation is completed. Ready to serve your app !"
     )
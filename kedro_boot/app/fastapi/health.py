@@ -0,0 +1,44 @@
+"""Pyctuator health provider of the kedro boot session artifacts, so the readiness probes wait for the lazy artifacts"""
+
+from dataclasses import dataclass
+from typing import Dict
+
+from pyctuator.health.health_provider import (
+    HealthDetails,
+    HealthProvider,
+    HealthStatus,
+    Status,
+)
+
+from kedro_boot.framework.session import KedroBootSession
+
+
+@dataclass
+class ArtifactsHealthDetails(HealthDetails):
+    loaded_artifacts: int
+    artifacts: int
+    failed_artifacts: Dict[str, str]
+
+
+class ArtifactsHealthProvider(HealthProvider):
+    """``ArtifactsHealthProvider`` report the artifacts as UP once the session is ready, following its readiness mode, and DOWN while the required lazy artifacts are loading, with the load errors of the failed ones"""
+
+    def __init__(self, session: KedroBootSession) -> None:
+        self.session = session
+
+    def is_supported(self) -> bool:
+        return True
+
+    def get_name(self) -> str:
+        return "artifacts"
+
+    def get_health(self) -> HealthStatus:
+        readiness = self.session.get_artifacts_readiness()
+        return HealthStatus(
+            status=Status.UP if readiness.ready else Status.DOWN,
+            details=ArtifactsHealthDetails(
+                loaded_artifacts=readiness.loaded_artifacts,
+                artifacts=readiness.artifacts,
+                failed_artifacts=readiness.failed_artifacts,
+            ),
+        )
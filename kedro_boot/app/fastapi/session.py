@@ -1,3 +1,6 @@
+import asyncio
+import contextlib
+import functools
 import inspect
 import logging
 import threading
@@ -12,15 +15,50 @@ except ImportError:
 
 from fastapi import Depends, FastAPI, Request
 
-from kedro_boot.framework.compiler.specs import CompilationSpec
+from kedro_boot.app.fastapi.batching import MicroBatcher
+from kedro_boot.framework.compiler.specs import CompilationSpec, MaterializationSpec
+from kedro_boot.framework.renderer.converters import TypedRecords, is_records
 from kedro_boot.framework.session import KedroBootSession
 
 LOGGER = logging.getLogger(__name__)
 
+FIELDS_DTYPES = {int: "int64", float: "float64", bool: "bool"}
+
 
 class KedroFastApiSession:
-    def __init__(self, session: KedroBootSession = None) -> None:
+    def __init__(
+        self,
+        session: KedroBootSession = None,
+        runners: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        hook_modes: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        iterations: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        batching: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        materialization_spec: typing.Optional[MaterializationSpec] = None,
+        snapshot_path: typing.Optional[str] = None,
+    ) -> None:
+        """Init the ``KedroFastApiSession``.
+
+        Args:
+            session (KedroBootSession): kedro boot session
+            runners (Dict[str, Any]): runners of the routes, indexed by operation id or 'default' for all the routes. A runner is given by its name, or by a dict with 'runner' and 'workers' keys. Ex: {"default": "compiled", "evaluate": {"runner": "thread", "workers": 4}}
+            hook_modes (Dict[str, Any]): hook modes of the routes, indexed by operation id or 'default' for all the routes. A hook mode is given by its name, or by a dict with 'mode' and 'sampling' keys. Ex: {"default": "off", "predict": {"mode": "sampled", "sampling": 1000}}
+            iterations (Dict[str, Any]): iteration executor config. 'max_workers' bound the number of concurrent pipeline runs of the server worker. Ex: {"max_workers": 8}
+            batching (Dict[str, Any]): micro-batching of the routes concurrent requests, indexed by operation id. A batch window is given by 'max_batch_size' and 'max_wait_ms' keys. Ex: {"predict": {"max_batch_size": 64, "max_wait_ms": 5}}
+            materialization_spec (MaterializationSpec): How the artifacts datasets are materialized.
+            snapshot_path (str): Compiled snapshot file, loaded instead of compiling the catalog while the pipeline, the catalog and the artifacts files are unchanged.
+        """
         self.session = session
+        self.runners = runners or {}
+        self.hook_modes = hook_modes or {}
+        self.iterations = iterations or {}
+        self.batching = batching or {}
+        self.materialization_spec = materialization_spec
+        self.snapshot_path = snapshot_path
+        # Compiled routes, indexed by operation id: pipeline inputs/outputs and the dtypes of the inputs data models
+        self._routes_plans = {}
+        # Micro-batchers of the batched routes, indexed by operation id
+        self._batchers = {}
+        self.is_compiled = False
 
     async def __call__(self, request: Request):
         itertime_params = request.path_params
@@ -28,25 +66,22 @@ class KedroFastApiSession:
         namespace = request.scope["route"].operation_id
         datasets = {}
 
-        # TODO: We should get pipeline inputs and outputs from KedroFastApi session instead of KedroBootSession. We should persist it after compilation.
-
-        pipeline_inputs = (
-            self.session._context._namespaces_registry.get(namespace).get("spec").inputs
-        )
+        route_plan = self._routes_plans.get(namespace)
+        pipeline_inputs = route_plan["inputs"]
 
         if pipeline_inputs:
             datasets = await request.json()
+            batcher = self._batchers.get(namespace)
+            if batcher and is_records(datasets):
+                return await batcher.submit(datasets, parameters, itertime_params)
             if len(pipeline_inputs) == 1:
                 datasets = {pipeline_inputs[0]: datasets}
+            datasets = type_input_datasets(datasets, route_plan["inputs_dtypes"])
 
         run_id = uuid.uuid4().hex
         itertime_params.update({"run_id": run_id})
 
-        pipeline_outputs = (
-            self.session._context._namespaces_registry.get(namespace)
-            .get("spec")
-            .namespaced_outputs
-        )
+        pipeline_outputs = route_plan["outputs"]
         if (
             inspect.iscoroutinefunction(request.scope["endpoint"])
             and not pipeline_outputs
@@ -67,7 +102,8 @@ class KedroFastApiSession:
                 },
             }
 
-        return self.session.run(
+        # The iteration runs on the session iteration executor, so the event loop keeps serving the other requests
+        return await self.session.arun(
             namespace=namespace,
             inputs=datasets,
             parameters=parameters,
@@ -75,7 +111,28 @@ class KedroFastApiSession:
             run_id=run_id,
         )
 
-    def compile(self, app: FastAPI) -> None:
+    async def run_records_batch(
+        self,
+        namespace: str,
+        records: typing.List[dict],
+        parameters: dict,
+        itertime_params: dict,
+    ) -> typing.Any:
+        """Run an iteration of a batched route with the records of a batch of requests"""
+        route_plan = self._routes_plans.get(namespace)
+        datasets = type_input_datasets(
+            {route_plan["inputs"][0]: records}, route_plan["inputs_dtypes"]
+        )
+        run_id = uuid.uuid4().hex
+        return await self.session.arun(
+            namespace=namespace,
+            inputs=datasets,
+            parameters=parameters,
+            itertime_params={**itertime_params, "run_id": run_id},
+            run_id=run_id,
+        )
+
+    def compile(self, app: FastAPI, start_background_tasks: bool = True) -> None:
         compilation_specs = []
 
         for route in app.routes:
@@ -92,6 +149,7 @@ class KedroFastApiSession:
                     compilation_specs_inputs = []
                     compilation_specs_outputs = []
                     compilation_specs_parameters = []
+                    inputs_dtypes = {}
 
                     query_params = extract_query_params_from_endpoint(
                         app, route.path, list(route.methods)
@@ -125,6 +183,10 @@ class KedroFastApiSession:
 
                         elif managed_type.__class__.__name__ == "ModelMetaclass":
                             compilation_specs_inputs.append(param_name)
+                            if managed_type is not param_type:
+                                inputs_dtypes[param_name] = extract_model_dtypes(
+                                    managed_type
+                                )
 
                     if (
                         inspect.iscoroutinefunction(route.endpoint)
@@ -139,17 +201,80 @@ class KedroFastApiSession:
                     if len(route.endpoint.__annotations__) == 1:
                         infer_artifacts = False
 
-                    compilation_specs.append(
-                        CompilationSpec(
-                            namespace=route.operation_id,
-                            inputs=compilation_specs_inputs,
-                            outputs=compilation_specs_outputs,
-                            parameters=compilation_specs_parameters,
-                            infer_artifacts=infer_artifacts,
-                        )
+                    compilation_spec = CompilationSpec(
+                        namespace=route.operation_id,
+                        inputs=compilation_specs_inputs,
+                        outputs=compilation_specs_outputs,
+                        parameters=compilation_specs_parameters,
+                        infer_artifacts=infer_artifacts,
+                        **resolve_route_runner(self.runners, route.operation_id),
+                        **resolve_route_hook_mode(self.hook_modes, route.operation_id),
+                    )
+                    compilation_specs.append(compilation_spec)
+
+                    self._routes_plans[route.operation_id] = dict(
+                        inputs=compilation_spec.inputs,
+                        outputs=compilation_spec.namespaced_outputs,
+                        inputs_dtypes=inputs_dtypes,
                     )
 
-        self.session.compile(compilation_specs=compilation_specs)
+        self.session.compile(
+            compilation_specs=compilation_specs,
+            materialization_spec=self.materialization_spec,
+            snapshot_path=self.snapshot_path,
+            start_background_tasks=start_background_tasks,
+        )
+        self.compile_batchers()
+        if self._batchers:
+            self.close_on_shutdown(app)
+        if self.iterations.get("max_workers"):
+            self.session.set_iteration_executor(
+                max_workers=self.iterations["max_workers"]
+            )
+        self.is_compiled = True
+
+    def start_background_tasks(self) -> None:
+        self.session.start_artifacts_background_tasks()
+
+    async def close(self) -> None:
+        """Run the pending batches of the batched routes and wait for their running batches"""
+        await asyncio.gather(*(batcher.close() for batcher in self._batchers.values()))
+
+    def close_on_shutdown(self, app: FastAPI) -> None:
+        """Close the session at the app shutdown, after the app own lifespan"""
+        app_lifespan = app.router.lifespan_context
+
+        @contextlib.asynccontextmanager
+        async def lifespan(app: FastAPI) -> typing.AsyncIterator[typing.Any]:
+            async with app_lifespan(app) as state:
+                yield state
+            await self.close()
+
+        app.router.lifespan_context = lifespan
+
+    def compile_batchers(self) -> None:
+        for operation_id, batch_window in self.batching.items():
+            route_plan = self._routes_plans.get(operation_id)
+            if route_plan is None:
+                raise KedroFastApiSessionError(
+                    f"The batched route '{operation_id}' does not match any of the routes operation ids {list(self._routes_plans)}"
+                )
+            if len(route_plan["inputs"]) != 1 or not route_plan["outputs"]:
+                raise KedroFastApiSessionError(
+                    f"Only the routes with one input data model and an output data model can be batched. The '{operation_id}' route has {route_plan['inputs']} inputs and {route_plan['outputs']} outputs"
+                )
+            unknown_keys = set(batch_window) - {"max_batch_size", "max_wait_ms"}
+            if unknown_keys:
+                raise KedroFastApiSessionError(
+                    f"Unknown {unknown_keys} keys in the '{operation_id}' batching config. A batch window is configured with 'max_batch_size' and 'max_wait_ms' keys"
+                )
+            self._batchers[operation_id] = MicroBatcher(
+                functools.partial(self.run_records_batch, operation_id),
+                **batch_window,
+            )
+            LOGGER.info(
+                f"The concurrent requests of the '{operation_id}' route are micro-batched: {batch_window}"
+            )
 
 
 kedro_fastapi_session = KedroFastApiSession()
@@ -160,6 +285,106 @@ class KedroFastApiSessionError(Exception):
     """Error raised in catalog rendering operations"""
 
 
+def extract_model_dtypes(model: typing.Any) -> typing.Dict[str, str]:
+    """Map the fields of a Pydantic model to the numpy dtypes of their columns. Fields with no exact numpy dtype are left out, their dtype is inferred by the input converters.
+
+    Args:
+        model (Any): Pydantic model (v1 or v2)
+
+    Returns:
+        Dict[str, str]: numpy dtypes indexed by the field JSON name
+    """
+    if hasattr(model, "model_fields"):
+        fields = {
+            field.alias or field_name: field.annotation
+            for field_name, field in model.model_fields.items()
+        }
+    else:
+        fields = {
+            field.alias: field.outer_type_
+            if field.required
+            else typing.Optional[field.outer_type_]
+            for field in model.__fields__.values()
+        }
+
+    dtypes = {}
+    for field_name, field_type in fields.items():
+        if field_type in FIELDS_DTYPES:
+            dtypes[field_name] = FIELDS_DTYPES[field_type]
+        # Missing float values can be stored as NaN
+        elif field_type == typing.Optional[float]:
+            dtypes[field_name] = "float64"
+    return dtypes
+
+
+def resolve_route_runner(
+    runners: typing.Dict[str, typing.Any], operation_id: str
+) -> typing.Dict[str, typing.Any]:
+    """Get the runner of a route from the runners config, falling back to the 'default' runner.
+
+    Args:
+        runners (Dict[str, Any]): runners indexed by operation id or 'default'
+        operation_id (str): route operation id
+
+    Returns:
+        Dict[str, Any]: runner and runner_workers compilation spec args
+    """
+    runner = runners.get(operation_id, runners.get("default"))
+    if runner is None:
+        return {}
+    if isinstance(runner, str):
+        return dict(runner=runner)
+    unknown_keys = set(runner) - {"runner", "workers"}
+    if unknown_keys:
+        raise KedroFastApiSessionError(
+            f"Unknown {unknown_keys} keys in the '{operation_id}' runner config. A runner is configured with 'runner' and 'workers' keys"
+        )
+    return dict(runner=runner.get("runner"), runner_workers=runner.get("workers"))
+
+
+def resolve_route_hook_mode(
+    hook_modes: typing.Dict[str, typing.Any], operation_id: str
+) -> typing.Dict[str, typing.Any]:
+    """Get the hook mode of a route from the hook modes config, falling back to the 'default' hook mode.
+
+    Args:
+        hook_modes (Dict[str, Any]): hook modes indexed by operation id or 'default'
+        operation_id (str): route operation id
+
+    Returns:
+        Dict[str, Any]: hook_mode and hook_sampling compilation spec args
+    """
+    hook_mode = hook_modes.get(operation_id, hook_modes.get("default"))
+    if hook_mode is None:
+        return {}
+    if isinstance(hook_mode, str):
+        return dict(hook_mode=hook_mode)
+    unknown_keys = set(hook_mode) - {"mode", "sampling"}
+    if unknown_keys:
+        raise KedroFastApiSessionError(
+            f"Unknown {unknown_keys} keys in the '{operation_id}' hook mode config. A hook mode is configured with 'mode' and 'sampling' keys"
+        )
+    hook_mode_args = dict(hook_mode=hook_mode.get("mode", "full"))
+    if "sampling" in hook_mode:
+        hook_mode_args["hook_sampling"] = hook_mode["sampling"]
+    return hook_mode_args
+
+
+def type_input_datasets(
+    datasets: typing.Dict[str, typing.Any],
+    inputs_dtypes: typing.Dict[str, typing.Dict[str, str]],
+) -> typing.Dict[str, typing.Any]:
+    """Attach the dtypes of the route data models to the lists of records of the request body"""
+    return {
+        dataset_name: TypedRecords(dataset_value, inputs_dtypes[dataset_name])
+        if inputs_dtypes.get(dataset_name)
+        and is_records(dataset_value)
+        and isinstance(dataset_value, list)
+        else dataset_value
+        for dataset_name, dataset_value in datasets.items()
+    }
+
+
 def extract_query_params_from_endpoint(
     app: FastAPI, path: str, methods: typing.List[str]
 ):
@@ -23,6 +23,7 @@ class KedroBootAdapter(AbstractRunner):
         app: AbstractKedroBootApp,
         config_loader: OmegaConfigLoader,
         app_runtime_params: Optional[dict] = None,
+        run_params: Optional[dict] = None,
     ):
         """Instantiate the kedro boot adapter
 
@@ -30,6 +31,7 @@ class KedroBootAdapter(AbstractRunner):
             app (AbstractKedroBootApp): Kedro Boot App object
             config_loader (OmegaConfigLoader): kedro config loader
             app_run_args (dict): App runtime args given by App CLI
+            run_params (dict): ``run_params`` of the kedro run, given to the pipeline hooks of the app iterations
         """
 
         self._extra_dataset_patterns = {"{default}": {"type": "MemoryDataset"}}
@@ -38,6 +40,7 @@ class KedroBootAdapter(AbstractRunner):
         self._app = app
         self._config_loader = config_loader
         self._app_runtime_params = app_runtime_params or {}
+        self._run_params = run_params
 
     def _get_executor(self, max_workers: int) -> Executor:
         """Abstract method to provide the correct executor (e.g., ThreadPoolExecutor or ProcessPoolExecutor)."""
@@ -87,6 +90,7 @@ class KedroBootAdapter(AbstractRunner):
             session_id,
             self._app_runtime_params,
             self._config_loader,
+            self._run_params,
         )
         self._logger.info(f"{self._app.__class__.__name__} execution completed.")
         return app_return
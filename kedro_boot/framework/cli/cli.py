@@ -14,6 +14,20 @@ compile_command = kedro_boot_command_factory(
     command_name="compile",
     command_help="Compile the catalog (Dryrun)",
     app_class="kedro_boot.app.CompileApp",
+    command_params=[
+        click.option(
+            "--snapshot-path",
+            type=str,
+            default=None,
+            help="Write the compiled catalog in a snapshot file, loaded by the next apps starts while the pipeline, the catalog and the artifacts files are unchanged",
+        ),
+        click.option(
+            "--app",
+            type=str,
+            default=None,
+            help="Kedro Boot App Class whose compilation specs are used, so the snapshot is loaded by this app. ex: kedro_boot.app.fastapi.app.FastApiApp",
+        ),
+    ],
 )
 
 # Get entry points commands early to prevent getting them repeatedly inside KedroClickGroup
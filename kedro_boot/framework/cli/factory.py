@@ -6,6 +6,7 @@ from typing import Any, Callable, List, Optional, Union
 import click
 from click import Command
 from click.decorators import FC
+from kedro import __version__ as kedro_version
 from kedro.framework.cli.project import run as kedro_run_command
 from kedro.framework.session import KedroSession
 from kedro.utils import load_obj
@@ -73,11 +74,31 @@ def create_kedro_booter(
             **kedro_session_create_args,  # TODO: Make sure that this not take precedence over kedro_args. We should do some prior merging before kwarging
         ) as session:
             config_loader = session._get_config_loader()
+            run_args = dict(
+                tags=tuple_tags,
+                node_names=tuple_node_names,
+                from_nodes=kedro_args.get("from_nodes", ""),
+                to_nodes=kedro_args.get("to_nodes", ""),
+                from_inputs=kedro_args.get("from_inputs", ""),
+                to_outputs=kedro_args.get("to_outputs", ""),
+                load_versions=kedro_args.get("load_versions", {}),
+                pipeline_name=kedro_args.get("pipeline", ""),
+                namespace=kedro_args.get("namespace", ""),
+            )
             if app:
+                # The app iterations give the pipeline hooks the run_params of this kedro run
                 runner = KedroBootAdapter(
                     app=app,
                     config_loader=config_loader,
                     app_runtime_params=app_run_args,
+                    run_params=dict(
+                        run_args,
+                        session_id=session.session_id,
+                        project_path=session._project_path.as_posix(),
+                        env=session.store.get("env"),
+                        kedro_version=kedro_version,
+                        extra_params=session.store.get("extra_params"),
+                    ),
                 )
             else:
                 runner_obj = load_obj(
@@ -85,18 +106,7 @@ def create_kedro_booter(
                 )
                 runner = runner_obj(is_async=kedro_args.get("is_async", ""))
 
-            return session.run(
-                tags=tuple_tags,
-                runner=runner,
-                node_names=tuple_node_names,
-                from_nodes=kedro_args.get("from_nodes", ""),
-                to_nodes=kedro_args.get("to_nodes", ""),
-                from_inputs=kedro_args.get("from_inputs", ""),
-                to_outputs=kedro_args.get("to_outputs", ""),
-                load_versions=kedro_args.get("load_versions", {}),
-                pipeline_name=kedro_args.get("pipeline", ""),
-                namespace=kedro_args.get("namespace", ""),
-            )
+            return session.run(runner=runner, **run_args)
 
     return kedro_booter
 
@@ -2,11 +2,14 @@
 
 import logging
 from pathlib import PurePath
-from typing import Any, Dict, Optional, Union
-from omegaconf import OmegaConf
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 from kedro.io import AbstractDataset
+from kedro.pipeline import Pipeline
 
-from .specs import CompilationSpec
+from kedro_boot.framework.renderer.plan import DATA_HOLDING_DATASETS, DatasetSlot
+from kedro_boot.framework.renderer.template import is_template
+
+from .specs import IO_BOUND_TAG, CompilationSpec
 
 LOGGER = logging.getLogger(__name__)
 
@@ -139,6 +142,104 @@ def compile_with_all_pipeline_outputs(
     return catalog_assembly
 
 
+def compile_base_datasets(catalog_assembly: CatalogAssembly) -> Dict[str, Any]:
+    """Select the datasets of a CatalogAssembly that can be shared by all the iterations: artifacts, parameters and stateless unmanaged datasets.
+
+    Args:
+        catalog_assembly (CatalogAssembly): compiled catalog assembly
+    """
+    return {
+        **catalog_assembly.parameters,
+        **catalog_assembly.artifacts,
+        **{
+            dataset_name: dataset_value
+            for dataset_name, dataset_value in catalog_assembly.unmanaged.items()
+            if not is_stateful_dataset(dataset_value)
+        },
+    }
+
+
+def compile_slot_datasets(catalog_assembly: CatalogAssembly) -> Dict[str, DatasetSlot]:
+    """Record a slot factory for the datasets of a CatalogAssembly that need a fresh instance at each iteration: outputs and stateful unmanaged datasets.
+
+    Args:
+        catalog_assembly (CatalogAssembly): compiled catalog assembly
+    """
+    return {
+        dataset_name: DatasetSlot(dataset_value)
+        for dataset_name, dataset_value in {
+            **{
+                dataset_name: dataset_value
+                for dataset_name, dataset_value in catalog_assembly.outputs.items()
+                if dataset_name not in catalog_assembly.templates
+            },
+            **{
+                dataset_name: dataset_value
+                for dataset_name, dataset_value in catalog_assembly.unmanaged.items()
+                if is_stateful_dataset(dataset_value)
+            },
+        }.items()
+    }
+
+
+def compile_runner(
+    pipeline: Pipeline,
+    runner: Optional[str],
+    runner_workers: Optional[int] = None,
+    io_datasets: Iterable[str] = (),
+) -> Tuple[Optional[str], Optional[int]]:
+    """Resolve the runner of a namespace. The "auto" runner pick threads if the namespace pipeline has independent I/O bound branches, and the compiled executor otherwise, as the CPU bound nodes would only contend for the GIL.
+    A node is I/O bound if it is tagged with ``IO_BOUND_TAG`` or if it reads or writes one of the ``io_datasets``.
+
+    Args:
+        pipeline (Pipeline): namespace pipeline
+        runner (str): runner given in the compilation spec
+        runner_workers (int): maximum number of threads given in the compilation spec
+        io_datasets (Iterable[str]): datasets that are read or written outside of the process memory at iteration time
+
+    Returns:
+        Tuple[Optional[str], Optional[int]]: resolved runner and its number of threads
+    """
+    if runner not in ("thread", "auto"):
+        return runner, runner_workers
+
+    if runner == "auto":
+        io_datasets = set(io_datasets)
+        nodes_groups = [
+            [
+                node
+                for node in nodes_group
+                if IO_BOUND_TAG in node.tags
+                or io_datasets.intersection(node.inputs + node.outputs)
+            ]
+            for nodes_group in pipeline.grouped_nodes
+        ]
+    else:
+        nodes_groups = pipeline.grouped_nodes
+
+    # The width of the widest topological layer is the number of nodes that can run at the same time
+    pipeline_width = max((len(nodes_group) for nodes_group in nodes_groups), default=0)
+    if runner == "auto" and pipeline_width <= 1:
+        return "compiled", None
+
+    return "thread", min(pipeline_width, runner_workers or pipeline_width) or 1
+
+
+def is_stateful_dataset(dataset: Any) -> bool:
+    """Helper that check if a dataset hold data or version state between a save and a load
+
+    Args:
+        dataset (Any): Any kedro dataset
+
+    Returns:
+        bool: True for memory, cached and versioned datasets
+    """
+    return (
+        isinstance(dataset, DATA_HOLDING_DATASETS)
+        or getattr(dataset, "_version", None) is not None
+    )
+
+
 def recursively_check_parametrized_values(
     dataset_attributes: Union[str, list, dict, PurePath],
 ) -> bool:  # noqa: PLR0911
@@ -151,13 +252,10 @@ def recursively_check_parametrized_values(
         bool: _description_
     """
     if isinstance(dataset_attributes, str):
-        config = OmegaConf.create({"dataset_entry": dataset_attributes})
-        return OmegaConf.is_interpolation(config, "dataset_entry")
-        # return bool(re.search(r"\[\[.*?\]\]", dataset_attributes))
+        return is_template(dataset_attributes)
 
     elif isinstance(dataset_attributes, PurePath):
-        config = OmegaConf.create({"dataset_entry": str(dataset_attributes)})
-        return OmegaConf.is_interpolation(config, "dataset_entry")
+        return is_template(str(dataset_attributes))
 
     elif isinstance(dataset_attributes, dict):
         for key in dataset_attributes:
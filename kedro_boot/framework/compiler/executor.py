@@ -0,0 +1,263 @@
+"""``CompiledPipelineExecutor`` run a namespace pipeline by calling its nodes functions directly, following an execution plan compiled once."""
+
+import inspect
+import logging
+from typing import Any, Dict, List, Optional
+
+from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from pluggy import PluginManager
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CompiledNode:
+    """A node with its inputs/outputs bindings and release points resolved at compile time."""
+
+    __slots__ = (
+        "node",
+        "func",
+        "inputs",
+        "args",
+        "kwargs",
+        "outputs",
+        "outputs_kind",
+        "confirms",
+        "released_datasets",
+    )
+
+    def __init__(self, node: Node, released_datasets: List[str]) -> None:
+        """Init the ``CompiledNode``.
+
+        Args:
+            node (Node): kedro node
+            released_datasets (List[str]): datasets to release once the node has run
+        """
+        if inspect.isgeneratorfunction(node.func):
+            raise CompiledPipelineExecutorError(
+                f"The node {node} is a generator function, which is not supported by the compiled runner. Please use the sequential runner for its namespace."
+            )
+
+        self.node = node
+        self.func = node.func
+        self.inputs = node.inputs
+
+        node_inputs = node._inputs
+        if isinstance(node_inputs, dict):
+            self.args = []
+            self.kwargs = list(node_inputs.items())
+        else:
+            self.args = [node_inputs] if isinstance(node_inputs, str) else self.inputs
+            self.kwargs = []
+
+        node_outputs = node._outputs
+        if node_outputs is None:
+            self.outputs_kind, self.outputs = None, []
+        elif isinstance(node_outputs, str):
+            self.outputs_kind, self.outputs = str, [node_outputs]
+        elif isinstance(node_outputs, dict):
+            self.outputs_kind, self.outputs = dict, list(node_outputs.items())
+        else:
+            self.outputs_kind, self.outputs = list, list(node_outputs)
+
+        self.confirms = node.confirms
+        self.released_datasets = released_datasets
+
+    def call(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Call the node function with the inputs, and map its results to the node outputs.
+
+        Args:
+            inputs (Dict[str, Any]): node inputs data indexed by dataset name
+
+        Returns:
+            Dict[str, Any]: node outputs data indexed by dataset name
+        """
+        try:
+            result = self.func(
+                *[inputs[dataset_name] for dataset_name in self.args],
+                **{arg: inputs[dataset_name] for arg, dataset_name in self.kwargs},
+            )
+        except Exception as exc:
+            LOGGER.error(f"Node {self.node} failed with error: \n{exc}")
+            raise exc
+
+        if self.outputs_kind is None:
+            return {}
+        if self.outputs_kind is str:
+            return {self.outputs[0]: result}
+        if self.outputs_kind is dict:
+            if not isinstance(result, dict) or set(result) != {
+                key for key, _ in self.outputs
+            }:
+                raise ValueError(
+                    f"Failed to save outputs of node {self.node}.\n"
+                    f"The node's output keys {[key for key, _ in self.outputs]} do not match with the returned output {type(result)}."
+                )
+            return {dataset_name: result[key] for key, dataset_name in self.outputs}
+        if not isinstance(result, (list, tuple)) or len(result) != len(self.outputs):
+            raise ValueError(
+                f"Failed to save outputs of node {self.node}.\n"
+                f"The node definition contains {len(self.outputs)} output(s), whereas the node function returned {type(result)}."
+            )
+        return dict(zip(self.outputs, result))
+
+
+class CompiledPipelineExecutor:
+    """``CompiledPipelineExecutor`` run a pipeline that never change after the compilation, without going through the kedro runner machinery.
+    The topological order, the nodes inputs/outputs bindings and the datasets release points are computed once.
+    At iteration time, datasets are loaded and saved directly and node functions are called directly. Node and dataset hooks are fired in the same order as the kedro runners.
+    """
+
+    def __init__(
+        self, pipeline: Pipeline, protected_datasets: Optional[List[str]] = None
+    ) -> None:
+        """Compile the execution plan of a pipeline.
+
+        Args:
+            pipeline (Pipeline): kedro pipeline
+            protected_datasets (List[str]): datasets that are never released, as they are loaded after the run (ex: the outputs exposed to the app).
+        """
+        self.pipeline = pipeline
+
+        pipeline_inputs = pipeline.inputs()
+        pipeline_outputs = pipeline.outputs()
+        protected_datasets = set(protected_datasets or [])
+        nodes = pipeline.nodes
+
+        # Release a dataset after the last node that load it, or after the node that save it if no node load it, as kedro runners do
+        last_use = {}
+        for index, node in enumerate(nodes):
+            for dataset_name in node.inputs:
+                last_use[dataset_name] = index
+        for index, node in enumerate(nodes):
+            for dataset_name in node.outputs:
+                last_use.setdefault(dataset_name, index)
+
+        released_datasets = [[] for _ in nodes]
+        for dataset_name, index in last_use.items():
+            if (
+                dataset_name in pipeline_inputs
+                or dataset_name in pipeline_outputs
+                or dataset_name in protected_datasets
+            ):
+                continue
+            released_datasets[index].append(dataset_name)
+
+        self.nodes = [
+            CompiledNode(node, released_datasets[index])
+            for index, node in enumerate(nodes)
+        ]
+
+    def run(
+        self,
+        catalog: Any,
+        hook_manager: Optional[PluginManager] = None,
+        session_id: Optional[str] = None,
+    ) -> None:
+        """Run the compiled pipeline with a rendered catalog.
+
+        Args:
+            catalog (DataCatalog): rendered catalog, containing all the pipeline datasets
+            hook_manager (PluginManager): kedro hook manager. Hooks are skipped if no hook is registered.
+            session_id (str): kedro session id
+        """
+        datasets = catalog._datasets
+        if has_registered_hooks(hook_manager):
+            run_node = self._run_node_with_hooks
+        else:
+            run_node = self._run_node
+
+        for compiled_node in self.nodes:
+            run_node(compiled_node, catalog, datasets, hook_manager, session_id)
+            for dataset_name in compiled_node.confirms:
+                catalog.confirm(dataset_name)
+            for dataset_name in compiled_node.released_datasets:
+                datasets[dataset_name].release()
+
+    @staticmethod
+    def _run_node(
+        compiled_node: CompiledNode,
+        catalog: Any,
+        datasets: Dict[str, Any],
+        hook_manager: Any,
+        session_id: Optional[str],
+    ) -> None:
+        outputs = compiled_node.call(
+            {
+                dataset_name: datasets[dataset_name].load()
+                for dataset_name in compiled_node.inputs
+            }
+        )
+        for dataset_name, data in outputs.items():
+            datasets[dataset_name].save(data)
+
+    @staticmethod
+    def _run_node_with_hooks(
+        compiled_node: CompiledNode,
+        catalog: Any,
+        datasets: Dict[str, Any],
+        hook_manager: PluginManager,
+        session_id: Optional[str],
+    ) -> None:
+        node = compiled_node.node
+        hook = hook_manager.hook
+
+        inputs = {}
+        for dataset_name in compiled_node.inputs:
+            hook.before_dataset_loaded(dataset_name=dataset_name, node=node)
+            inputs[dataset_name] = datasets[dataset_name].load()
+            hook.after_dataset_loaded(
+                dataset_name=dataset_name, data=inputs[dataset_name], node=node
+            )
+
+        hook_responses = hook.before_node_run(
+            node=node,
+            catalog=catalog,
+            inputs=dict(inputs),
+            is_async=False,
+            session_id=session_id,
+        )
+        for hook_response in hook_responses or []:
+            if hook_response is not None and not isinstance(hook_response, dict):
+                raise TypeError(
+                    f"'before_node_run' must return either None or a dictionary mapping dataset names to updated values, got '{type(hook_response).__name__}' instead."
+                )
+            inputs.update(hook_response or {})
+
+        try:
+            outputs = compiled_node.call(inputs)
+        except Exception as exc:
+            hook.on_node_error(
+                error=exc,
+                node=node,
+                catalog=catalog,
+                inputs=inputs,
+                is_async=False,
+                session_id=session_id,
+            )
+            raise exc
+        hook.after_node_run(
+            node=node,
+            catalog=catalog,
+            inputs=inputs,
+            outputs=outputs,
+            is_async=False,
+            session_id=session_id,
+        )
+
+        for dataset_name, data in outputs.items():
+            hook.before_dataset_saved(dataset_name=dataset_name, data=data, node=node)
+            datasets[dataset_name].save(data)
+            hook.after_dataset_saved(dataset_name=dataset_name, data=data, node=node)
+
+
+def has_registered_hooks(hook_manager: Optional[Any]) -> bool:
+    """Check if a hook manager has any registered hook implementation"""
+    if hook_manager is None or isinstance(hook_manager, _NullPluginManager):
+        return False
+    return bool(hook_manager.get_plugins())
+
+
+class CompiledPipelineExecutorError(Exception):
+    """Error raised in the compiled pipeline executor"""
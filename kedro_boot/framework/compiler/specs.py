@@ -1,8 +1,23 @@
 """This module implements CompilationSpec and the logic of namespacing and dataset's naming."""
 
-from typing import List
+from typing import Dict, List, Optional, Union
 from kedro.pipeline import Pipeline
 
+from kedro_boot.framework.renderer.datasets import (
+    COPY_MODES,
+    READONLY_COPY_MODE,
+    check_readonly_copy_mode,
+)
+
+RUNNERS = ("sequential", "thread", "compiled", "auto")
+IO_BOUND_TAG = "io_bound"
+HOOK_MODES = ("full", "sampled", "off")
+ARTIFACT_EXECUTORS = ("thread", "process")
+MATERIALIZATION_POLICIES = ("eager", "lazy")
+READINESS_MODES = ("all", "critical")
+ARTIFACTS_DEDUPLICATIONS = ("off", "source", "content")
+MEMORY_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
 
 class CompilationSpec:
     """``NamespaceSpec`` is a user facing interface that encapsulate catalog compilation spec's attributes and utilities"""
@@ -14,6 +29,12 @@ class CompilationSpec:
         outputs: List[str] = None,
         parameters: List[str] = None,
         infer_artifacts: bool = True,
+        template_cache_size: int = 128,
+        copy_mode: Optional[Union[str, Dict[str, str]]] = None,
+        runner: Optional[str] = None,
+        runner_workers: Optional[int] = None,
+        hook_mode: str = "full",
+        hook_sampling: int = 100,
     ) -> None:
         """Init the ``CompilationSpec``.
 
@@ -23,7 +44,16 @@ class CompilationSpec:
             namespace (List[str]): outputs datasets to be exposed to the App. Specify it without the namespace prefix
             namespace (List[str]): parameters datasets to be exposed to the App. Specify it without the namespace prefix
             infer_artifacts (bool): Wheter if the compiler infer artifacts datasets. Default to True
+            template_cache_size (int): Number of rendered template datasets kept in the namespace LRU cache, indexed by itertime params. 0 disable the cache. Default to 128
+            copy_mode (Union[str, Dict[str, str]]): Copy mode of the inputs datasets, for all the inputs or by input name: "deepcopy", "copy", "assign" (zero-copy) or "readonly" (zero-copy read-only view). Default to None, the copy mode is infered from the data as kedro does
+            runner (str): Runner of the namespace iterations: "sequential" (kedro ``SequentialRunner``), "thread" (kedro ``ThreadRunner``), "compiled" (nodes called directly following an execution plan compiled once) or "auto" ("thread" if the namespace pipeline has independent I/O bound branches, "compiled" otherwise). A node is I/O bound if it is tagged with "io_bound" or reads or writes a dataset that does not hold its data in memory. Default to None, the session runner is used
+            runner_workers (int): Maximum number of threads of the "thread" and "auto" runners. Default to None, one thread per independent branch
+            hook_mode (str): Dispatch of the project hooks at iteration time: "full" (hooks fired at each iteration), "sampled" (hooks fired for 1 in ``hook_sampling`` iterations) or "off". Default to "full"
+            hook_sampling (int): Sampling interval of the "sampled" hook mode. Default to 100
         """
+        validate_copy_mode(copy_mode)
+        validate_runner(runner, runner_workers)
+        validate_hook_mode(hook_mode, hook_sampling)
         self._namespace = namespace
         infer_artifacts = infer_artifacts if infer_artifacts is not None else True
         self._spec = dict(
@@ -31,6 +61,12 @@ class CompilationSpec:
             outputs=outputs or [],
             parameters=parameters or [],
             infer_artifacts=infer_artifacts,
+            template_cache_size=template_cache_size,
+            copy_mode=copy_mode,
+            runner=runner,
+            runner_workers=runner_workers,
+            hook_mode=hook_mode,
+            hook_sampling=hook_sampling,
         )
 
     @property
@@ -89,28 +125,84 @@ class CompilationSpec:
     def infer_artifacts(self, value: bool) -> None:
         self._spec["infer_artifacts"] = value
 
+    @property
+    def template_cache_size(self) -> int:
+        return self._spec["template_cache_size"]
+
+    @template_cache_size.setter
+    def template_cache_size(self, value: int) -> None:
+        self._spec["template_cache_size"] = value
+
+    @property
+    def copy_mode(self) -> Optional[Union[str, Dict[str, str]]]:
+        return self._spec["copy_mode"]
+
+    @copy_mode.setter
+    def copy_mode(self, value: Optional[Union[str, Dict[str, str]]]) -> None:
+        validate_copy_mode(value)
+        self._spec["copy_mode"] = value
+
+    @property
+    def runner(self) -> Optional[str]:
+        return self._spec["runner"]
+
+    @runner.setter
+    def runner(self, value: Optional[str]) -> None:
+        validate_runner(value, self.runner_workers)
+        self._spec["runner"] = value
+
+    @property
+    def runner_workers(self) -> Optional[int]:
+        return self._spec["runner_workers"]
+
+    @runner_workers.setter
+    def runner_workers(self, value: Optional[int]) -> None:
+        validate_runner(self.runner, value)
+        self._spec["runner_workers"] = value
+
+    @property
+    def hook_mode(self) -> str:
+        return self._spec["hook_mode"]
+
+    @hook_mode.setter
+    def hook_mode(self, value: str) -> None:
+        validate_hook_mode(value, self.hook_sampling)
+        self._spec["hook_mode"] = value
+
+    @property
+    def hook_sampling(self) -> int:
+        return self._spec["hook_sampling"]
+
+    @hook_sampling.setter
+    def hook_sampling(self, value: int) -> None:
+        validate_hook_mode(self.hook_mode, value)
+        self._spec["hook_sampling"] = value
+
     def to_dict(self) -> dict:
-        return dict(namespace=self._namespace, specs=self._specs)
+        return dict(namespace=self._namespace, specs=self._spec)
 
     @classmethod
-    def infer_compilation_specs(cls, pipeline: Pipeline):
+    def infer_compilation_specs(
+        cls,
+        pipeline: Pipeline,
+        namespaces_pipelines: Optional[Dict[Optional[str], Pipeline]] = None,
+    ):
         """Infer Compilation specs from a pipeline.
 
         Args:
             pipeline (Pipeline): kedro pipeline
+            namespaces_pipelines (Dict[Optional[str], Pipeline]): pipeline of each namespace, as indexed by ``index_pipeline_namespaces``. Default to None, the pipeline is indexed
         Returns:
             List[CompilationSpec]: compilation specs
         """
 
-        namespaces = set()
-        for node in pipeline.nodes:
-            namespaces.add(node.namespace)
+        if namespaces_pipelines is None:
+            namespaces_pipelines = index_pipeline_namespaces(pipeline)
 
         compilation_specs = []
 
-        for namespace in namespaces:
+        for namespace, namespace_pipeline in namespaces_pipelines.items():
             compilation_spec = CompilationSpec(namespace=namespace)
-            namespace_pipeline = filter_pipeline(pipeline, namespace)
             for dataset_name in namespace_pipeline.inputs():
                 if not namespace and "params:" in dataset_name:
                     compilation_spec.parameters.append(
@@ -136,6 +228,390 @@ class CompilationSpec:
         return compilation_specs
 
 
+class MaterializationSpec:
+    """``MaterializationSpec`` is a user facing interface that encapsulate how the artifacts datasets of all the namespaces are materialized at compile time"""
+
+    def __init__(
+        self,
+        store_dir: Optional[str] = None,
+        executor: str = "thread",
+        workers: int = 1,
+        timeout: Optional[float] = None,
+        policy: str = "eager",
+        critical_namespaces: Optional[List[str]] = None,
+        prefetch: bool = True,
+        prefetch_order: Optional[List[str]] = None,
+        readiness: str = "all",
+        watch_interval: Optional[float] = None,
+        memory_budget: Optional[Union[int, str]] = None,
+        deduplication: str = "source",
+    ) -> None:
+        """Init the ``MaterializationSpec``.
+
+        Args:
+            store_dir (str): Local directory of the artifact store, memory mapped read-only by every process of the host. Default to None, no store
+            executor (str): 'thread' or 'process' pool loading the artifacts concurrently. Default to 'thread'
+            workers (int): Maximum number of artifacts loaded concurrently. Default to 1
+            timeout (float): Maximum load time of each artifact, in seconds, the compilation fails once it's reached. Only the 'process' executor terminates the timed out load, a thread can't be stopped and keeps loading in the background. Default to None, no timeout
+            policy (str): 'eager' (the artifacts are loaded at compile time) or 'lazy' (the artifacts are loaded at their first use, except the critical ones). Default to 'eager'
+            critical_namespaces (List[str]): Namespaces whose artifacts are loaded at compile time with the 'lazy' policy. Default to None
+            prefetch (bool): Load the lazy artifacts in the background. Default to True
+            prefetch_order (List[str]): Namespaces whose artifacts are prefetched first, in this order. Default to None, the compilation order
+            readiness (str): 'all' (the session is ready once all the artifacts are loaded) or 'critical' (once the critical ones are loaded). Default to 'all'
+            watch_interval (float): Interval in seconds between two checks of the artifacts files, the changed ones are reloaded. Default to None, no watcher
+            memory_budget (Union[int, str]): Memory budget of the artifacts, in bytes or with a unit (ex: "512MB"). The least recently used artifacts are evicted. Default to None, no budget
+            deduplication (str): 'off', 'source' (share the artifacts reading the same source) or 'content' (also the artifacts with the same content). Default to 'source'
+        """
+        validate_materialization(executor, workers, timeout)
+        validate_materialization_policy(policy, readiness, prefetch)
+        validate_watch_interval(watch_interval)
+        validate_artifacts_deduplication(deduplication)
+        memory_budget = parse_memory_size(memory_budget)
+        self._spec = dict(
+            store_dir=store_dir,
+            executor=executor,
+            workers=workers,
+            timeout=timeout,
+            policy=policy,
+            critical_namespaces=critical_namespaces or [],
+            prefetch=prefetch,
+            prefetch_order=prefetch_order or [],
+            readiness=readiness,
+            watch_interval=watch_interval,
+            memory_budget=memory_budget,
+            deduplication=deduplication,
+        )
+
+    @property
+    def store_dir(self) -> Optional[str]:
+        return self._spec["store_dir"]
+
+    @store_dir.setter
+    def store_dir(self, value: Optional[str]) -> None:
+        self._spec["store_dir"] = value
+
+    @property
+    def executor(self) -> str:
+        return self._spec["executor"]
+
+    @executor.setter
+    def executor(self, value: str) -> None:
+        validate_materialization(value, self.workers, self.timeout)
+        self._spec["executor"] = value
+
+    @property
+    def workers(self) -> int:
+        return self._spec["workers"]
+
+    @workers.setter
+    def workers(self, value: int) -> None:
+        validate_materialization(self.executor, value, self.timeout)
+        self._spec["workers"] = value
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self._spec["timeout"]
+
+    @timeout.setter
+    def timeout(self, value: Optional[float]) -> None:
+        validate_materialization(self.executor, self.workers, value)
+        self._spec["timeout"] = value
+
+    @property
+    def policy(self) -> str:
+        return self._spec["policy"]
+
+    @policy.setter
+    def policy(self, value: str) -> None:
+        validate_materialization_policy(value, self.readiness, self.prefetch)
+        self._spec["policy"] = value
+
+    @property
+    def critical_namespaces(self) -> List[str]:
+        return self._spec["critical_namespaces"]
+
+    @critical_namespaces.setter
+    def critical_namespaces(self, value: List[str]) -> None:
+        self._spec["critical_namespaces"] = value
+
+    @property
+    def prefetch(self) -> bool:
+        return self._spec["prefetch"]
+
+    @prefetch.setter
+    def prefetch(self, value: bool) -> None:
+        validate_materialization_policy(self.policy, self.readiness, value)
+        self._spec["prefetch"] = value
+
+    @property
+    def prefetch_order(self) -> List[str]:
+        return self._spec["prefetch_order"]
+
+    @prefetch_order.setter
+    def prefetch_order(self, value: List[str]) -> None:
+        self._spec["prefetch_order"] = value
+
+    @property
+    def readiness(self) -> str:
+        return self._spec["readiness"]
+
+    @readiness.setter
+    def readiness(self, value: str) -> None:
+        validate_materialization_policy(self.policy, value, self.prefetch)
+        self._spec["readiness"] = value
+
+    @property
+    def watch_interval(self) -> Optional[float]:
+        return self._spec["watch_interval"]
+
+    @watch_interval.setter
+    def watch_interval(self, value: Optional[float]) -> None:
+        validate_watch_interval(value)
+        self._spec["watch_interval"] = value
+
+    @property
+    def memory_budget(self) -> Optional[int]:
+        return self._spec["memory_budget"]
+
+    @memory_budget.setter
+    def memory_budget(self, value: Optional[Union[int, str]]) -> None:
+        self._spec["memory_budget"] = parse_memory_size(value)
+
+    @property
+    def deduplication(self) -> str:
+        return self._spec["deduplication"]
+
+    @deduplication.setter
+    def deduplication(self, value: str) -> None:
+        validate_artifacts_deduplication(value)
+        self._spec["deduplication"] = value
+
+    def to_dict(self) -> dict:
+        return dict(self._spec)
+
+
+def validate_copy_mode(copy_mode: Optional[Union[str, Dict[str, str]]]) -> None:
+    """Check that a copy mode, or each copy mode of a copy modes dict, is a supported copy mode.
+
+    Args:
+        copy_mode (Union[str, Dict[str, str]]): copy mode, or copy modes indexed by input name
+
+    Raises:
+        ValueError: unsupported copy mode
+    """
+    copy_modes = copy_mode.values() if isinstance(copy_mode, dict) else [copy_mode]
+    for mode in copy_modes:
+        if mode is not None and mode not in COPY_MODES:
+            raise ValueError(
+                f"Invalid copy mode: {mode}. Copy mode should be one of {COPY_MODES}"
+            )
+        if mode == READONLY_COPY_MODE:
+            check_readonly_copy_mode()
+
+
+def validate_runner(
+    runner: Optional[str], runner_workers: Optional[int] = None
+) -> None:
+    """Check that a namespace runner is a supported runner, and that its workers number is a positive integer.
+
+    Args:
+        runner (str): runner name
+        runner_workers (int): maximum number of threads of the runner
+
+    Raises:
+        ValueError: unsupported runner or invalid workers number
+    """
+    if runner is not None and runner not in RUNNERS:
+        raise ValueError(f"Invalid runner: {runner}. Runner should be one of {RUNNERS}")
+    if runner_workers is not None and (
+        not isinstance(runner_workers, int)
+        or isinstance(runner_workers, bool)
+        or runner_workers < 1
+    ):
+        raise ValueError(
+            f"Invalid runner workers: {runner_workers}. Runner workers should be a positive integer"
+        )
+
+
+def validate_hook_mode(hook_mode: str, hook_sampling: int) -> None:
+    """Check that a namespace hook mode is supported, and that its sampling interval is a positive integer.
+
+    Args:
+        hook_mode (str): hook mode
+        hook_sampling (int): sampling interval of the sampled hook mode
+
+    Raises:
+        ValueError: unsupported hook mode or invalid sampling interval
+    """
+    if hook_mode not in HOOK_MODES:
+        raise ValueError(
+            f"Invalid hook mode: {hook_mode}. Hook mode should be one of {HOOK_MODES}"
+        )
+    if (
+        not isinstance(hook_sampling, int)
+        or isinstance(hook_sampling, bool)
+        or hook_sampling < 1
+    ):
+        raise ValueError(
+            f"Invalid hook sampling: {hook_sampling}. Hook sampling should be a positive integer"
+        )
+
+
+def validate_materialization(
+    executor: str, workers: int, timeout: Optional[float]
+) -> None:
+    """Check that the artifacts executor is supported, that its workers number is a positive integer and its timeout a positive number.
+
+    Args:
+        executor (str): artifacts executor name
+        workers (int): maximum number of artifacts loaded concurrently
+        timeout (float): maximum load time of each artifact, in seconds
+
+    Raises:
+        ValueError: unsupported executor, invalid workers number or timeout
+    """
+    if executor not in ARTIFACT_EXECUTORS:
+        raise ValueError(
+            f"Invalid artifacts executor: {executor}. Artifacts executor should be one of {ARTIFACT_EXECUTORS}"
+        )
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError(
+            f"Invalid artifacts workers: {workers}. Artifacts workers should be a positive integer"
+        )
+    if timeout is not None and (
+        isinstance(timeout, bool)
+        or not isinstance(timeout, (int, float))
+        or timeout <= 0
+    ):
+        raise ValueError(
+            f"Invalid artifacts timeout: {timeout}. Artifacts timeout should be a positive number of seconds"
+        )
+
+
+def validate_materialization_policy(
+    policy: str, readiness: str, prefetch: bool = True
+) -> None:
+    """Check that the artifacts materialization policy and the readiness mode are supported.
+
+    Args:
+        policy (str): materialization policy
+        readiness (str): readiness mode
+        prefetch (bool): the lazy artifacts are prefetched in the background
+
+    Raises:
+        ValueError: unsupported policy or readiness mode, or a readiness that can't be reached
+    """
+    if policy not in MATERIALIZATION_POLICIES:
+        raise ValueError(
+            f"Invalid materialization policy: {policy}. Materialization policy should be one of {MATERIALIZATION_POLICIES}"
+        )
+    if readiness not in READINESS_MODES:
+        raise ValueError(
+            f"Invalid readiness: {readiness}. Readiness should be one of {READINESS_MODES}"
+        )
+    if policy == "lazy" and not prefetch and readiness == "all":
+        # Without prefetch, the session would stay not ready until every lazy artifact is used
+        raise ValueError(
+            "The 'all' readiness needs the prefetch of the lazy artifacts. Enable the prefetch or use the 'critical' readiness"
+        )
+
+
+def validate_watch_interval(watch_interval: Optional[float]) -> None:
+    """Check that the artifacts watch interval is a positive number of seconds.
+
+    Args:
+        watch_interval (float): interval between two checks of the artifacts files
+
+    Raises:
+        ValueError: invalid watch interval
+    """
+    if watch_interval is not None and (
+        isinstance(watch_interval, bool)
+        or not isinstance(watch_interval, (int, float))
+        or watch_interval <= 0
+    ):
+        raise ValueError(
+            f"Invalid artifacts watch interval: {watch_interval}. Artifacts watch interval should be a positive number of seconds"
+        )
+
+
+def validate_artifacts_deduplication(deduplication: str) -> None:
+    """Check that the artifacts deduplication mode is supported.
+
+    Args:
+        deduplication (str): artifacts deduplication mode
+
+    Raises:
+        ValueError: unsupported deduplication mode
+    """
+    if deduplication not in ARTIFACTS_DEDUPLICATIONS:
+        raise ValueError(
+            f"Invalid artifacts deduplication: {deduplication}. Artifacts deduplication should be one of {ARTIFACTS_DEDUPLICATIONS}"
+        )
+
+
+def parse_memory_size(memory_size: Optional[Union[int, str]]) -> Optional[int]:
+    """Parse a memory size given in bytes or with a unit (ex: "512MB", "2GB"). Units are powers of 1024.
+
+    Args:
+        memory_size (Union[int, str]): memory size
+
+    Raises:
+        ValueError: invalid memory size
+
+    Returns:
+        Optional[int]: memory size in bytes
+    """
+    if memory_size is None:
+        return None
+
+    size = memory_size
+    if isinstance(memory_size, str):
+        value = memory_size.strip().upper().rstrip("B").rstrip("I")
+        multiplier = MEMORY_UNITS.get(value[-1:], 1)
+        value = value[:-1] if value[-1:] in MEMORY_UNITS else value
+        try:
+            size = int(float(value) * multiplier)
+        except ValueError:
+            size = None
+
+    if isinstance(size, bool) or not isinstance(size, int) or size <= 0:
+        raise ValueError(
+            f"Invalid memory size: {memory_size}. Memory size should be a positive number of bytes, or a number with a KB, MB or GB unit"
+        )
+    return size
+
+
+def resolve_copy_modes(
+    inputs: List[str], namespace: str, *copy_modes: Union[str, Dict[str, str]]
+) -> Dict[str, str]:
+    """Resolve the copy mode of each namespaced input, the last given copy mode taking precedence.
+
+    Args:
+        inputs (List[str]): inputs datasets names, without the namespace prefix
+        namespace (str): pipeline's namespace
+        copy_modes (Union[str, Dict[str, str]]): copy mode for all the inputs, or copy modes indexed by input name
+
+    Returns:
+        Dict[str, str]: copy modes indexed by namespaced input name
+    """
+    resolved_copy_modes = {}
+    for copy_mode in copy_modes:
+        if isinstance(copy_mode, dict):
+            resolved_copy_modes.update(
+                {
+                    namespace_dataset_name(input_name, namespace): mode
+                    for input_name, mode in copy_mode.items()
+                }
+            )
+        elif copy_mode is not None:
+            resolved_copy_modes = {
+                namespace_dataset_name(input_name, namespace): copy_mode
+                for input_name in inputs
+            }
+    return resolved_copy_modes
+
+
 def namespace_datasets_names(datasets_names: list, namespace: str) -> List[str]:
     namespaced_datasets_names = []
     for dataset_name in datasets_names:
@@ -152,6 +628,23 @@ def namespace_dataset_name(dataset_name: str, namespace: str) -> str:
     return dataset_name
 
 
+def index_pipeline_namespaces(pipeline: Pipeline) -> Dict[Optional[str], Pipeline]:
+    """Split a pipeline into the pipelines of its namespaces, in a single pass over its nodes.
+    The namespaces pipelines are indexed once and shared by the compilation specs inference and the compilation, so compiling N namespaces doesn't scan the whole pipeline N times.
+
+    Args:
+        pipeline (Pipeline): kedro pipeline
+
+    Returns:
+        Dict[Optional[str], Pipeline]: pipeline of each namespace, in the order of the pipeline nodes. The nodes without namespace are indexed by None
+    """
+    namespaces_nodes = {}
+    for n in pipeline.nodes:
+        namespaces_nodes.setdefault(n.namespace, []).append(n)
+
+    return {namespace: Pipeline(nodes) for namespace, nodes in namespaces_nodes.items()}
+
+
 def filter_pipeline(pipeline: Pipeline, namespace: str) -> Pipeline:
     # Replace the pipeline.only_nodes_with_namespaces as it does not take None namespace.
     nodes = []
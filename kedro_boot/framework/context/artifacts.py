@@ -0,0 +1,1424 @@
+"""This module implements the materialization of the artifacts datasets, the ``ArtifactsManager`` and the ``ArtifactStore``."""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import queue
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict, namedtuple
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import fsspec
+from kedro.io import MemoryDataset
+from kedro.io.core import (
+    AbstractDataset,
+    DatasetError,
+    VersionNotFoundError,
+    get_filepath_str,
+    get_protocol_and_path,
+)
+
+from kedro_boot.framework.compiler.specs import MaterializationSpec
+
+LOGGER = logging.getLogger(__name__)
+
+NUMPY_FORMAT = "npy"
+PANDAS_FORMAT = "frame"
+ARROW_FORMAT = "arrow"
+
+# numpy dtype kinds that can be memory mapped: bool, integers, floats, complex, datetimes and timedeltas
+_MAPPABLE_DTYPE_KINDS = "biufcmM"
+
+# Location of an artifact in the store. Returned by the process pool workers, so the parent process maps the artifact instead of receiving a pickled copy
+StoredArtifact = namedtuple("StoredArtifact", ["path", "format"])
+
+# The failed artifacts are the lazy artifacts whose last load failed, with the load error
+ArtifactsReadiness = namedtuple(
+    "ArtifactsReadiness",
+    ["ready", "loaded_artifacts", "artifacts", "failed_artifacts"],
+)
+
+# Artifacts materialized once and shared under several names: the alias names mapped to the materialized name, and the bytes not loaded again
+ArtifactsDeduplication = namedtuple(
+    "ArtifactsDeduplication", ["aliases", "saved_bytes"]
+)
+
+_NOT_LOADED = object()
+
+# Retries of a failed prefetch, and the delay before the first retry, doubled at each retry
+PREFETCH_RETRIES = 2
+PREFETCH_RETRY_DELAY = 1.0
+
+# Load config of the kedro datasets that is not always part of their description. Two artifacts datasets are deduplicated only if they share it
+_SOURCE_LOAD_ATTRIBUTES = (
+    "_protocol",
+    "_load_args",
+    "_fs_open_args_load",
+    "_backend",
+    "_storage_options",
+    "_fs_args",
+)
+
+# Fields of the fsspec file info that change when the file is written again: the object stores versions (S3, GCS, ABFS) and the local and memory files times and sizes
+_SOURCE_STAT_FIELDS = (
+    "ETag",
+    "etag",
+    "md5Hash",
+    "generation",
+    "version_id",
+    "VersionId",
+    "LastModified",
+    "last_modified",
+    "updated",
+    "mtime",
+    "created",
+    "size",
+    "ino",
+)
+
+
+class ArtifactStore:
+    """``ArtifactStore`` hold the artifacts materialized by all the kedro boot apps of a host, memory mapped read-only (numpy arrays, pandas DataFrames mappable columns and pyarrow Tables)"""
+
+    def __init__(self, store_dir: str) -> None:
+        """Init the ``ArtifactStore``.
+
+        Args:
+            store_dir (str): local directory of the store. Created if it does not exist.
+        """
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+
+    def load(self, dataset_name: str, dataset: Any) -> Any:
+        """Load an artifact from the store, memory mapped read-only.
+
+        Args:
+            dataset_name (str): artifact dataset name
+            dataset (Any): artifact dataset
+
+        Returns:
+            Any: memory mapped artifact, or the artifact loaded from its dataset if its type can't be memory mapped
+        """
+        return map_artifact(self.store(dataset_name, dataset))
+
+    def store(self, dataset_name: str, dataset: Any) -> Any:
+        """Store an artifact, if it's not already stored.
+
+        Args:
+            dataset_name (str): artifact dataset name
+            dataset (Any): artifact dataset
+
+        Returns:
+            Any: the ``StoredArtifact``, or the artifact loaded from its dataset if its type can't be memory mapped
+        """
+        try:
+            artifact_path = self.store_dir / artifact_key(dataset_name, dataset)
+        except ArtifactSourceError as exc:
+            # A stored version of an unknown source could be stale
+            LOGGER.warning(f"{exc}. {dataset_name} is loaded in the process memory")
+            return dataset.load()
+        for artifact_format in (NUMPY_FORMAT, PANDAS_FORMAT, ARROW_FORMAT):
+            stored_path = artifact_path.with_suffix(f".{artifact_format}")
+            if stored_path.exists():
+                LOGGER.info(f"Mapping {dataset_name} from the artifact store")
+                return StoredArtifact(stored_path, artifact_format)
+
+        data = dataset.load()
+        artifact_format = mappable_format(data)
+        if artifact_format is None:
+            LOGGER.info(
+                f"{dataset_name} of type {type(data).__name__} can't be memory mapped, it's loaded in the process memory"
+            )
+            return data
+
+        stored_path = artifact_path.with_suffix(f".{artifact_format}")
+        write_artifact(data, stored_path, artifact_format)
+        LOGGER.info(f"{dataset_name} written in the artifact store")
+        return StoredArtifact(stored_path, artifact_format)
+
+
+def load_artifacts(
+    artifacts_datasets: Dict[str, Any],
+    executor: str = "thread",
+    workers: int = 1,
+    timeout: Optional[float] = None,
+    store_dir: Optional[str] = None,
+) -> Dict[str, Tuple[Any, float]]:
+    """Load the artifacts datasets concurrently, at most ``workers`` at a time.
+
+    Args:
+        artifacts_datasets (Dict[str, Any]): artifacts datasets indexed by name
+        executor (str): 'thread' or 'process' pool
+        workers (int): maximum number of artifacts loaded concurrently
+        timeout (float): maximum load time of each artifact, in seconds. A timed out load is terminated with the 'process' executor, it keeps running in its daemon thread with the 'thread' executor
+        store_dir (str): local directory of the artifact store, if any
+
+    Raises:
+        ArtifactMaterializationError: an artifact load timed out
+
+    Returns:
+        Dict[str, Tuple[Any, float]]: loaded artifacts and their load time in seconds, indexed by name
+    """
+    if workers == 1 and timeout is None:
+        loaded_artifacts = {}
+        for dataset_name, dataset in artifacts_datasets.items():
+            LOGGER.info(f"Loading {dataset_name} as a MemoryDataset")
+            artifact, load_time = load_artifact(dataset_name, dataset, store_dir)
+            loaded_artifacts[dataset_name] = (map_artifact(artifact), load_time)
+        return loaded_artifacts
+
+    # The thread loads run in daemon threads, a hung load can't be stopped but it doesn't block the interpreter exit
+    pool = (
+        None
+        if executor == "thread"
+        else ProcessPoolExecutor(max_workers=min(workers, len(artifacts_datasets) or 1))
+    )
+    submit = submit_daemon_thread if pool is None else pool.submit
+    loaded_artifacts = {}
+    pending_artifacts = iter(artifacts_datasets.items())
+    # Artifacts are submitted as the workers free up, so an artifact deadline starts with its load
+    running_loads = {}
+    try:
+        while True:
+            while len(running_loads) < workers:
+                pending_artifact = next(pending_artifacts, None)
+                if pending_artifact is None:
+                    break
+                dataset_name, dataset = pending_artifact
+                LOGGER.info(f"Loading {dataset_name} as a MemoryDataset")
+                future = submit(load_artifact, dataset_name, dataset, store_dir)
+                running_loads[future] = (
+                    dataset_name,
+                    time.monotonic() + timeout if timeout else None,
+                )
+            if not running_loads:
+                break
+
+            next_deadline = min(
+                (deadline for _, deadline in running_loads.values() if deadline),
+                default=None,
+            )
+            done_loads, _ = wait(
+                running_loads,
+                timeout=max(next_deadline - time.monotonic(), 0)
+                if next_deadline
+                else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done_loads:
+                dataset_name, _ = running_loads.pop(future)
+                artifact, load_time = future.result()
+                loaded_artifacts[dataset_name] = (map_artifact(artifact), load_time)
+
+            for future, (dataset_name, deadline) in running_loads.items():
+                if deadline and time.monotonic() >= deadline and not future.done():
+                    if pool is None:
+                        LOGGER.warning(
+                            f"The load of the artifact {dataset_name} can't be stopped with the thread executor, it keeps running in the background. Use the process executor to terminate the timed out loads"
+                        )
+                    raise ArtifactMaterializationError(
+                        f"Loading the artifact {dataset_name} timed out after {timeout} seconds"
+                    )
+    finally:
+        for future in running_loads:
+            future.cancel()
+        if pool is not None:
+            pool_processes = list((pool._processes or {}).values())
+            pool.shutdown(wait=False)
+            if running_loads:
+                # Stop the hanging loads of the process pool instead of letting them outlive the compilation
+                for process in pool_processes:
+                    process.terminate()
+
+    return {
+        dataset_name: loaded_artifacts[dataset_name]
+        for dataset_name in artifacts_datasets
+    }
+
+
+def submit_daemon_thread(function: Callable, *args: Any) -> Future:
+    """Run a function in a new daemon thread.
+
+    Unlike the ``ThreadPoolExecutor`` workers, that are joined at the interpreter exit, a daemon thread stuck in a hung load doesn't block the exit.
+
+    Returns:
+        Future: future of the function result
+    """
+    future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(function(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="kedro-boot-artifacts-load", daemon=True).start()
+    return future
+
+
+def load_artifact(
+    dataset_name: str, dataset: Any, store_dir: Optional[str] = None
+) -> Tuple[Any, float]:
+    """Load an artifact from its dataset, or store it in the artifact store.
+
+    Returns:
+        Tuple[Any, float]: the artifact or its ``StoredArtifact``, and its load time in seconds
+    """
+    start_time = time.perf_counter()
+    if store_dir:
+        artifact = ArtifactStore(store_dir).store(dataset_name, dataset)
+    else:
+        artifact = dataset.load()
+    return artifact, time.perf_counter() - start_time
+
+
+def measure_size(data: Any) -> int:
+    """Measure the memory size of an artifact, in bytes.
+
+    Args:
+        data (Any): artifact data
+
+    Returns:
+        int: artifact size in bytes
+    """
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(data, np.ndarray):
+        return data.nbytes
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(data, (pd.DataFrame, pd.Series)):
+        memory_usage = data.memory_usage(deep=True, index=True)
+        return int(memory_usage.sum() if hasattr(memory_usage, "sum") else memory_usage)
+
+    pa = sys.modules.get("pyarrow")
+    if pa is not None and isinstance(data, pa.Table):
+        return data.nbytes
+
+    # Other objects (ex: models) are measured by their pickled size, out-of-band buffers being counted without copy
+    counter = _BytesCounter()
+    try:
+        pickle.Pickler(counter, protocol=5, buffer_callback=counter.add_buffer).dump(
+            data
+        )
+    except Exception:
+        return sys.getsizeof(data)
+    return counter.size
+
+
+class _BytesCounter:
+    def __init__(self) -> None:
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.size += len(data)
+        return len(data)
+
+    def add_buffer(self, buffer: pickle.PickleBuffer) -> None:
+        self.size += buffer.raw().nbytes
+
+
+# Store location of the mapped artifacts data, indexed by the id of the data. A snapshot pickles this location instead of the mapped data
+_mapped_artifacts: Dict[int, Tuple[Callable[[], Any], StoredArtifact]] = {}
+
+
+def map_artifact(artifact: Any) -> Any:
+    """Memory map a ``StoredArtifact``, other artifacts are returned as is"""
+    if isinstance(artifact, StoredArtifact):
+        data = read_artifact(artifact.path, artifact.format)
+        data_id = id(data)
+        try:
+            data_ref = weakref.ref(data, lambda _: _mapped_artifacts.pop(data_id, None))
+        except TypeError:
+            data_ref = lambda: data  # noqa: E731
+        _mapped_artifacts[data_id] = (data_ref, artifact)
+        return data
+    return artifact
+
+
+def find_stored_artifact(data: Any) -> Optional[StoredArtifact]:
+    """Get the store location of a mapped artifact data, None if it's not mapped from the store"""
+    mapped_artifact = _mapped_artifacts.get(id(data))
+    if mapped_artifact is not None and mapped_artifact[0]() is data:
+        return mapped_artifact[1]
+    return None
+
+
+class LazyArtifact:
+    """``LazyArtifact`` load an artifact once at its first use, and again after its eviction from the memory budget"""
+
+    def __init__(
+        self,
+        dataset_name: str,
+        dataset: Any,
+        store_dir: Optional[str] = None,
+        budget: Optional["ArtifactsMemoryBudget"] = None,
+    ) -> None:
+        """Init the ``LazyArtifact``.
+
+        Args:
+            dataset_name (str): artifact dataset name
+            dataset (Any): artifact dataset
+            store_dir (str): local directory of the artifact store, if any
+            budget (ArtifactsMemoryBudget): memory budget of the artifact, if any
+        """
+        self.dataset_name = dataset_name
+        self.dataset = dataset
+        self.store_dir = store_dir
+        self.budget = budget
+        self.load_time = None
+        self.load_error = None
+        self._data = _NOT_LOADED
+        self._evicted = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._data is not _NOT_LOADED
+
+    def get(self, prefetch: bool = False) -> Any:
+        """Get the artifact data, loading it if needed.
+
+        Args:
+            prefetch (bool): the artifact is loaded by a prefetch, ahead of its use
+
+        Returns:
+            Any: artifact data
+        """
+        data = self._data
+        if data is not _NOT_LOADED:
+            if self.budget is not None:
+                self.budget.touch(self)
+            return data
+
+        with self._lock:
+            data = self._data
+            if data is _NOT_LOADED:
+                LOGGER.info(f"Loading the lazy artifact {self.dataset_name}")
+                try:
+                    artifact, self.load_time = load_artifact(
+                        self.dataset_name, self.dataset, self.store_dir
+                    )
+                except Exception as exc:
+                    self.load_error = str(exc)
+                    raise
+                data = map_artifact(artifact)
+                self.load_error = None
+                self._data = data
+                if self.budget is not None:
+                    self.budget.add(
+                        self,
+                        measure_size(data),
+                        self.load_time,
+                        reload=self._evicted,
+                        prefetch=prefetch,
+                    )
+            # The data may be evicted by another artifact load as soon as it's added to the budget
+            return data
+
+    def evict(self) -> None:
+        # Called by the budget, without the artifact lock, as the budget is called by the artifacts loads
+        self._data = _NOT_LOADED
+        self._evicted = True
+
+    def __getstate__(self) -> dict:
+        # A snapshot keeps the loaded data, the lock and the budget are created again
+        state = dict(self.__dict__)
+        state.pop("_lock")
+        state["budget"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+ArtifactsMemoryInfo = namedtuple(
+    "ArtifactsMemoryInfo",
+    [
+        "budget",
+        "resident_bytes",
+        "resident_artifacts",
+        "evictions",
+        "reloads",
+        "reload_time",
+        "max_reload_time",
+    ],
+)
+
+
+class ArtifactsMemoryBudget:
+    """``ArtifactsMemoryBudget`` track the size of the loaded lazy artifacts, and evict the least recently used ones when the budget is exceeded"""
+
+    def __init__(self, budget: int) -> None:
+        """Init the ``ArtifactsMemoryBudget``.
+
+        Args:
+            budget (int): memory budget in bytes
+        """
+        self.budget = budget
+        # Loaded artifacts sizes, from the least to the most recently used
+        self._resident = OrderedDict()
+        self._resident_bytes = 0
+        self._evictions = 0
+        self._reloads = 0
+        self._reload_time = 0.0
+        self._max_reload_time = 0.0
+        self._reached = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_full(self) -> bool:
+        # Once reached, the budget stays full, as the loads evict artifacts to fit in it
+        return self._reached
+
+    def add(
+        self,
+        artifact: LazyArtifact,
+        size: int,
+        load_time: float = 0.0,
+        reload: bool = False,
+        prefetch: bool = False,
+    ) -> None:
+        with self._lock:
+            self._resident_bytes += size - self._resident.pop(artifact, 0)
+            self._resident[artifact] = size
+            if prefetch:
+                self._resident.move_to_end(artifact, last=False)
+            if self._resident_bytes >= self.budget:
+                self._reached = True
+            if reload:
+                self._reloads += 1
+                self._reload_time += load_time
+                self._max_reload_time = max(self._max_reload_time, load_time)
+
+            while self._resident_bytes > self.budget and len(self._resident) > 1:
+                evicted_artifact, evicted_size = self._resident.popitem(last=False)
+                evicted_artifact.evict()
+                self._resident_bytes -= evicted_size
+                self._evictions += 1
+                LOGGER.info(
+                    f"Evicted the artifact {evicted_artifact.dataset_name} ({evicted_size} bytes) to load {artifact.dataset_name} within the {self.budget} bytes memory budget"
+                )
+
+    def touch(self, artifact: LazyArtifact) -> None:
+        with self._lock:
+            if artifact in self._resident:
+                self._resident.move_to_end(artifact)
+
+    def remove(self, artifact: LazyArtifact) -> None:
+        with self._lock:
+            self._resident_bytes -= self._resident.pop(artifact, 0)
+
+    def info(self) -> ArtifactsMemoryInfo:
+        with self._lock:
+            return ArtifactsMemoryInfo(
+                self.budget,
+                self._resident_bytes,
+                len(self._resident),
+                self._evictions,
+                self._reloads,
+                self._reload_time,
+                self._max_reload_time,
+            )
+
+
+class LazyArtifactDataset(AbstractDataset):
+    """``LazyArtifactDataset`` is the read-only dataset of a lazy artifact in the compiled catalogs"""
+
+    def __init__(self, artifact: LazyArtifact) -> None:
+        self._artifact = artifact
+
+    def _load(self) -> Any:
+        return self._artifact.get()
+
+    def _save(self, data: Any) -> None:
+        raise DatasetError(
+            f"The lazy artifact {self._artifact.dataset_name} is read-only"
+        )
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            artifact=self._artifact.dataset_name, loaded=self._artifact.is_loaded
+        )
+
+    def _exists(self) -> bool:
+        return True
+
+    def _release(self) -> None:
+        # The artifact is shared by all the iterations
+        pass
+
+
+def prefetch_artifacts(
+    artifacts: Iterable[LazyArtifact],
+    workers: int = 1,
+    budget: Optional[ArtifactsMemoryBudget] = None,
+    wait: bool = False,
+    retries: int = 0,
+    retry_delay: float = 1.0,
+) -> None:
+    """Load lazy artifacts in the background, in order, with ``workers`` daemon threads.
+
+    Args:
+        artifacts (Iterable[LazyArtifact]): lazy artifacts ordered by priority
+        workers (int): number of prefetch threads
+        budget (ArtifactsMemoryBudget): memory budget of the artifacts, the prefetch stops once it's full
+        wait (bool): wait for the prefetch to complete
+        retries (int): number of retries of a failed artifact load. Default to 0
+        retry_delay (float): delay before the first retry of an artifact, in seconds, doubled at each retry. Default to 1.0
+    """
+    artifacts_queue = queue.Queue()
+    for artifact in artifacts:
+        artifacts_queue.put(artifact)
+
+    def prefetch() -> None:
+        while True:
+            if budget is not None and budget.is_full:
+                return
+            try:
+                artifact = artifacts_queue.get_nowait()
+            except queue.Empty:
+                return
+            for attempt in range(retries + 1):
+                if attempt:
+                    time.sleep(retry_delay * 2 ** (attempt - 1))
+                    if artifact.is_loaded:
+                        break
+                try:
+                    artifact.get(prefetch=True)
+                    break
+                except Exception as exc:
+                    LOGGER.warning(
+                        f"The prefetch of the lazy artifact {artifact.dataset_name} failed ({attempt + 1}/{retries + 1} attempts), it will be loaded at its first use: {exc}"
+                    )
+
+    prefetch_threads = [
+        threading.Thread(
+            target=prefetch, name=f"kedro-boot-prefetch-{index}", daemon=True
+        )
+        for index in range(min(workers, artifacts_queue.qsize()))
+    ]
+    for prefetch_thread in prefetch_threads:
+        prefetch_thread.start()
+    if wait:
+        for prefetch_thread in prefetch_threads:
+            prefetch_thread.join()
+
+
+class ArtifactsWatcher:
+    """``ArtifactsWatcher`` check the fingerprint of the artifacts sources at a regular interval, and refresh the changed artifacts"""
+
+    def __init__(
+        self,
+        get_fingerprints: Callable[[], Dict[str, str]],
+        refresh: Callable[[List[str]], Any],
+        interval: float,
+    ) -> None:
+        """Init the ``ArtifactsWatcher``.
+
+        Args:
+            get_fingerprints (Callable[[], Dict[str, str]]): get the fingerprint of each artifact source, indexed by dataset name
+            refresh (Callable[[List[str]], Any]): refresh artifacts given by dataset names
+            interval (float): interval between two checks, in seconds
+        """
+        self.get_fingerprints = get_fingerprints
+        self.refresh = refresh
+        self.interval = interval
+        self._fingerprints = {}
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        self._fingerprints = self.get_fingerprints()
+        self._start_thread()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def check(self) -> List[str]:
+        """Refresh the artifacts whose source changed since the last check.
+
+        Returns:
+            List[str]: refreshed artifacts names
+        """
+        refreshed_artifacts = []
+        for dataset_name, fingerprint in self.get_fingerprints().items():
+            if self._fingerprints.get(dataset_name) == fingerprint:
+                continue
+            try:
+                self.refresh([dataset_name])
+            except Exception as exc:
+                # The previous version is kept, the refresh is tried again at the next check
+                LOGGER.warning(
+                    f"The refresh of the artifact {dataset_name} failed: {exc}"
+                )
+                continue
+            self._fingerprints[dataset_name] = fingerprint
+            refreshed_artifacts.append(dataset_name)
+        return refreshed_artifacts
+
+    def _start_thread(self) -> None:
+        # The thread of a forked process is not alive, even if it was running in the parent process
+        if self._stopped.is_set() or (self._thread and self._thread.is_alive()):
+            return
+        self._thread = threading.Thread(
+            target=self._watch, name="kedro-boot-artifacts-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.check()
+            except Exception as exc:
+                LOGGER.warning(f"The artifacts check failed: {exc}")
+
+
+class ArtifactsManager:
+    """``ArtifactsManager`` materialize the artifacts of the compiled namespaces, and hold their state: load times, lazy artifacts, memory budget, deduplication and watcher"""
+
+    def __init__(self, catalog: Any, swap_artifact: Callable[[str, Any], None]) -> None:
+        """Init the ``ArtifactsManager``.
+
+        Args:
+            catalog (DataCatalog): kedro project catalog, reading the artifacts sources
+            swap_artifact (Callable[[str, Any], None]): swap an artifact dataset in the compiled catalogs, given its name and its new dataset
+        """
+        self.catalog = catalog
+        self.swap_artifact = swap_artifact
+        self.materialization_spec = MaterializationSpec()
+        # Artifacts datasets of each compiled namespace, indexed by namespace name
+        self._namespaces_artifacts = {}
+        # Load time of the materialized artifacts, in seconds, indexed by dataset name
+        self.load_times = {}
+        # Artifacts loaded at their first use or prefetched, with the 'lazy' materialization policy or under a memory budget
+        self._lazy_artifacts = {}
+        self._readiness = "all"
+        self._memory_budget = None
+        # Names of the deduplicated artifacts, mapped to the name of the artifact they share
+        self._aliases = {}
+        self._saved_bytes = 0
+        # Serialize the artifacts refreshes, so an artifact is swapped by one refresh at a time
+        self._refresh_lock = threading.Lock()
+        self._watcher = None
+
+    @property
+    def artifacts_names(self) -> List[str]:
+        return list(
+            dict.fromkeys(
+                dataset_name
+                for artifacts in self._namespaces_artifacts.values()
+                for dataset_name in artifacts
+            )
+        )
+
+    def materialize(
+        self,
+        namespaces_artifacts: Dict[str, Dict[str, Any]],
+        materialization_spec: Optional[MaterializationSpec] = None,
+    ) -> None:
+        """Materialize the artifacts datasets of the namespaces, then assign the materialized datasets back to the namespaces artifacts.
+
+        Args:
+            namespaces_artifacts (Dict[str, Dict[str, Any]]): artifacts datasets of each namespace, indexed by namespace name
+            materialization_spec (MaterializationSpec): How the artifacts datasets are materialized
+        """
+        self._namespaces_artifacts = namespaces_artifacts
+        all_artifacts_datasets = {}
+        for artifacts in namespaces_artifacts.values():
+            all_artifacts_datasets.update(artifacts)
+
+        materialization_spec = materialization_spec or MaterializationSpec()
+        self.materialization_spec = materialization_spec
+        self._memory_budget = (
+            ArtifactsMemoryBudget(materialization_spec.memory_budget)
+            if materialization_spec.memory_budget
+            else None
+        )
+        source_aliases = {}
+        if materialization_spec.deduplication != "off":
+            # The artifacts datasets of different names reading the same source are materialized once
+            source_aliases = deduplicate_artifacts(all_artifacts_datasets, source_key)
+            for alias in source_aliases:
+                all_artifacts_datasets.pop(alias)
+
+        lazy_artifacts_datasets = {}
+        if materialization_spec.policy == "lazy" or self._memory_budget:
+            # Only the artifacts of the critical namespaces are loaded at compile time. Under a memory budget, the others are lazy artifacts that can be evicted
+            critical_artifacts = set()
+            for namespace_name, artifacts in namespaces_artifacts.items():
+                if namespace_name in materialization_spec.critical_namespaces:
+                    critical_artifacts.update(
+                        source_aliases.get(dataset_name, dataset_name)
+                        for dataset_name in artifacts
+                    )
+            lazy_artifacts_datasets = {
+                dataset_name: dataset_value
+                for dataset_name, dataset_value in all_artifacts_datasets.items()
+                if dataset_name not in critical_artifacts
+            }
+            all_artifacts_datasets = {
+                dataset_name: dataset_value
+                for dataset_name, dataset_value in all_artifacts_datasets.items()
+                if dataset_name in critical_artifacts
+            }
+
+        # The artifacts are loaded concurrently, so the cold start is bounded by the slowest artifact
+        start_time = time.perf_counter()
+        loaded_artifacts = load_artifacts(
+            all_artifacts_datasets,
+            executor=materialization_spec.executor,
+            workers=materialization_spec.workers,
+            timeout=materialization_spec.timeout,
+            store_dir=materialization_spec.store_dir,
+        )
+        materialization_time = time.perf_counter() - start_time
+
+        content_aliases = {}
+        if materialization_spec.deduplication == "content":
+            # The artifacts loaded with the same content are kept once, the duplicates are released
+            content_aliases = deduplicate_artifacts(
+                {
+                    dataset_name: data
+                    for dataset_name, (data, _) in loaded_artifacts.items()
+                },
+                content_key,
+            )
+            for alias in content_aliases:
+                loaded_artifacts.pop(alias)
+
+        materialized_artifacts = {}
+        self.load_times = {}
+        for dataset_name, (data, load_time) in loaded_artifacts.items():
+            materialized_artifacts[dataset_name] = MemoryDataset(
+                data, copy_mode="assign"
+            )
+            self.load_times[dataset_name] = load_time
+
+        self._lazy_artifacts = {}
+        for dataset_name, dataset_value in lazy_artifacts_datasets.items():
+            self._lazy_artifacts[dataset_name] = LazyArtifact(
+                dataset_name,
+                dataset_value,
+                materialization_spec.store_dir,
+                budget=self._memory_budget,
+            )
+            materialized_artifacts[dataset_name] = LazyArtifactDataset(
+                self._lazy_artifacts[dataset_name]
+            )
+
+        # The duplicates share the dataset of their materialized artifact
+        artifacts_aliases = {
+            alias: content_aliases.get(dataset_name, dataset_name)
+            for alias, dataset_name in source_aliases.items()
+        }
+        artifacts_aliases.update(content_aliases)
+        for alias, dataset_name in artifacts_aliases.items():
+            materialized_artifacts[alias] = materialized_artifacts[dataset_name]
+
+        if loaded_artifacts:
+            LOGGER.info(
+                "artifacts materialization completed in %.3fs with %s %s workers. Here is the load time of each artifact:\n%s",
+                materialization_time,
+                materialization_spec.workers,
+                materialization_spec.executor,
+                "\n".join(
+                    f"  - {dataset_name}: {load_time:.3f}s"
+                    for dataset_name, load_time in sorted(
+                        self.load_times.items(),
+                        key=lambda item: item[1],
+                        reverse=True,
+                    )
+                ),
+            )
+        if self._lazy_artifacts:
+            LOGGER.info(
+                f"These artifacts are loaded lazily, at their first use{' or by the background prefetch' if materialization_spec.prefetch else ''}: {set(self._lazy_artifacts)}"
+            )
+
+        for artifacts in namespaces_artifacts.values():
+            for dataset_name in artifacts:
+                artifacts[dataset_name] = materialized_artifacts[dataset_name]
+
+        self._index_aliases()
+        self._readiness = materialization_spec.readiness
+        if materialization_spec.policy == "eager":
+            # Under a memory budget, the eager policy loads the lazy artifacts at compile time until the budget is full
+            self._prefetch(wait=True)
+
+    def collect(
+        self,
+        namespaces_artifacts: Dict[str, Dict[str, Any]],
+        load_times: Dict[str, float],
+        materialization_spec: Optional[MaterializationSpec] = None,
+    ) -> None:
+        """Collect the artifacts of namespaces materialized by a previous compilation (ex: loaded from a compiled snapshot).
+
+        Args:
+            namespaces_artifacts (Dict[str, Dict[str, Any]]): materialized artifacts datasets of each namespace, indexed by namespace name
+            load_times (Dict[str, float]): load time of the artifacts materialized at compile time, indexed by dataset name
+            materialization_spec (MaterializationSpec): How the artifacts datasets are materialized
+        """
+        self._namespaces_artifacts = namespaces_artifacts
+        self.load_times = load_times
+        materialization_spec = materialization_spec or MaterializationSpec()
+        self.materialization_spec = materialization_spec
+        # The deduplicated artifacts share the lazy artifact of their materialized name
+        self._lazy_artifacts = {
+            dataset_value._artifact.dataset_name: dataset_value._artifact
+            for artifacts in namespaces_artifacts.values()
+            for dataset_value in artifacts.values()
+            if isinstance(dataset_value, LazyArtifactDataset)
+        }
+        self._index_aliases()
+        self._memory_budget = (
+            ArtifactsMemoryBudget(materialization_spec.memory_budget)
+            if materialization_spec.memory_budget
+            else None
+        )
+        for lazy_artifact in self._lazy_artifacts.values():
+            lazy_artifact.budget = self._memory_budget
+            if self._memory_budget and lazy_artifact.is_loaded:
+                self._memory_budget.add(
+                    lazy_artifact, measure_size(lazy_artifact.get())
+                )
+        self._readiness = materialization_spec.readiness
+        if materialization_spec.policy == "eager":
+            # Under a memory budget, the eager policy loads the lazy artifacts at compile time until the budget is full
+            self._prefetch(wait=True)
+
+    def refresh(self, dataset_names: Optional[List[str]] = None) -> List[str]:
+        """Load the current version of artifacts from the project catalog, then swap them in the compiled catalogs.
+
+        Args:
+            dataset_names (List[str]): artifacts datasets names. Default to None, all the artifacts
+
+        Returns:
+            List[str]: refreshed artifacts names
+        """
+        artifacts_names = self.artifacts_names
+        # The artifacts sharing a materialized artifact, indexed by its name
+        shared_artifacts = {}
+        for artifact_name in artifacts_names:
+            shared_artifacts.setdefault(
+                self._aliases.get(artifact_name, artifact_name), []
+            ).append(artifact_name)
+        # The source of each artifact is fingerprinted once per refresh
+        artifacts_sources = {}
+        refreshed_artifacts = []
+        with self._refresh_lock:
+            for dataset_name in dataset_names or artifacts_names:
+                if dataset_name in refreshed_artifacts:
+                    continue
+                dataset = self.catalog._get_dataset(dataset_name)
+                # Versioned datasets cache their latest version
+                version_cache = getattr(dataset, "_version_cache", None)
+                if version_cache is not None:
+                    version_cache.clear()
+
+                # The deduplicated artifacts reading the same source are refreshed together, so they keep sharing the artifact
+                materialized_name = self._aliases.get(dataset_name, dataset_name)
+                shared_names = [dataset_name]
+                if len(shared_artifacts[materialized_name]) > 1:
+                    artifacts_sources[dataset_name] = source_key(dataset)
+                    for artifact_name in shared_artifacts[materialized_name]:
+                        if artifact_name not in artifacts_sources:
+                            artifacts_sources[artifact_name] = source_key(
+                                self.catalog._get_dataset(artifact_name)
+                            )
+                    shared_names = [
+                        artifact_name
+                        for artifact_name in shared_artifacts[materialized_name]
+                        if artifact_name == dataset_name
+                        or artifacts_sources[dataset_name] is not None
+                        and artifacts_sources[artifact_name]
+                        == artifacts_sources[dataset_name]
+                    ]
+                refreshed_name = shared_names[0]
+
+                lazy_artifact = self._lazy_artifacts.get(materialized_name)
+                if lazy_artifact is not None:
+                    refreshed_artifact = LazyArtifact(
+                        refreshed_name,
+                        dataset,
+                        self.materialization_spec.store_dir,
+                        budget=self._memory_budget,
+                    )
+                    # A loaded artifact is loaded again before the swap, otherwise the new version is loaded at its first use
+                    if lazy_artifact.is_loaded:
+                        refreshed_artifact.get()
+                        LOGGER.info(
+                            f"Artifact {dataset_name} reloaded in {refreshed_artifact.load_time:.3f}s"
+                        )
+                    if self._memory_budget:
+                        self._memory_budget.remove(lazy_artifact)
+                    self._lazy_artifacts.pop(materialized_name)
+                    self._lazy_artifacts[refreshed_name] = refreshed_artifact
+                    refreshed_dataset = LazyArtifactDataset(refreshed_artifact)
+                else:
+                    artifact, load_time = load_artifact(
+                        dataset_name, dataset, self.materialization_spec.store_dir
+                    )
+                    refreshed_dataset = MemoryDataset(
+                        map_artifact(artifact), copy_mode="assign"
+                    )
+                    self.load_times[refreshed_name] = load_time
+                    LOGGER.info(f"Artifact {dataset_name} reloaded in {load_time:.3f}s")
+
+                for shared_name in shared_names:
+                    self.swap_artifact(shared_name, refreshed_dataset)
+                refreshed_artifacts.extend(shared_names)
+
+            if self._aliases:
+                self._index_aliases()
+
+        return refreshed_artifacts
+
+    def start_background_tasks(self) -> None:
+        """Start the background tasks of the artifacts: the prefetch of the lazy artifacts, and the artifacts watcher."""
+        if (
+            self.materialization_spec.policy == "lazy"
+            and self.materialization_spec.prefetch
+        ):
+            self._prefetch(wait=False)
+        self.watch()
+
+    def watch(self) -> None:
+        """Start the artifacts watcher, if the materialization spec has a watch interval"""
+        self.stop_watching()
+        watch_interval = self.materialization_spec.watch_interval
+        if not watch_interval:
+            return
+
+        self._watcher = ArtifactsWatcher(
+            get_fingerprints=self.get_fingerprints,
+            refresh=self.refresh,
+            interval=watch_interval,
+        )
+        self._watcher.start()
+        LOGGER.info(
+            f"The artifacts files are checked every {watch_interval}s, the changed artifacts are reloaded in the background"
+        )
+
+    def stop_watching(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def get_fingerprints(self) -> Dict[str, str]:
+        fingerprints = {}
+        for dataset_name in self.artifacts_names:
+            try:
+                fingerprints[dataset_name] = artifact_key(
+                    dataset_name, self.catalog._get_dataset(dataset_name)
+                )
+            except ArtifactSourceError as exc:
+                # The artifact is checked again at the next fingerprinting
+                LOGGER.warning(f"{dataset_name} changes can't be checked: {exc}")
+        return fingerprints
+
+    def get_load_times(self) -> Dict[str, float]:
+        artifacts_load_times = dict(self.load_times)
+        for dataset_name, lazy_artifact in self._lazy_artifacts.items():
+            if lazy_artifact.is_loaded and lazy_artifact.load_time is not None:
+                artifacts_load_times[dataset_name] = lazy_artifact.load_time
+        return artifacts_load_times
+
+    def get_deduplication(self) -> ArtifactsDeduplication:
+        return ArtifactsDeduplication(dict(self._aliases), self._saved_bytes)
+
+    def get_memory_info(self) -> ArtifactsMemoryInfo:
+        if self._memory_budget is None:
+            return ArtifactsMemoryInfo(None, 0, 0, 0, 0, 0.0, 0.0)
+        return self._memory_budget.info()
+
+    def get_readiness(self) -> ArtifactsReadiness:
+        loaded_lazy_artifacts = sum(
+            lazy_artifact.is_loaded for lazy_artifact in self._lazy_artifacts.values()
+        )
+        eager_artifacts = len(self.load_times)
+        return ArtifactsReadiness(
+            ready=self._readiness == "critical"
+            or loaded_lazy_artifacts == len(self._lazy_artifacts)
+            or bool(self._memory_budget and self._memory_budget.is_full),
+            loaded_artifacts=eager_artifacts + loaded_lazy_artifacts,
+            artifacts=eager_artifacts + len(self._lazy_artifacts),
+            failed_artifacts={
+                dataset_name: lazy_artifact.load_error
+                for dataset_name, lazy_artifact in self._lazy_artifacts.items()
+                if lazy_artifact.load_error is not None and not lazy_artifact.is_loaded
+            },
+        )
+
+    def _index_aliases(self) -> None:
+        # The deduplicated artifacts share the same materialized dataset in the compiled catalogs
+        materialized_names = {}
+        self._aliases = {}
+        self._saved_bytes = 0
+        for artifacts in self._namespaces_artifacts.values():
+            for dataset_name, dataset_value in artifacts.items():
+                materialized_name = materialized_names.setdefault(
+                    id(dataset_value), dataset_name
+                )
+                if materialized_name == dataset_name or dataset_name in self._aliases:
+                    continue
+                self._aliases[dataset_name] = materialized_name
+                if isinstance(dataset_value, MemoryDataset):
+                    self._saved_bytes += measure_size(dataset_value._data)
+
+        if self._aliases:
+            LOGGER.info(
+                "%s artifacts are deduplicated, saving %.1f MB of artifacts materialized at compile time. They share the artifact:\n%s",
+                len(self._aliases),
+                self._saved_bytes / 2**20,
+                "\n".join(
+                    f"  - {alias}: {dataset_name}"
+                    for alias, dataset_name in self._aliases.items()
+                ),
+            )
+
+    def _prefetch(self, wait: bool) -> None:
+        materialization_spec = self.materialization_spec
+        if not self._lazy_artifacts:
+            return
+
+        # The artifacts of the namespaces with the most expected traffic are prefetched first
+        prefetch_namespaces = list(materialization_spec.prefetch_order) + [
+            namespace_name
+            for namespace_name in self._namespaces_artifacts
+            if namespace_name not in materialization_spec.prefetch_order
+        ]
+        prefetched_artifacts = {}
+        for namespace_name in prefetch_namespaces:
+            artifacts = self._namespaces_artifacts.get(namespace_name)
+            if artifacts is None:
+                LOGGER.warning(
+                    f"The namespace '{namespace_name}' of the prefetch order is not compiled"
+                )
+                continue
+            for dataset_name in artifacts:
+                lazy_artifact = self._lazy_artifacts.get(dataset_name)
+                if lazy_artifact is not None and not lazy_artifact.is_loaded:
+                    prefetched_artifacts.setdefault(dataset_name, lazy_artifact)
+
+        prefetch_artifacts(
+            prefetched_artifacts.values(),
+            workers=materialization_spec.workers,
+            budget=self._memory_budget,
+            wait=wait,
+            retries=PREFETCH_RETRIES,
+            retry_delay=PREFETCH_RETRY_DELAY,
+        )
+
+
+def artifact_key(dataset_name: str, dataset: Any) -> str:
+    """Fingerprint an artifact dataset: its name, class, description and the stat of its source file, if any.
+
+    Raises:
+        ArtifactSourceError: the source file of the dataset can't be stat'ed
+    """
+    fingerprint = [
+        dataset_name,
+        f"{dataset.__class__.__module__}.{dataset.__class__.__qualname__}",
+        str(getattr(dataset, "_describe", lambda: {})()),
+    ]
+    dataset_source_stat = source_stat(dataset)
+    if dataset_source_stat is not None:
+        fingerprint.append(dataset_source_stat)
+
+    digest = hashlib.sha256("\n".join(fingerprint).encode()).hexdigest()[:16]
+    safe_name = "".join(
+        char if char.isalnum() or char in "-_" else "_" for char in dataset_name
+    )
+    return f"{safe_name}-{digest}"
+
+
+def source_stat(dataset: Any) -> Optional[str]:
+    """Stat the source file of an artifact dataset through its fsspec filesystem, local or remote (S3, GCS, ABFS, ...).
+
+    Args:
+        dataset (Any): artifact dataset
+
+    Raises:
+        ArtifactSourceError: the source file can't be stat'ed
+
+    Returns:
+        Optional[str]: the version fields of the source file info (etag, modification time, size, ...), "missing" if the file is not written yet, None if the dataset doesn't read a file
+    """
+    filepath = getattr(dataset, "_filepath", None)
+    if filepath is None:
+        return None
+
+    try:
+        # Versioned datasets read the file of their load version
+        if getattr(dataset, "_version", None) is not None:
+            filepath = dataset._get_load_path()
+        protocol = getattr(dataset, "_protocol", None)
+        if protocol is None:
+            protocol, filepath = get_protocol_and_path(str(filepath))
+        filesystem = getattr(dataset, "_fs", None) or fsspec.filesystem(protocol)
+        file_info = filesystem.info(get_filepath_str(PurePosixPath(filepath), protocol))
+    except (FileNotFoundError, VersionNotFoundError):
+        # Not written yet (ex: the pipeline outputs)
+        return "missing"
+    except Exception as exc:
+        raise ArtifactSourceError(
+            f"The source {filepath} of the artifact can't be stat'ed: {exc}"
+        ) from exc
+
+    version_fields = {
+        field: file_info[field] for field in _SOURCE_STAT_FIELDS if field in file_info
+    }
+    if not version_fields:
+        raise ArtifactSourceError(
+            f"The info of the source {filepath} of the artifact doesn't tell its version"
+        )
+    return json.dumps(version_fields, sort_keys=True, default=str)
+
+
+def source_key(dataset: Any) -> Optional[str]:
+    """Fingerprint the source read by an artifact dataset and its whole load config.
+
+    Args:
+        dataset (Any): artifact dataset
+
+    Returns:
+        Optional[str]: source fingerprint, None if the dataset doesn't read a file (ex: in-memory datasets)
+    """
+    filepath = getattr(dataset, "_filepath", None)
+    if filepath is None:
+        return None
+
+    load_version = None
+    if getattr(dataset, "_version", None) is not None:
+        try:
+            load_version = dataset.resolve_load_version()
+        except Exception:
+            load_version = dataset._version.load
+
+    source = dict(
+        dataset_type=f"{dataset.__class__.__module__}.{dataset.__class__.__qualname__}",
+        description=getattr(dataset, "_describe", lambda: {})(),
+        filepath=str(filepath),
+        load_version=load_version,
+        credentials=(getattr(dataset, "_init_args", None) or {}).get("credentials"),
+        storage_options=getattr(getattr(dataset, "_fs", None), "storage_options", None),
+        **{
+            load_attribute: getattr(dataset, load_attribute, None)
+            for load_attribute in _SOURCE_LOAD_ATTRIBUTES
+        },
+    )
+    return hashlib.sha256(
+        json.dumps(source, sort_keys=True, default=repr).encode()
+    ).hexdigest()
+
+
+def content_key(data: Any) -> Optional[str]:
+    """Fingerprint the content of a loaded artifact, by hashing its pickled form.
+
+    Args:
+        data (Any): artifact data
+
+    Returns:
+        Optional[str]: content fingerprint, None if the artifact can't be pickled
+    """
+    hasher = _BytesHasher()
+    try:
+        pickle.Pickler(hasher, protocol=5, buffer_callback=hasher.add_buffer).dump(data)
+    except Exception:
+        return None
+    return hasher.hexdigest()
+
+
+def deduplicate_artifacts(
+    artifacts: Dict[str, Any], key: Callable[[Any], Optional[str]]
+) -> Dict[str, str]:
+    """Find the artifacts sharing the same fingerprint.
+
+    Args:
+        artifacts (Dict[str, Any]): artifacts datasets or data indexed by name
+        key (Callable[[Any], Optional[str]]): fingerprint of an artifact, None if it can't be deduplicated
+
+    Returns:
+        Dict[str, str]: name of the materialized artifact, indexed by the name of its duplicates
+    """
+    materialized_names = {}
+    aliases = {}
+    for artifact_name, artifact in artifacts.items():
+        artifact_fingerprint = key(artifact)
+        if artifact_fingerprint is None:
+            continue
+        materialized_name = materialized_names.setdefault(
+            artifact_fingerprint, artifact_name
+        )
+        if materialized_name != artifact_name:
+            aliases[artifact_name] = materialized_name
+    return aliases
+
+
+class _BytesHasher:
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self._hash.update(data)
+        return len(data)
+
+    def add_buffer(self, buffer: pickle.PickleBuffer) -> bool:
+        try:
+            raw_buffer = buffer.raw()
+        except BufferError:
+            # Non contiguous buffers are pickled in-band
+            return True
+        # The buffers are hashed apart from the pickle stream, so their length delimits them
+        self._hash.update(b"buffer:%d:" % raw_buffer.nbytes)
+        self._hash.update(raw_buffer)
+        return False
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def mappable_format(data: Any) -> Optional[str]:
+    """Get the store format of an artifact, None if it can't be memory mapped"""
+    np = sys.modules.get("numpy")
+    if np is not None and type(data) is np.ndarray:
+        return NUMPY_FORMAT if data.dtype.kind in _MAPPABLE_DTYPE_KINDS else None
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and type(data) is pd.DataFrame:
+        return PANDAS_FORMAT
+
+    pa = sys.modules.get("pyarrow")
+    if pa is not None and isinstance(data, pa.Table):
+        return ARROW_FORMAT
+
+    return None
+
+
+def write_artifact(data: Any, stored_path: Path, artifact_format: str) -> None:
+    """Write an artifact in the store, through a temporary path"""
+    tmp_path = Path(
+        tempfile.mkdtemp(prefix=f".{stored_path.name}-", dir=stored_path.parent)
+    )
+    if artifact_format == NUMPY_FORMAT:
+        import numpy as np
+
+        tmp_file = tmp_path / "data.npy"
+        np.save(tmp_file, data, allow_pickle=False)
+        os.replace(tmp_file, stored_path)
+        tmp_path.rmdir()
+
+    elif artifact_format == PANDAS_FORMAT:
+        import numpy as np
+
+        mapped_columns = []
+        for position in range(data.shape[1]):
+            column = data.iloc[:, position]
+            if (
+                isinstance(column.dtype, np.dtype)
+                and column.dtype.kind in _MAPPABLE_DTYPE_KINDS
+            ):
+                np.save(
+                    tmp_path / f"{position}.npy", column.to_numpy(), allow_pickle=False
+                )
+                mapped_columns.append(position)
+        metadata = dict(
+            columns=data.columns,
+            index=data.index,
+            mapped_columns=mapped_columns,
+            pickled_columns=data.iloc[
+                :,
+                [
+                    position
+                    for position in range(data.shape[1])
+                    if position not in mapped_columns
+                ],
+            ],
+        )
+        with open(tmp_path / "metadata.pkl", "wb") as metadata_file:
+            pickle.dump(metadata, metadata_file, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            os.replace(tmp_path, stored_path)
+        except OSError:
+            # Another process stored the artifact first
+            _remove_dir(tmp_path)
+
+    elif artifact_format == ARROW_FORMAT:
+        import pyarrow as pa
+
+        tmp_file = tmp_path / "data.arrow"
+        with pa.OSFile(str(tmp_file), "wb") as sink:
+            with pa.ipc.new_file(sink, data.schema) as writer:
+                writer.write_table(data)
+        os.replace(tmp_file, stored_path)
+        tmp_path.rmdir()
+
+
+def read_artifact(stored_path: Path, artifact_format: str) -> Any:
+    """Memory map a stored artifact read-only"""
+    if artifact_format == NUMPY_FORMAT:
+        import numpy as np
+
+        return np.load(stored_path, mmap_mode="r", allow_pickle=False)
+
+    if artifact_format == PANDAS_FORMAT:
+        import numpy as np
+        import pandas as pd
+
+        with open(stored_path / "metadata.pkl", "rb") as metadata_file:
+            metadata = pickle.load(metadata_file)
+        pickled_columns = iter(
+            metadata["pickled_columns"].iloc[:, position]
+            for position in range(metadata["pickled_columns"].shape[1])
+        )
+        columns = {}
+        for position in range(len(metadata["columns"])):
+            if position in metadata["mapped_columns"]:
+                columns[position] = np.load(
+                    stored_path / f"{position}.npy", mmap_mode="r", allow_pickle=False
+                )
+            else:
+                columns[position] = next(pickled_columns).array
+        # The columns are not copied, so the DataFrame blocks are the mapped arrays
+        data = pd.DataFrame(columns, index=metadata["index"], copy=False)
+        data.columns = metadata["columns"]
+        return data
+
+    if artifact_format == ARROW_FORMAT:
+        import pyarrow as pa
+
+        # The memory map is kept open, as the table buffers point to it
+        source = pa.memory_map(str(stored_path), "r")
+        return pa.ipc.open_file(source).read_all()
+
+    raise ValueError(f"Unknown artifact format: {artifact_format}")
+
+
+def _remove_dir(path: Path) -> None:
+    for child in path.iterdir():
+        child.unlink()
+    path.rmdir()
+
+
+class ArtifactMaterializationError(Exception):
+    """Error raised in artifacts materialization operations"""
+
+
+class ArtifactSourceError(ArtifactMaterializationError):
+    """Error raised when the source file of an artifact can't be stat'ed, so its changes can't be detected"""
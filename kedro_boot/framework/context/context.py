@@ -1,27 +1,54 @@
 """"``KedroBootContext`` provides context for the kedro boot project."""
 import logging
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from kedro.io import DataCatalog
 
 from kedro.pipeline.pipeline import Pipeline
-from kedro.io import MemoryDataset
+from kedro.runner import AbstractRunner, ThreadRunner
 from kedro_boot.utils import find_duplicates
 
 from kedro_boot.framework.compiler.compiler import (
+    compile_base_datasets,
+    compile_runner,
+    compile_slot_datasets,
     compile_with_all_pipeline_outputs,
     compile_with_pipeline_inputs,
 )
 from kedro_boot.framework.renderer.renderer import (
-    render_datasets,
+    check_template_params,
+    render_slot_datasets,
     render_input_datasets,
     render_parameter_datasets,
     render_template_datasets,
 )
+from kedro_boot.framework.compiler.executor import CompiledPipelineExecutor
+from kedro_boot.framework.context.artifacts import (
+    ArtifactsDeduplication,
+    ArtifactsManager,
+    ArtifactsMemoryInfo,
+    ArtifactsReadiness,
+    ArtifactSourceError,
+)
+from kedro_boot.framework.context.snapshot import (
+    compute_fingerprint,
+    load_snapshot,
+    save_snapshot,
+)
+from kedro_boot.framework.renderer.catalog import LayeredDataCatalog, freeze_datasets
+from kedro_boot.framework.renderer.plan import (
+    DATA_HOLDING_DATASETS,
+    ParameterRenderPlan,
+    TemplateCacheInfo,
+    TemplateRenderPlan,
+)
 from kedro_boot.framework.compiler.specs import (
     CompilationSpec,
-    filter_pipeline,
+    MaterializationSpec,
+    index_pipeline_namespaces,
     namespace_dataset_name,
+    resolve_copy_modes,
+    validate_copy_mode,
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -40,16 +67,57 @@ class KedroBootContext:
         self.catalog = catalog
 
         self._namespaces_registry = {}
+        self._artifacts = ArtifactsManager(catalog, self.swap_artifact)
 
-    def compile(self, compilation_specs: List[CompilationSpec] = None) -> None:
+    def compile(
+        self,
+        compilation_specs: List[CompilationSpec] = None,
+        materialization_spec: Optional[MaterializationSpec] = None,
+        snapshot_path: Optional[str] = None,
+        start_background_tasks: bool = True,
+    ) -> None:
         """Prepare kedro's resources for iteration time by creating a namespace registry indexed by namespaces that contains the corresponding pipelines and catalogs pré-materialized and organized by dataset categories according to their relevance to the application
 
         Args:
             compilation_specs (List[CompilationSpec]): Compilation Specs provided by the App. compilation_specs are infered from the pipeline if no compilation_specs provided.
+            materialization_spec (MaterializationSpec): How the artifacts datasets are materialized. Default to loading them in the process memory.
+            snapshot_path (str): Compiled snapshot file, loaded if it matches the compilation, written otherwise. Default to None, no snapshot
+            start_background_tasks (bool): Start the artifacts background tasks (prefetch and watcher) once compiled. Default to True
         """
 
+        fingerprint = None
+        if snapshot_path:
+            try:
+                fingerprint = compute_fingerprint(
+                    self.pipeline, self.catalog, compilation_specs, materialization_spec
+                )
+            except ArtifactSourceError as exc:
+                # The snapshot could hold a stale version of the artifact
+                LOGGER.warning(
+                    f"The compiled snapshot {snapshot_path} is not used: {exc}"
+                )
+                snapshot_path = None
+        if snapshot_path:
+            snapshot = load_snapshot(snapshot_path, fingerprint, self.catalog)
+            if snapshot:
+                self._namespaces_registry = snapshot["namespaces_registry"]
+                self.freeze_base_catalogs()
+                self._artifacts.collect(
+                    self.get_namespaces_artifacts(),
+                    snapshot["artifacts_load_times"],
+                    materialization_spec,
+                )
+                LOGGER.info(
+                    f"Catalog compilation loaded from the compiled snapshot {snapshot_path}"
+                )
+                if start_background_tasks:
+                    self._artifacts.start_background_tasks()
+                return
+
+        # Each namespace pipeline is filtered once, for both the specs inference and the compilation
+        namespaces_pipelines = index_pipeline_namespaces(self.pipeline)
         infered_compilation_specs = CompilationSpec.infer_compilation_specs(
-            self.pipeline
+            self.pipeline, namespaces_pipelines
         )
 
         if compilation_specs:
@@ -90,9 +158,7 @@ class KedroBootContext:
             compilation_specs = infered_compilation_specs
 
         for compilation_spec in compilation_specs:
-            pipeline = filter_pipeline(
-                pipeline=self.pipeline, namespace=compilation_spec.namespace
-            )
+            pipeline = namespaces_pipelines[compilation_spec.namespace]
             # if not pipeline.nodes:
             #     raise KedroBootContextError(f"The {compilation_spec.namespace} namespace contains no nodes")
 
@@ -117,6 +183,15 @@ class KedroBootContext:
                     f"These parameters datasets {remaining_parameters_specs} given in {compilation_spec.namespace} namespace specs, does not exists in pipeline parameters."
                 )
 
+            if isinstance(compilation_spec.copy_mode, dict):
+                remaining_copy_mode_inputs = set(compilation_spec.copy_mode) - set(
+                    compilation_spec.inputs
+                )
+                if remaining_copy_mode_inputs:
+                    raise KedroBootContextError(
+                        f"These inputs datasets {remaining_copy_mode_inputs} given in {compilation_spec.namespace} spec copy modes, are not inputs of the spec."
+                    )
+
             catalog_assembly_with_inputs = compile_with_pipeline_inputs(
                 pipeline_inputs=pipeline_inputs,
                 compilation_spec=compilation_spec,
@@ -159,38 +234,130 @@ class KedroBootContext:
                 set(catalog_assembly.templates),
             )
 
+            runner_name, runner_workers = compile_runner(
+                pipeline,
+                compilation_spec.runner,
+                compilation_spec.runner_workers,
+                io_datasets=[
+                    dataset_name
+                    for dataset_name, dataset in {
+                        **catalog_assembly.outputs,
+                        **catalog_assembly.unmanaged,
+                        **catalog_assembly.templates,
+                    }.items()
+                    if not isinstance(dataset, DATA_HOLDING_DATASETS)
+                ],
+            )
+            if compilation_spec.runner == "auto":
+                LOGGER.info(
+                    f"The '{runner_name}' runner is selected for the namespace '{compilation_spec.namespace}'"
+                )
+
+            executor = None
+            runner = None
+            if runner_name == "compiled":
+                executor = CompiledPipelineExecutor(
+                    pipeline, protected_datasets=list(catalog_assembly.outputs)
+                )
+            elif runner_name == "thread":
+                runner = ThreadRunner(max_workers=runner_workers)
+
             self._namespaces_registry[compilation_spec.namespace] = dict(
-                pipeline=pipeline, catalog=catalog_assembly, spec=compilation_spec
+                pipeline=pipeline,
+                catalog=catalog_assembly,
+                spec=compilation_spec,
+                template_plan=TemplateRenderPlan(
+                    catalog_assembly.templates,
+                    cache_size=compilation_spec.template_cache_size,
+                ),
+                parameter_plan=ParameterRenderPlan(catalog_assembly.parameters),
+                copy_modes=resolve_copy_modes(
+                    compilation_spec.inputs,
+                    compilation_spec.namespace,
+                    compilation_spec.copy_mode,
+                ),
+                executor=executor,
+                runner=runner,
             )
 
         LOGGER.info("Loading artifacts datasets as MemoryDataset ...")
-        self.materialize_artifacts()
+        self._artifacts.materialize(
+            self.get_namespaces_artifacts(), materialization_spec
+        )
+
+        self.freeze_base_catalogs()
 
         LOGGER.info("Catalog compilation completed.")
 
-    def materialize_artifacts(self):
-        # Materialize the artifact dataset by loading them as memory in the compilation process. Here we merge all the artifact datasets (cross namespaces) so we can load once an artifact that is shared between two dataset in two different namespaces
-        all_artifacts_datasets = {}
-        # Merge all artifact datasets cross namespaces/specs
-        for namespace in self._namespaces_registry.values():
-            all_artifacts_datasets.update(namespace["catalog"].artifacts)
-
-        # Materialized thoses artifact datasets in all_materialized_artifact_datasets
-        all_materialized_artifact_datasets = {}
-        for dataset_name, dataset_value in all_artifacts_datasets.items():
-            LOGGER.info(f"Loading {dataset_name} as a MemoryDataset")
-            all_materialized_artifact_datasets[
-                dataset_name
-            ] = MemoryDataset(  # Add Logging fro this operation
-                dataset_value.load(), copy_mode="assign"
+        if snapshot_path:
+            self.save_snapshot(snapshot_path, fingerprint)
+
+        if start_background_tasks:
+            self._artifacts.start_background_tasks()
+
+    def start_artifacts_background_tasks(self) -> None:
+        self._artifacts.start_background_tasks()
+
+    def save_snapshot(self, snapshot_path: str, fingerprint: str) -> None:
+        try:
+            save_snapshot(
+                snapshot_path,
+                fingerprint,
+                self._namespaces_registry,
+                self._artifacts.load_times,
+                self.catalog,
+            )
+        except Exception as exc:
+            # The app keeps running with its compiled catalog, the next processes will compile it again
+            LOGGER.warning(
+                f"The compiled snapshot could not be written at {snapshot_path}: {exc}"
+            )
+        else:
+            LOGGER.info(f"Compiled snapshot written at {snapshot_path}")
+
+    def get_namespaces_artifacts(self) -> Dict[str, Dict[str, Any]]:
+        # The artifacts dicts of the catalog assemblies, where the materialized artifacts are assigned and swapped
+        return {
+            namespace_name: namespace["catalog"].artifacts
+            for namespace_name, namespace in self._namespaces_registry.items()
+        }
+
+    def refresh_artifacts(self, dataset_names: Optional[List[str]] = None) -> List[str]:
+        """Load the current version of artifacts from the project catalog, then swap them in the compiled catalogs.
+
+        Args:
+            dataset_names (List[str]): artifacts datasets names. Default to None, all the artifacts
+
+        Raises:
+            KedroBootContextError: unknown artifact
+
+        Returns:
+            List[str]: refreshed artifacts names
+        """
+        artifacts_names = self._artifacts.artifacts_names
+        unknown_artifacts = set(dataset_names or []) - set(artifacts_names)
+        if unknown_artifacts:
+            raise KedroBootContextError(
+                f"These datasets {unknown_artifacts} are not artifacts of the compiled namespaces. The artifacts are {set(artifacts_names)}"
             )
+        return self._artifacts.refresh(dataset_names)
 
-        # Assign the materialized artifact back to namespace/spec artifact datasets
+    def swap_artifact(self, dataset_name: str, dataset: Any) -> None:
+        # The iterations read the base catalog of their namespace once, so replacing it swap the artifact atomically between two iterations
         for namespace in self._namespaces_registry.values():
-            for dataset_name in namespace["catalog"].artifacts:
-                namespace["catalog"].artifacts[
-                    dataset_name
-                ] = all_materialized_artifact_datasets[dataset_name]
+            if dataset_name in namespace["catalog"].artifacts:
+                namespace["catalog"].artifacts[dataset_name] = dataset
+                namespace["base_catalog"] = freeze_datasets(
+                    {**namespace["base_catalog"], dataset_name: dataset}
+                )
+
+    def freeze_base_catalogs(self):
+        # Freeze the datasets that are shared by all the iterations of a namespace, so an iteration only render its overlay
+        for namespace in self._namespaces_registry.values():
+            namespace["base_catalog"] = freeze_datasets(
+                compile_base_datasets(namespace["catalog"])
+            )
+            namespace["slots"] = compile_slot_datasets(namespace["catalog"])
 
     def render(
         self,
@@ -198,6 +365,7 @@ class KedroBootContext:
         inputs: Optional[dict] = None,
         parameters: Optional[dict] = None,
         itertime_params: Optional[dict] = None,
+        copy_mode: Optional[Union[str, Dict[str, str]]] = None,
     ) -> Tuple[Pipeline, DataCatalog, List[str]]:
         """Generate a (pipeline, catalog) by rendering a namespace registry using the provided App Data.
 
@@ -206,59 +374,182 @@ class KedroBootContext:
             inputs (dict): App inputs datasets that will be injected into the catalog.
             parameters (dict): App parameters datasets that will be injected into the catalog.
             itertime_params (dict): App itertime params that will resolve the itertime_params resolvers.
+            copy_mode (Union[str, Dict[str, str]]): Copy mode of the inputs datasets for this iteration, overriding the namespace spec copy mode.
 
         Returns:
             Pipeline, DataCatalog: The rendered catalog
         """
 
+        namespace_registry = self._get_namespace_registry(namespace)
+        copy_modes = self._resolve_copy_modes(namespace, copy_mode)
+        itertime_params = itertime_params or {}
+
+        rendered_catalog = LayeredDataCatalog(
+            datasets=self._render_overlay(
+                namespace,
+                inputs,
+                parameters,
+                copy_modes,
+                template_datasets=render_template_datasets(
+                    template_render_plan=namespace_registry.get("template_plan"),
+                    iteration_template_params=itertime_params,
+                ),
+            ),
+            base_datasets=namespace_registry.get("base_catalog"),
+        )
+
+        pipeline = namespace_registry.get("pipeline")
+
+        outputs_datasets_name = list(namespace_registry.get("catalog").outputs.keys())
+
+        return pipeline, rendered_catalog, outputs_datasets_name
+
+    def get_batch_renderer(
+        self,
+        namespace: str = None,
+        copy_mode: Optional[Union[str, Dict[str, str]]] = None,
+    ) -> Callable[..., Tuple[Pipeline, DataCatalog, List[str]]]:
+        """Get a ``render`` function for a batch of iterations of a namespace.
+        The namespace registry and the copy modes are resolved once for the batch, the shared template datasets are rendered once per template cache key, and the catalog of each iteration is an overlay (inputs, parameters, unshared templates and output slots) of a catalog built once for the batch.
+
+        Args:
+            namespace (str): pipeline's namespace.
+            copy_mode (Union[str, Dict[str, str]]): Copy mode of the inputs datasets for the batch iterations, overriding the namespace spec copy mode.
+
+        Returns:
+            Callable: render function of an iteration, taking its inputs, parameters and itertime params
+        """
+        namespace_registry = self._get_namespace_registry(namespace)
+        copy_modes = self._resolve_copy_modes(namespace, copy_mode)
+        template_plan = namespace_registry.get("template_plan")
+        batch_catalog = LayeredDataCatalog(
+            base_datasets=namespace_registry.get("base_catalog")
+        )
+        pipeline = namespace_registry.get("pipeline")
+        outputs_datasets_name = list(namespace_registry.get("catalog").outputs.keys())
+        # Shared template datasets, indexed by template cache key
+        shared_templates = {}
+
+        def render(
+            inputs: Optional[dict] = None,
+            parameters: Optional[dict] = None,
+            itertime_params: Optional[dict] = None,
+        ) -> Tuple[Pipeline, DataCatalog, List[str]]:
+            itertime_params = itertime_params or {}
+            cache_key = template_plan.cache_key(itertime_params)
+            template_datasets = (
+                shared_templates.get(cache_key) if cache_key is not None else None
+            )
+            if template_datasets is None:
+                check_template_params(template_plan, itertime_params)
+                template_datasets = template_plan.render_shared(itertime_params)
+                if cache_key is not None:
+                    shared_templates[cache_key] = template_datasets
+            overlay = self._render_overlay(
+                namespace,
+                inputs,
+                parameters,
+                copy_modes,
+                template_datasets={
+                    **template_datasets,
+                    **template_plan.render_unshared(itertime_params),
+                },
+            )
+            return pipeline, batch_catalog.overlay(overlay), outputs_datasets_name
+
+        return render
+
+    def _get_namespace_registry(self, namespace: Optional[str]) -> dict:
         if namespace not in self._namespaces_registry:
             raise KedroBootContextError(
                 f"The given {namespace} namespace is not present in the current selected pipeline"
             )
+        return self._namespaces_registry.get(namespace)
 
-        inputs = inputs or {}
-        parameters = parameters or {}
-        itertime_params = itertime_params or {}
-
-        namespaced_inputs = namespace_datasets(inputs, namespace)
-        namespaced_parameters = namespace_datasets(parameters, namespace)
-
-        catalog_assembly = self._namespaces_registry.get(namespace).get("catalog")
-
-        rendered_catalog = DataCatalog()
+    def _resolve_copy_modes(
+        self,
+        namespace: Optional[str],
+        copy_mode: Optional[Union[str, Dict[str, str]]],
+    ) -> Dict[str, str]:
+        namespace_registry = self._namespaces_registry.get(namespace)
+        if copy_mode is None:
+            return namespace_registry.get("copy_modes")
+        validate_copy_mode(copy_mode)
+        return resolve_copy_modes(
+            namespace_registry.get("spec").inputs,
+            namespace,
+            namespace_registry.get("spec").copy_mode,
+            copy_mode,
+        )
 
-        # Render each part of the catalog view
+    def _render_overlay(
+        self,
+        namespace: Optional[str],
+        inputs: Optional[dict],
+        parameters: Optional[dict],
+        copy_modes: Dict[str, str],
+        template_datasets: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        namespace_registry = self._namespaces_registry.get(namespace)
+
+        # Render each part of the catalog overlay
         input_datasets = render_input_datasets(
-            catalog_inputs=catalog_assembly.inputs, iteration_inputs=namespaced_inputs
-        )
-        artifact_datasets = catalog_assembly.artifacts
-        template_datasets = render_template_datasets(
-            catalog_templates=catalog_assembly.templates,
-            iteration_template_params=itertime_params,
+            catalog_inputs=namespace_registry.get("catalog").inputs,
+            iteration_inputs=namespace_datasets(inputs or {}, namespace),
+            copy_modes=copy_modes,
         )
         parameter_datasets = render_parameter_datasets(
-            catalog_parameters=catalog_assembly.parameters,
-            iteration_parameters=namespaced_parameters,
-        )
-        output_datasets = render_datasets(datasets=catalog_assembly.outputs)
-        unmanaged_datasets = render_datasets(datasets=catalog_assembly.unmanaged)
-
-        rendered_catalog.add_all(
-            {
-                **input_datasets,
-                **output_datasets,
-                **parameter_datasets,
-                **template_datasets,
-                **artifact_datasets,
-                **unmanaged_datasets,
-            }
+            parameter_render_plan=namespace_registry.get("parameter_plan"),
+            iteration_parameters=namespace_datasets(parameters or {}, namespace),
         )
+        slot_datasets = render_slot_datasets(slots=namespace_registry.get("slots"))
 
-        pipeline = self._namespaces_registry.get(namespace).get("pipeline")
+        return {
+            **input_datasets,
+            **slot_datasets,
+            **parameter_datasets,
+            **template_datasets,
+        }
 
-        outputs_datasets_name = list(output_datasets.keys())
+    def get_template_cache_info(self, namespace: str) -> TemplateCacheInfo:
+        """Get the hits/misses counters of the namespace rendered templates cache."""
+        if namespace not in self._namespaces_registry:
+            raise KedroBootContextError(
+                f"The given {namespace} namespace is not present in the current selected pipeline"
+            )
+        return self._namespaces_registry[namespace]["template_plan"].cache_info()
 
-        return pipeline, rendered_catalog, outputs_datasets_name
+    def get_artifacts_load_times(self) -> Dict[str, float]:
+        return self._artifacts.get_load_times()
+
+    def get_artifacts_deduplication(self) -> ArtifactsDeduplication:
+        return self._artifacts.get_deduplication()
+
+    def get_artifacts_memory_info(self) -> ArtifactsMemoryInfo:
+        return self._artifacts.get_memory_info()
+
+    def get_artifacts_readiness(self) -> ArtifactsReadiness:
+        return self._artifacts.get_readiness()
+
+    def get_compilation_spec(self, namespace: str) -> CompilationSpec:
+        """Get the compilation spec of a namespace."""
+        if namespace not in self._namespaces_registry:
+            raise KedroBootContextError(
+                f"The given {namespace} namespace is not present in the current selected pipeline"
+            )
+        return self._namespaces_registry[namespace]["spec"]
+
+    def get_pipeline(self, namespace: str) -> Pipeline:
+        """Get the compiled pipeline of a namespace."""
+        return self._namespaces_registry.get(namespace).get("pipeline")
+
+    def get_executor(self, namespace: str) -> Optional[CompiledPipelineExecutor]:
+        """Get the compiled executor of a namespace, None if the namespace is run by the session runner."""
+        return self._namespaces_registry.get(namespace).get("executor")
+
+    def get_runner(self, namespace: str) -> Optional[AbstractRunner]:
+        """Get the kedro runner of a namespace, None if the namespace is run by the session runner or by a compiled executor."""
+        return self._namespaces_registry.get(namespace).get("runner")
 
     def get_outputs_datasets(self, namespace: str) -> List[str]:
         return self._namespaces_registry.get(namespace).get("outputs")
@@ -0,0 +1,264 @@
+"""This module implements the compiled snapshots: the compiled namespaces registry pickled on disk, indexed by a fingerprint of what the compiled catalog depends on."""
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from kedro import __version__ as kedro_version
+from kedro.io import DataCatalog
+from kedro.pipeline.pipeline import Pipeline
+
+from kedro_boot import __version__ as kedro_boot_version
+from kedro_boot.framework.compiler.specs import CompilationSpec, MaterializationSpec
+from kedro_boot.framework.context.artifacts import (
+    StoredArtifact,
+    artifact_key,
+    find_stored_artifact,
+    map_artifact,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# Bumped whenever the content of the namespaces registry changes, so the snapshots of older releases are never loaded
+SNAPSHOT_FORMAT_VERSION = 2
+
+# Persistent id of the artifacts mapped from the artifact store, pickled by their store location and mapped again at load time
+_STORED_ARTIFACT_ID = "stored_artifact"
+# Persistent id of the catalog datasets and of their attributes containers (ex: the init args held by the render plans), pickled by their path in the catalog and taken from the catalog at load time, so their credentials are not written in the snapshot
+_CATALOG_OBJECT_ID = "catalog_object"
+
+# Namespaces registry entries rebuilt at load time, from the snapshot entries
+_DERIVED_REGISTRY_ENTRIES = ("base_catalog", "slots")
+
+# Materialization options that change the compiled catalog. The others (load pool, prefetch, readiness, watcher) are applied by the process loading the snapshot
+_COMPILED_MATERIALIZATION_OPTIONS = (
+    "store_dir",
+    "policy",
+    "critical_namespaces",
+    "memory_budget",
+    "deduplication",
+)
+
+
+def compute_fingerprint(
+    pipeline: Pipeline,
+    catalog: DataCatalog,
+    compilation_specs: Optional[List[CompilationSpec]] = None,
+    materialization_spec: Optional[MaterializationSpec] = None,
+) -> str:
+    """Fingerprint the compilation of a context.
+
+    Args:
+        pipeline (Pipeline): base kedro pipeline
+        catalog (DataCatalog): base kedro catalog
+        compilation_specs (List[CompilationSpec]): compilation specs given by the app, infered from the pipeline if None
+        materialization_spec (MaterializationSpec): how the artifacts datasets are materialized
+
+    Raises:
+        ArtifactSourceError: the source file of a dataset can't be stat'ed, so the snapshot could be stale
+
+    Returns:
+        str: fingerprint of the compilation
+    """
+    fingerprint = [
+        f"format={SNAPSHOT_FORMAT_VERSION}",
+        f"kedro={kedro_version}",
+        f"kedro_boot={kedro_boot_version}",
+        f"python={sys.version_info[:2]}",
+    ]
+    for pipeline_node in sorted(pipeline.nodes, key=lambda node: node.name):
+        fingerprint.append(
+            f"node={pipeline_node.name}|{pipeline_node.namespace}|{pipeline_node.inputs}|{pipeline_node.outputs}"
+        )
+
+    for dataset_name in sorted(pipeline.datasets()):
+        if dataset_name not in catalog:
+            continue
+        dataset = catalog._get_dataset(dataset_name)
+        if dataset_name == "parameters" or dataset_name.startswith("params:"):
+            # The parameters descriptions don't hold their values
+            fingerprint.append(f"{dataset_name}={dataset.load()!r}")
+        else:
+            fingerprint.append(artifact_key(dataset_name, dataset))
+
+    if not compilation_specs:
+        compilation_specs = CompilationSpec.infer_compilation_specs(pipeline)
+    for compilation_spec in sorted(
+        compilation_specs, key=lambda spec: str(spec.namespace)
+    ):
+        fingerprint.append(f"spec={compilation_spec.to_dict()!r}")
+
+    materialization_options = (materialization_spec or MaterializationSpec()).to_dict()
+    fingerprint.append(
+        "materialization="
+        + repr(
+            {
+                option: materialization_options[option]
+                for option in _COMPILED_MATERIALIZATION_OPTIONS
+            }
+        )
+    )
+
+    return hashlib.sha256("\n".join(fingerprint).encode()).hexdigest()
+
+
+def save_snapshot(
+    snapshot_path: str,
+    fingerprint: str,
+    namespaces_registry: Dict[str, dict],
+    artifacts_load_times: Dict[str, float],
+    catalog: DataCatalog,
+) -> None:
+    """Write the snapshot of a compiled context, through a temporary file readable by its owner only.
+
+    Args:
+        snapshot_path (str): snapshot file path
+        fingerprint (str): fingerprint of the compilation
+        namespaces_registry (Dict[str, dict]): compiled namespaces registry
+        artifacts_load_times (Dict[str, float]): load time of the materialized artifacts
+        catalog (DataCatalog): base kedro catalog, whose datasets are referenced by name
+    """
+    header = dict(format_version=SNAPSHOT_FORMAT_VERSION, fingerprint=fingerprint)
+    snapshot = dict(
+        namespaces_registry={
+            namespace: {
+                entry_name: entry
+                for entry_name, entry in namespace_registry.items()
+                if entry_name not in _DERIVED_REGISTRY_ENTRIES
+            }
+            for namespace, namespace_registry in namespaces_registry.items()
+        },
+        artifacts_load_times=artifacts_load_times,
+    )
+
+    snapshot_path = Path(snapshot_path)
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{snapshot_path.name}-", dir=snapshot_path.parent
+    )
+    try:
+        os.chmod(tmp_path, 0o600)
+        with os.fdopen(tmp_fd, "wb") as snapshot_file:
+            # The header is pickled apart, so an outdated snapshot is discarded without loading its registry
+            pickle.dump(header, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+            _SnapshotPickler(
+                snapshot_file, catalog, protocol=pickle.HIGHEST_PROTOCOL
+            ).dump(snapshot)
+        os.replace(tmp_path, snapshot_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_snapshot(
+    snapshot_path: str, fingerprint: str, catalog: DataCatalog
+) -> Optional[Dict[str, Any]]:
+    """Load the snapshot of a compiled context, if it matches the fingerprint of the compilation.
+
+    Args:
+        snapshot_path (str): snapshot file path
+        fingerprint (str): fingerprint of the compilation
+        catalog (DataCatalog): base kedro catalog, giving the datasets referenced by name
+
+    Returns:
+        Optional[Dict[str, Any]]: the snapshot namespaces_registry and artifacts_load_times, None if there is no matching snapshot
+    """
+    if not os.path.exists(snapshot_path):
+        LOGGER.info(f"No compiled snapshot found at {snapshot_path}")
+        return None
+
+    with open(snapshot_path, "rb") as snapshot_file:
+        try:
+            header = pickle.load(snapshot_file)
+            if not isinstance(header, dict) or (
+                header.get("format_version") != SNAPSHOT_FORMAT_VERSION
+            ):
+                LOGGER.info(
+                    f"The compiled snapshot {snapshot_path} was written in another format, the catalog is compiled again"
+                )
+                return None
+            if header.get("fingerprint") != fingerprint:
+                LOGGER.info(
+                    f"The compiled snapshot {snapshot_path} is outdated (the pipeline, the catalog, the artifacts files or the compilation specs changed), the catalog is compiled again"
+                )
+                return None
+
+            snapshot = _SnapshotUnpickler(snapshot_file, catalog).load()
+        except Exception as exc:
+            # The snapshot may reference code or stored artifacts that changed since it was written
+            LOGGER.warning(
+                f"The compiled snapshot {snapshot_path} cannot be loaded, the catalog is compiled again: {exc}"
+            )
+            return None
+
+    return snapshot
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file: Any, catalog: DataCatalog, **kwargs) -> None:
+        super().__init__(file, **kwargs)
+        # The objects are kept with their path, so their ids are not reused while pickling
+        self._catalog_objects = {}
+        for dataset_name in catalog.list():
+            dataset = catalog._get_dataset(dataset_name)
+            self._catalog_objects[id(dataset)] = (dataset, (dataset_name,))
+            for attribute, value in getattr(dataset, "__dict__", {}).items():
+                self._index_containers(value, (dataset_name, attribute))
+
+    def _index_containers(self, value: Any, path: tuple) -> None:
+        if isinstance(value, dict):
+            items = value.items()
+        elif isinstance(value, list):
+            items = enumerate(value)
+        else:
+            return
+        if id(value) in self._catalog_objects:
+            return
+        self._catalog_objects[id(value)] = (value, path)
+        for key, item in items:
+            self._index_containers(item, path + (key,))
+
+    def persistent_id(self, obj: Any) -> Optional[tuple]:
+        catalog_object = self._catalog_objects.get(id(obj))
+        if catalog_object is not None and catalog_object[0] is obj:
+            return (_CATALOG_OBJECT_ID, catalog_object[1])
+
+        stored_artifact = find_stored_artifact(obj)
+        if stored_artifact is not None:
+            return (
+                _STORED_ARTIFACT_ID,
+                str(stored_artifact.path),
+                stored_artifact.format,
+            )
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file: Any, catalog: DataCatalog, **kwargs) -> None:
+        super().__init__(file, **kwargs)
+        self._catalog = catalog
+        # The artifacts shared by several datasets are mapped once
+        self._mapped_artifacts = {}
+
+    def persistent_load(self, persistent_id: tuple) -> Any:
+        if persistent_id[0] == _CATALOG_OBJECT_ID:
+            dataset_name, *path = persistent_id[1]
+            catalog_object = self._catalog._get_dataset(dataset_name)
+            if path:
+                catalog_object = getattr(catalog_object, path[0])
+            for key in path[1:]:
+                catalog_object = catalog_object[key]
+            return catalog_object
+
+        if persistent_id[0] == _STORED_ARTIFACT_ID:
+            if persistent_id not in self._mapped_artifacts:
+                self._mapped_artifacts[persistent_id] = map_artifact(
+                    StoredArtifact(Path(persistent_id[1]), persistent_id[2])
+                )
+            return self._mapped_artifacts[persistent_id]
+        raise pickle.UnpicklingError(f"Unknown persistent id: {persistent_id[0]}")
@@ -0,0 +1,110 @@
+"""A ``DataCatalog`` made of a read-only base catalog, shared by all the iterations, and a thin per-iteration overlay"""
+
+import copy
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from kedro.io import DataCatalog
+from kedro.io.core import _validate_versions
+from kedro.io.data_catalog import _FrozenDatasets, _sub_nonword_chars
+
+
+class LayeredDataCatalog(DataCatalog):
+    """``LayeredDataCatalog`` resolve datasets from an iteration overlay first, then from a base catalog frozen at compile time.
+
+    The overlay hold the datasets rendered for the iteration (inputs, parameters, templates, output slots). Every dataset added during the run goes to the overlay, the base catalog is never modified.
+    Building and shallow copying a ``LayeredDataCatalog`` cost the size of the overlay, whatever the size of the base catalog.
+    """
+
+    def __init__(
+        self,
+        datasets: Optional[Dict[str, Any]] = None,
+        base_datasets: Optional[Mapping[str, Any]] = None,
+        **kwargs,
+    ) -> None:
+        """Init the ``LayeredDataCatalog``.
+
+        Args:
+            datasets (dict): Overlay datasets, rendered for the iteration.
+            base_datasets (Mapping): Read-only base datasets, shared between iterations.
+            kwargs: ``DataCatalog`` args
+        """
+        self._base_datasets = (
+            base_datasets if base_datasets is not None else MappingProxyType({})
+        )
+        super().__init__(datasets=datasets, **kwargs)
+        self._datasets = ChainMap(self._datasets, self._base_datasets)
+
+    @property
+    def datasets(self) -> "_LayeredFrozenDatasets":
+        return self._frozen_datasets
+
+    @datasets.setter
+    def datasets(self, value: Optional[_FrozenDatasets]) -> None:
+        # DataCatalog assign the frozen overlay datasets, the base datasets are resolved at access time
+        self._frozen_datasets = _LayeredFrozenDatasets(self._base_datasets, value)
+
+    def overlay(self, datasets: Dict[str, Any]) -> "LayeredDataCatalog":
+        """Create a catalog sharing the base datasets and the config of this catalog, with its own overlay. Used by the batches to build the catalog of each iteration without the ``DataCatalog`` init.
+
+        Args:
+            datasets (dict): Overlay datasets, rendered for the iteration.
+
+        Returns:
+            LayeredDataCatalog: catalog of the iteration
+        """
+        catalog = copy.copy(self)
+        catalog._load_versions, catalog._save_version = _validate_versions(
+            datasets, self._load_versions, self._save_version
+        )
+        catalog._datasets = ChainMap(dict(datasets), self._base_datasets)
+        catalog.datasets = _FrozenDatasets(datasets)
+        return catalog
+
+    def shallow_copy(self, *args, **kwargs) -> DataCatalog:
+        # Only the overlay is copied, the base catalog is shared with the copy
+        layers, self._datasets = self._datasets, self._datasets.maps[0]
+        try:
+            catalog = super().shallow_copy(*args, **kwargs)
+        finally:
+            self._datasets = layers
+
+        catalog._base_datasets = self._base_datasets
+        catalog._datasets = ChainMap(catalog._datasets, self._base_datasets)
+        catalog.datasets = catalog.datasets
+        return catalog
+
+
+class _LayeredFrozenDatasets(_FrozenDatasets):
+    """``_FrozenDatasets`` of the overlay, falling back to the base datasets (ex: ``catalog.datasets.model`` in a hook)"""
+
+    def __init__(self, base_datasets: Mapping[str, Any], *datasets_collections) -> None:
+        super().__init__(*datasets_collections)
+        self.__dict__["_base_datasets"] = base_datasets
+        self.__dict__["_base_attributes"] = None
+
+    def __getattr__(self, key: str) -> Any:
+        # Only called for the names missing in the overlay. The base attribute names are indexed at the first miss
+        if key.startswith("__"):
+            raise AttributeError(key)
+        base_attributes = self.__dict__.get("_base_attributes")
+        if base_attributes is None:
+            base_attributes = {
+                _sub_nonword_chars(dataset_name): dataset
+                for dataset_name, dataset in self.__dict__.get(
+                    "_base_datasets", {}
+                ).items()
+            }
+            self.__dict__["_base_attributes"] = base_attributes
+        if key in base_attributes:
+            return base_attributes[key]
+        raise AttributeError(f"Dataset '{key}' not found in the catalog")
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, _sub_nonword_chars(key))
+
+
+def freeze_datasets(datasets: Dict[str, Any]) -> Mapping[str, Any]:
+    """Create a read-only base catalog from datasets"""
+    return MappingProxyType(dict(datasets))
@@ -0,0 +1,202 @@
+"""Convert the app input payloads (dict or list of records) into the native in-memory type of the catalog input datasets"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+
+LOGGER = logging.getLogger(__name__)
+
+InputConverter = Callable[[Any], Any]
+
+# Python types of the JSON values that can be stored in a column of the given dtype. Missing float values are stored as NaN
+_DTYPES_PYTHON_TYPES = {
+    "int64": {int},
+    "float64": {int, float, type(None)},
+    "bool": {bool},
+}
+
+
+class InputConverterRegistry:
+    """``InputConverterRegistry`` hold the input converters indexed by dataset type.
+
+    A dataset type is either a dataset class, matched with the dataset class hierarchy, or a string matched against the dataset class path (ex: ``"pandas"`` match ``kedro_datasets.pandas.csv_dataset.CSVDataset``).
+    Class keys take precedence over string keys, and the most recently registered string key wins.
+    """
+
+    def __init__(self) -> None:
+        self._class_converters: Dict[type, InputConverter] = {}
+        self._path_converters: Dict[str, InputConverter] = {}
+        self._resolved_converters: Dict[type, Optional[InputConverter]] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self, dataset_type: Union[type, str], converter: InputConverter
+    ) -> None:
+        """Register an input converter for a dataset type.
+
+        Args:
+            dataset_type (Union[type, str]): dataset class, or a substring of the dataset class path.
+            converter (InputConverter): function converting a dict or a list of records into the dataset native type.
+        """
+        with self._lock:
+            if isinstance(dataset_type, str):
+                self._path_converters.pop(dataset_type.lower(), None)
+                self._path_converters[dataset_type.lower()] = converter
+            else:
+                self._class_converters[dataset_type] = converter
+            self._resolved_converters = {}
+
+    def get(self, dataset: Any) -> Optional[InputConverter]:
+        """Get the input converter of a dataset, None if no converter is registered for its type."""
+        dataset_class = dataset.__class__
+        try:
+            return self._resolved_converters[dataset_class]
+        except KeyError:
+            pass
+
+        with self._lock:
+            converter = self._resolve(dataset_class)
+            self._resolved_converters[dataset_class] = converter
+        return converter
+
+    def convert(self, dataset: Any, data: Any) -> Any:
+        """Convert the input data into the native type of the dataset. Data that is not a dict or a list of records is returned as is.
+
+        Args:
+            dataset (Any): catalog input dataset
+            data (Any): app input data
+
+        Returns:
+            Any: converted data
+        """
+        if not is_records(data):
+            return data
+        converter = self.get(dataset)
+        if converter is None:
+            return data
+        return converter(data)
+
+    def _resolve(self, dataset_class: type) -> Optional[InputConverter]:
+        for parent_class in dataset_class.__mro__:
+            if parent_class in self._class_converters:
+                return self._class_converters[parent_class]
+
+        dataset_class_path = (
+            f"{dataset_class.__module__}.{dataset_class.__qualname__}".lower()
+        )
+        for dataset_type in reversed(self._path_converters):
+            if dataset_type in dataset_class_path:
+                return self._path_converters[dataset_type]
+        return None
+
+
+class TypedRecords(list):
+    """A list of records, along with the dtypes of their fields declared by the app (ex: a Pydantic model of a FastAPI route).
+    The built-in converters build the declared columns directly with their dtype, without inferring it.
+    """
+
+    def __init__(self, records: List[dict], dtypes: Dict[str, str]) -> None:
+        """Init ``TypedRecords``.
+
+        Args:
+            records (List[dict]): records
+            dtypes (Dict[str, str]): numpy dtypes indexed by record field
+        """
+        super().__init__(records)
+        self.dtypes = dtypes
+
+
+def is_records(data: Any) -> bool:
+    """Check if the data is a record (dict) or a list of records"""
+    return isinstance(data, dict) or (
+        isinstance(data, list) and all(isinstance(item, dict) for item in data)
+    )
+
+
+def records_to_columns(data: Union[dict, List[dict]]) -> Optional[Dict[Any, Any]]:
+    """Transpose flat records sharing the same keys, in the same order, into columns.
+    The columns of ``TypedRecords`` declared fields are built as numpy arrays of the declared dtype.
+
+    Args:
+        data (Union[dict, List[dict]]): a record or a list of records
+
+    Returns:
+        Optional[Dict[Any, Any]]: columns indexed by record key, None if the records are nested or don't share the same keys
+    """
+    records = [data] if isinstance(data, dict) else data
+    if not records or not records[0]:
+        return None
+
+    # Row wise C level iteration, much faster than looking up each column in each record
+    keys = list(records[0])
+    if not all(map(keys.__eq__, map(list, records))):
+        return None
+
+    dtypes = getattr(data, "dtypes", None) or {}
+    if dtypes:
+        import numpy as np
+
+    columns = {}
+    for key, column in zip(keys, zip(*map(dict.values, records))):
+        value_types = set(map(type, column))
+        if any(issubclass(value_type, dict) for value_type in value_types):
+            return None
+        # Values are checked before the cast, as numpy silently cast strings to True or floats to int
+        if key in dtypes and value_types <= _DTYPES_PYTHON_TYPES.get(
+            dtypes[key], set()
+        ):
+            try:
+                columns[key] = np.array(column, dtype=dtypes[key])
+                continue
+            except (OverflowError, ValueError):
+                # Ex: an int beyond int64, the column is left to the dataset library inference
+                pass
+        columns[key] = list(column)
+    return columns
+
+
+def pandas_converter(data: Union[dict, List[dict]]) -> Any:
+    import pandas as pd
+
+    columns = records_to_columns(data)
+    if columns is None:
+        # Nested or heterogeneous records are flattened the generic way
+        return pd.json_normalize(data)
+    return pd.DataFrame(columns)
+
+
+def pyarrow_converter(data: Union[dict, List[dict]]) -> Any:
+    import pyarrow as pa
+
+    columns = records_to_columns(data)
+    if columns is None:
+        return pa.Table.from_pylist([data] if isinstance(data, dict) else data)
+    return pa.Table.from_pydict(columns)
+
+
+def polars_converter(data: Union[dict, List[dict]]) -> Any:
+    import polars as pl
+
+    columns = records_to_columns(data)
+    if columns is None:
+        return pl.from_dicts([data] if isinstance(data, dict) else data)
+    return pl.DataFrame(columns)
+
+
+# Lazily imported libraries, we expect users to have them installed if they use their datasets
+input_converters = InputConverterRegistry()
+input_converters.register("pandas", pandas_converter)
+input_converters.register("pyarrow", pyarrow_converter)
+input_converters.register("polars", polars_converter)
+
+
+def register_input_converter(
+    dataset_type: Union[type, str], converter: InputConverter
+) -> None:
+    """Register an input converter in the kedro boot input converters registry.
+
+    Args:
+        dataset_type (Union[type, str]): dataset class, or a substring of the dataset class path.
+        converter (InputConverter): function converting a dict or a list of records into the dataset native type.
+    """
+    input_converters.register(dataset_type, converter)
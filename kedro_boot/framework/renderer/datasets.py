@@ -0,0 +1,164 @@
+"""Memory datasets holding the app inputs injected into the catalog, following their copy mode"""
+
+import logging
+import sys
+from typing import Any, Optional
+
+from kedro.io import MemoryDataset
+from kedro.io.core import DatasetError
+from kedro.io.memory_dataset import _EMPTY, _copy_with_mode
+
+LOGGER = logging.getLogger(__name__)
+
+READONLY_COPY_MODE = "readonly"
+COPY_MODES = ("deepcopy", "copy", "assign", READONLY_COPY_MODE)
+
+
+class IterationMemoryDataset(MemoryDataset):
+    """``IterationMemoryDataset`` is the ``MemoryDataset`` created for an iteration (inputs, parameters and outputs slots).
+    Its copy mode is inferred the same way as kedro does, without trying to import the optional dataframe libraries at each load and save.
+    """
+
+    def _load(self) -> Any:
+        if not self._exists():
+            raise DatasetError("Data for MemoryDataset has not been saved yet.")
+        return _copy_with_mode(
+            self._data, copy_mode=self._copy_mode or infer_copy_mode(self._data)
+        )
+
+    def _save(self, data: Any) -> None:
+        self._data = _copy_with_mode(
+            data, copy_mode=self._copy_mode or infer_copy_mode(data)
+        )
+
+
+def new_iteration_memory_dataset(
+    data: Any = _EMPTY, copy_mode: Optional[str] = None
+) -> IterationMemoryDataset:
+    """Create an ``IterationMemoryDataset`` by cloning an empty prototype, as the kedro datasets init (capturing the init args) costs more than the whole dataset usage.
+
+    Args:
+        data (Any): data saved in the dataset, following its copy mode
+        copy_mode (str): "deepcopy", "copy", "assign" or None to infer it from the data
+
+    Returns:
+        IterationMemoryDataset: the memory dataset
+    """
+    dataset = object.__new__(IterationMemoryDataset)
+    dataset.__dict__.update(_ITERATION_MEMORY_DATASET_STATE)
+    dataset._copy_mode = copy_mode
+    if data is not _EMPTY:
+        dataset._save(data)
+    return dataset
+
+
+class ReadOnlyMemoryDataset(MemoryDataset):
+    """``ReadOnlyMemoryDataset`` hold the data without copying it, and give the nodes a read-only view of it.
+
+    numpy arrays are loaded as non-writeable views. pandas objects are loaded as shallow copies, that are protected by pandas Copy-on-Write.
+    When Copy-on-Write is not enabled (pandas < 3.0), they are deep copied to keep the app data safe, and ``check_readonly_copy_mode`` warns about it when the copy mode is chosen. Other objects are loaded as is.
+    """
+
+    def __init__(self, metadata: Optional[dict] = None) -> None:
+        super().__init__(copy_mode="assign", metadata=metadata)
+
+    def _load(self) -> Any:
+        if not self._exists():
+            raise DatasetError("Data for MemoryDataset has not been saved yet.")
+        return readonly_view(self._data)
+
+
+def readonly_view(data: Any) -> Any:
+    """Create a read-only view of the data, without copying it when possible.
+
+    Args:
+        data (Any): Any data
+
+    Returns:
+        Any: non-writeable view of numpy arrays, Copy-on-Write shallow copy of pandas objects, the data itself otherwise
+    """
+    # numpy and pandas are only looked up if already imported, as the data can't be one of their objects otherwise
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(data, np.ndarray):
+        view = data.view()
+        view.flags.writeable = False
+        return view
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(data, (pd.DataFrame, pd.Series)):
+        if is_pandas_copy_on_write_enabled(pd):
+            return data.copy(deep=False)
+        return data.copy()
+
+    return data
+
+
+_ITERATION_MEMORY_DATASET_STATE = dict(vars(IterationMemoryDataset()))
+
+
+def infer_copy_mode(data: Any) -> str:
+    """Infer the copy mode of the data like kedro ``MemoryDataset``. The dataframe libraries are only looked up if already imported, as the data can't be one of their objects otherwise.
+
+    Args:
+        data (Any): Any data
+
+    Returns:
+        str: "copy", "assign" or "deepcopy"
+    """
+    pd = sys.modules.get("pandas")
+    np = sys.modules.get("numpy")
+    if (pd is not None and isinstance(data, pd.DataFrame)) or (
+        np is not None and isinstance(data, np.ndarray)
+    ):
+        return "copy"
+
+    ibis = sys.modules.get("ibis")
+    if type(data).__name__ == "DataFrame" or (
+        ibis is not None and isinstance(data, getattr(ibis, "Table", ()))
+    ):
+        return "assign"
+    return "deepcopy"
+
+
+def check_readonly_copy_mode() -> None:
+    """Warn once that the 'readonly' pandas inputs are deep copied at each load, when pandas Copy-on-Write is not enabled"""
+    global _readonly_copy_warned
+    if _readonly_copy_warned:
+        return
+    try:
+        import pandas as pd
+    except ImportError:
+        return
+    if not is_pandas_copy_on_write_enabled(pd):
+        _readonly_copy_warned = True
+        LOGGER.warning(
+            "pandas Copy-on-Write is not enabled, so the 'readonly' inputs that are pandas objects are deep copied at each load. "
+            "Enable it with pd.options.mode.copy_on_write = True, or use the 'assign' copy mode for the pandas inputs"
+        )
+
+
+_readonly_copy_warned = False
+
+
+def is_pandas_copy_on_write_enabled(pd: Any) -> bool:
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    # pandas 2.2 also accept a 'warn' mode, that does not protect the data
+    return pd.options.mode.copy_on_write is True
+
+
+def create_input_dataset(data: Any, copy_mode: Optional[str] = None) -> MemoryDataset:
+    """Create the memory dataset holding an app input.
+
+    Args:
+        data (Any): app input data
+        copy_mode (str): one of "deepcopy", "copy", "assign" and "readonly". None infer the copy mode from the data, as kedro does.
+
+    Returns:
+        MemoryDataset: the input dataset
+    """
+    if copy_mode == READONLY_COPY_MODE:
+        dataset = ReadOnlyMemoryDataset()
+        dataset.save(data)
+        return dataset
+    return new_iteration_memory_dataset(data, copy_mode=copy_mode)
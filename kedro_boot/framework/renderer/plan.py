@@ -0,0 +1,400 @@
+"""Render plans for template datasets, compiled once and executed at iteration time"""
+
+import copy
+import threading
+from collections import OrderedDict, namedtuple
+from collections.abc import MutableMapping, MutableSequence, MutableSet
+from pathlib import PurePath
+from typing import Any, Dict, Iterable, List, Optional
+
+from kedro.io import CachedDataset, MemoryDataset, SharedMemoryDataset
+
+from .datasets import IterationMemoryDataset, new_iteration_memory_dataset
+from .template import compile_template, is_template
+
+TemplateCacheInfo = namedtuple(
+    "TemplateCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+_MISSING_TEMPLATE_PARAM = object()
+
+# Datasets holding the data they save, so their instances can't be shared across iterations
+DATA_HOLDING_DATASETS = (MemoryDataset, CachedDataset, SharedMemoryDataset)
+
+
+class StringTemplate:
+    """Render a single templated string (or ``PurePath``) attribute."""
+
+    def __init__(self, template: str, path_type: Optional[type] = None) -> None:
+        """Init the ``StringTemplate``.
+
+        Args:
+            template (str): string containing interpolations.
+            path_type (type): ``PurePath`` class to cast the rendered value to, None for plain strings.
+        """
+        self.template = template
+        self.path_type = path_type
+        self.compiled_template = compile_template(template)
+        self.template_params = self.compiled_template.template_params
+        self.referenced_params = self.compiled_template.referenced_params
+
+    def render(self, template_args: dict) -> Any:
+        rendered_value = self.compiled_template.render(template_args)
+        if self.path_type:
+            return PurePath(rendered_value)
+        return rendered_value
+
+
+class ContainerTemplate:
+    """Render a dict or a list attribute by substituting only its templated entries."""
+
+    def __init__(self, container: Any, templates: Dict[Any, Any]) -> None:
+        """Init the ``ContainerTemplate``.
+
+        Args:
+            container (Any): original dict or list.
+            templates (dict): templates of the container entries, indexed by key or position.
+        """
+        self.container = container
+        self.templates = templates
+        self.template_params = sorted(
+            {
+                param
+                for template in templates.values()
+                for param in template.template_params
+            }
+        )
+        self.referenced_params = _merge_referenced_params(templates.values())
+
+    def render(self, template_args: dict) -> Any:
+        rendered_container = copy.copy(self.container)
+        for key, template in self.templates.items():
+            rendered_container[key] = template.render(template_args)
+        return rendered_container
+
+
+def compile_value_template(value: Any) -> Optional[Any]:
+    """Compile a dataset attribute value into a template, or None if it holds no interpolation.
+
+    Args:
+        value (Any): dataset attribute value
+
+    Returns:
+        Optional[Any]: ``StringTemplate``, ``ContainerTemplate`` or None
+    """
+    if isinstance(value, str):
+        return StringTemplate(value) if is_template(value) else None
+
+    elif isinstance(value, PurePath):
+        if is_template(str(value)):
+            return StringTemplate(str(value), path_type=value.__class__)
+        return None
+
+    elif isinstance(value, (dict, list)):
+        keys = value.keys() if isinstance(value, dict) else range(len(value))
+        templates = {}
+        for key in keys:
+            template = compile_value_template(value[key])
+            if template:
+                templates[key] = template
+        return ContainerTemplate(value, templates) if templates else None
+
+    return None
+
+
+def _merge_referenced_params(templates: Any) -> Optional[List[str]]:
+    referenced_params = set()
+    for template in templates:
+        if template.referenced_params is None:
+            return None
+        referenced_params.update(template.referenced_params)
+    return sorted(referenced_params)
+
+
+class DatasetSlot:
+    """Create a fresh instance of a dataset at each iteration, without deep copying it.
+
+    The instance state is shallow copied, only the mutable attributes (version cache, load/save args, ...) are copied.
+    Memory datasets that already hold data at compile time are deep copied, as their data should not be shared between iterations.
+    """
+
+    # Constructor args recorded by kedro, never modified after the dataset init
+    SHARED_ATTRIBUTES = ("_init_args",)
+
+    def __init__(self, dataset: Any, excluded_attributes: Iterable[str] = ()) -> None:
+        """Init the ``DatasetSlot``.
+
+        Args:
+            dataset (Any): Any kedro dataset
+            excluded_attributes (Iterable[str]): attributes that are set by the caller after the slot creation.
+        """
+        self.dataset = dataset
+        # Plain memory datasets are created as IterationMemoryDataset, that infer their copy mode faster
+        self.dataset_class = (
+            IterationMemoryDataset
+            if dataset.__class__ is MemoryDataset
+            else dataset.__class__
+        )
+        self.deepcopy = not hasattr(dataset, "__dict__") or (
+            isinstance(dataset, DATA_HOLDING_DATASETS) and dataset.exists()
+        )
+        self.copied_attributes = [
+            attr
+            for attr, value in getattr(dataset, "__dict__", {}).items()
+            if isinstance(value, (MutableMapping, MutableSequence, MutableSet))
+            and attr not in self.SHARED_ATTRIBUTES
+            and attr not in excluded_attributes
+        ]
+
+    def __call__(self) -> Any:
+        if self.deepcopy:
+            return copy.deepcopy(self.dataset)
+
+        dataset = object.__new__(self.dataset_class)
+        dataset.__dict__.update(self.dataset.__dict__)
+        for attr in self.copied_attributes:
+            setattr(dataset, attr, copy.deepcopy(getattr(self.dataset, attr)))
+        return dataset
+
+
+class DatasetRenderPlan:
+    """Precompiled rendering of a template dataset: which attributes hold interpolations and how to substitute them."""
+
+    def __init__(self, dataset: Any) -> None:
+        """Init the ``DatasetRenderPlan`` by walking the dataset attributes once.
+
+        Args:
+            dataset (Any): Any kedro dataset containing itertime_params interpolations.
+        """
+        self.dataset = dataset
+        self.templates = {}
+
+        for attr, value in dataset.__dict__.items():
+            template = compile_value_template(value)
+            if template:
+                self.templates[attr] = template
+
+        self.slot = DatasetSlot(dataset, excluded_attributes=self.templates)
+
+        self.template_params = sorted(
+            {
+                param
+                for template in self.templates.values()
+                for param in template.template_params
+            }
+        )
+        self.referenced_params = _merge_referenced_params(self.templates.values())
+
+    @property
+    def cacheable(self) -> bool:
+        """A rendered dataset can be reused across iterations, unless it depends on the run_id or on unknown params, is versioned (save versions are resolved per instance) or holds data"""
+        return (
+            self.referenced_params is not None
+            and "run_id" not in self.referenced_params
+            and getattr(self.dataset, "_version", None) is None
+            and not isinstance(self.dataset, DATA_HOLDING_DATASETS)
+        )
+
+    def render(self, template_args: dict) -> Any:
+        rendered_dataset = self.slot()
+        for attr, template in self.templates.items():
+            setattr(rendered_dataset, attr, template.render(template_args))
+        return rendered_dataset
+
+
+def overlay_dict_update(base_dict: dict, overrides: dict) -> dict:
+    """Merge overrides into a dict without modifying it. Only the dicts along the overridden paths are copied, the other subtrees are shared with the base dict.
+
+    Args:
+        base_dict (dict): original dict, left untouched
+        overrides (dict): nested values overriding the base dict values
+
+    Returns:
+        dict: merged dict
+    """
+    merged_dict = dict(base_dict)
+    for key, value in overrides.items():
+        if isinstance(value, dict):
+            base_value = merged_dict.get(key)
+            merged_dict[key] = overlay_dict_update(
+                base_value if isinstance(base_value, dict) else {}, value
+            )
+        else:
+            merged_dict[key] = value
+    return merged_dict
+
+
+class ParameterRenderPlan:
+    """``ParameterRenderPlan`` hold a snapshot of the parameter datasets values of a namespace, taken once at compile time.
+    Iteration parameters are merged as an overlay on the snapshot, so the parameters are never loaded nor fully copied at iteration time.
+    """
+
+    def __init__(self, catalog_parameters: Optional[Dict[str, Any]] = None) -> None:
+        """Init the ``ParameterRenderPlan`` by loading the parameter datasets once.
+
+        Args:
+            catalog_parameters (dict): Parameter datasets indexed by dataset name.
+        """
+        self.datasets = catalog_parameters or {}
+        self.snapshots = {
+            dataset_name: dataset_value.load()
+            for dataset_name, dataset_value in self.datasets.items()
+        }
+
+    def render(self, dataset_name: str, parameters: Any) -> Any:
+        """Create the parameter dataset of an iteration by merging its parameters onto the snapshot.
+
+        Args:
+            dataset_name (str): Parameter dataset name.
+            parameters (Any): Iteration parameters.
+
+        Returns:
+            MemoryDataset: the rendered parameter dataset, keeping the copy mode of the catalog dataset.
+        """
+        snapshot = self.snapshots[dataset_name]
+        if isinstance(snapshot, dict) and isinstance(parameters, dict):
+            parameters = overlay_dict_update(snapshot, parameters)
+
+        # The data is assigned directly, as saving it would copy the whole parameters tree
+        rendered_dataset = new_iteration_memory_dataset(
+            copy_mode=getattr(self.datasets[dataset_name], "_copy_mode", None)
+        )
+        rendered_dataset._data = parameters
+        return rendered_dataset
+
+
+class TemplateRenderPlan:
+    """``TemplateRenderPlan`` hold the render plans of all the template datasets of a namespace.
+    Rendered datasets that can be reused are kept in a bounded LRU cache, indexed by the values of the template params they need.
+    """
+
+    def __init__(
+        self,
+        catalog_templates: Optional[Dict[str, Any]] = None,
+        cache_size: int = 128,
+    ) -> None:
+        """Init the ``TemplateRenderPlan`` with the template datasets of a catalog assembly.
+
+        Args:
+            catalog_templates (dict): Template datasets indexed by dataset name.
+            cache_size (int): Maximum number of cached renderings. 0 disable the cache.
+        """
+        catalog_templates = catalog_templates or {}
+        self.datasets_plans = {
+            dataset_name: DatasetRenderPlan(dataset_value)
+            for dataset_name, dataset_value in catalog_templates.items()
+        }
+        self.template_params: List[str] = sorted(
+            {
+                param
+                for dataset_plan in self.datasets_plans.values()
+                for param in dataset_plan.template_params
+            }
+        )
+
+        self.cache_size = cache_size or 0
+        self._cached_plans = {}
+        self._uncached_plans = {}
+        for dataset_name, dataset_plan in self.datasets_plans.items():
+            if self.cache_size and dataset_plan.cacheable:
+                self._cached_plans[dataset_name] = dataset_plan
+            else:
+                self._uncached_plans[dataset_name] = dataset_plan
+
+        # run_id is never part of the cache key, as the datasets that depends on it are rendered at each iteration
+        self._cache_key_params = sorted(
+            {
+                param.split(".")[0]
+                for dataset_plan in self._cached_plans.values()
+                for param in dataset_plan.referenced_params
+            }
+        )
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __getstate__(self) -> dict:
+        # The rendered datasets cache and its lock are not persisted, a restored plan starts with an empty cache
+        state = dict(self.__dict__)
+        for attribute in ("_cache", "_cache_lock", "_hits", "_misses"):
+            state.pop(attribute)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def render(self, template_args: dict) -> Dict[str, Any]:
+        rendered_datasets = self.render_shared(template_args)
+        rendered_datasets.update(self.render_unshared(template_args))
+        return rendered_datasets
+
+    def render_shared(self, template_args: dict) -> Dict[str, Any]:
+        """Render the cacheable template datasets, shared by the iterations with the same ``cache_key``"""
+        return self._render_cached(template_args)
+
+    def render_unshared(self, template_args: dict) -> Dict[str, Any]:
+        """Render the template datasets rendered at each iteration (ex: the ones using the run_id)"""
+        return {
+            dataset_name: dataset_plan.render(template_args)
+            for dataset_name, dataset_plan in self._uncached_plans.items()
+        }
+
+    def cache_key(self, template_args: dict) -> Optional[tuple]:
+        """Key of the shared template datasets rendered with the template args, None if the args values can't be hashed"""
+        # Values are typed in the key, as 1, 1.0 and True are equal but not rendered the same way
+        cache_key = tuple(
+            (value.__class__, value)
+            for value in (
+                template_args.get(param, _MISSING_TEMPLATE_PARAM)
+                for param in self._cache_key_params
+            )
+        )
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+
+    def cache_info(self) -> TemplateCacheInfo:
+        with self._cache_lock:
+            return TemplateCacheInfo(
+                self._hits, self._misses, self.cache_size, len(self._cache)
+            )
+
+    def _render_cached(self, template_args: dict) -> Dict[str, Any]:
+        if not self._cached_plans:
+            return {}
+
+        cache_key = self.cache_key(template_args)
+        if cache_key is None:
+            # Unhashable template params values can't be cached
+            return self._render_cached_plans(template_args)
+
+        with self._cache_lock:
+            rendered_datasets = self._cache.get(cache_key)
+            if rendered_datasets is not None:
+                self._cache.move_to_end(cache_key)
+                self._hits += 1
+                return dict(rendered_datasets)
+            self._misses += 1
+
+        rendered_datasets = self._render_cached_plans(template_args)
+
+        with self._cache_lock:
+            self._cache[cache_key] = rendered_datasets
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return dict(rendered_datasets)
+
+    def _render_cached_plans(self, template_args: dict) -> Dict[str, Any]:
+        return {
+            dataset_name: dataset_plan.render(template_args)
+            for dataset_name, dataset_plan in self._cached_plans.items()
+        }
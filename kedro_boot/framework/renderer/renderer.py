@@ -1,28 +1,39 @@
 """Helper functions for rendering catalogs using iteration datasets"""
 
-import copy
 import logging
 from pathlib import PurePath
 import re
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 from omegaconf import OmegaConf
 
-from kedro.io import MemoryDataset
+from .converters import input_converters
+from .datasets import create_input_dataset
 
 LOGGER = logging.getLogger(__name__)
 
 
-def render_datasets(datasets: Dict[str, Any]) -> Dict[str, Any]:  # type: ignore
-    return {
-        dataset_name: copy.deepcopy(dataset_value)
-        for dataset_name, dataset_value in datasets.items()
-    }
+def render_slot_datasets(slots: Dict[str, Any]) -> Dict[str, Any]:  # type: ignore
+    return {dataset_name: slot() for dataset_name, slot in slots.items()}
 
 
 def render_template_datasets(
-    catalog_templates: Dict[str, Any], iteration_template_params: dict
+    template_render_plan: Any, iteration_template_params: dict
 ) -> Dict[str, Any]:  # type: ignore
-    template_params = recursively_get_dataset_template_params(catalog_templates)
+    """Render the template datasets of a namespace by running their precompiled ``TemplateRenderPlan``.
+
+    Args:
+        template_render_plan (TemplateRenderPlan): render plan compiled from the catalog templates.
+        iteration_template_params (dict): App itertime params that will resolve the itertime_params resolvers.
+    """
+    check_template_params(template_render_plan, iteration_template_params)
+    return template_render_plan.render(iteration_template_params)
+
+
+def check_template_params(
+    template_render_plan: Any, iteration_template_params: dict
+) -> None:
+    """Warn about the template params missing in the iteration template params, or not used by the template datasets."""
+    template_params = template_render_plan.template_params
     remaining_catalog_tempate_params = set(template_params) - set(
         iteration_template_params
     )
@@ -42,20 +53,17 @@ def render_template_datasets(
             f"There is remaining iteration template params that are not used for rendering template expressions. Template expressions are {set(template_params)} and the actual given iteration template params are {iteration_template_params_without_run_id}. {remaining_iteration_template_params} are remaining unused"
         )
 
-    rendered_datasets = {}
-    for dataset_name, dataset_value in catalog_templates.items():
-        rendered_dataset_value = copy.deepcopy(dataset_value)
-        recursively_render_parametrized_dataset_template(
-            rendered_dataset_value, iteration_template_params
-        )
-        rendered_datasets[dataset_name] = rendered_dataset_value
-
-    return rendered_datasets
-
 
 def render_parameter_datasets(
-    catalog_parameters: Dict[str, Any], iteration_parameters: dict
+    parameter_render_plan: Any, iteration_parameters: dict
 ) -> Dict[str, Any]:  # type: ignore
+    """Render the parameter datasets of a namespace by merging the iteration parameters onto their compile time snapshot.
+
+    Args:
+        parameter_render_plan (ParameterRenderPlan): parameters snapshot compiled from the catalog parameters.
+        iteration_parameters (dict): App parameters that will be injected into the catalog.
+    """
+    catalog_parameters = parameter_render_plan.datasets
     formatted_iteration_params = {
         f"params:{param_name}": param_value
         for param_name, param_value in iteration_parameters.items()
@@ -71,7 +79,7 @@ def render_parameter_datasets(
 
     # check remaining iteration parameters in case of having only parameters dataset
     if "parameters" in catalog_parameters and len(catalog_parameters) == 1:
-        catalog_parameters_values = catalog_parameters.get("parameters").load()
+        catalog_parameters_values = parameter_render_plan.snapshots.get("parameters")
         iteration_parameters_values = formatted_iteration_params.get("parameters", {})
         remaining_iteration_params = set(iteration_parameters_values) - set(
             catalog_parameters_values
@@ -93,20 +101,9 @@ def render_parameter_datasets(
 
     for dataset_name, dataset_value in catalog_parameters.items():
         if formatted_iteration_params.get(dataset_name):
-            rendered_dataset_value = copy.deepcopy(dataset_value)
-
-            parameters = rendered_dataset_value.load()
-
-            if isinstance(parameters, dict):
-                rendered_datasets[dataset_name] = MemoryDataset(
-                    _recursive_dict_update(
-                        parameters, formatted_iteration_params.get(dataset_name)
-                    )
-                )
-            else:
-                rendered_datasets[dataset_name] = MemoryDataset(
-                    formatted_iteration_params[dataset_name]
-                )
+            rendered_datasets[dataset_name] = parameter_render_plan.render(
+                dataset_name, formatted_iteration_params[dataset_name]
+            )
         else:
             rendered_datasets[dataset_name] = dataset_value
 
@@ -114,7 +111,9 @@ def render_parameter_datasets(
 
 
 def render_input_datasets(
-    catalog_inputs: Dict[str, Any], iteration_inputs: dict
+    catalog_inputs: Dict[str, Any],
+    iteration_inputs: dict,
+    copy_modes: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:  # type: ignore
     remaining_catalog_inputs = set(catalog_inputs) - set(iteration_inputs)
 
@@ -130,29 +129,15 @@ def render_input_datasets(
             f"These iteration inputs datasets {remaining_iteration_inputs} are not used in rendering catalog inputs datasets. Catalog inputs are {set(catalog_inputs)} and the actual given iteration inputs are {set(iteration_inputs)}."
         )
 
+    copy_modes = copy_modes or {}
     rendered_datasets = {}
 
     for dataset_name, dataset_value in catalog_inputs.items():
         LOGGER.info(f"Injecting '{dataset_name}' input into the catalog")
-        rendered_dataset_value = copy.deepcopy(dataset_value)
-        iteration_input_data = iteration_inputs[dataset_name]
-        if "pandas" in str(rendered_dataset_value.__class__).lower() and (
-            isinstance(iteration_input_data, dict)
-            or (
-                isinstance(iteration_input_data, list)
-                and all(isinstance(item, dict) for item in iteration_input_data)
-            )
-        ):
-            # Lazily import pandas. We expect user have pandas installed if they use pandas datasets
-            import pandas as pd
-
-            LOGGER.info(f"Converting '{dataset_name}' to pandas")
-            rendered_dataset_value = MemoryDataset(
-                pd.json_normalize(iteration_inputs[dataset_name])
-            )
-        else:
-            rendered_dataset_value = MemoryDataset(iteration_inputs[dataset_name])
-        rendered_datasets[dataset_name] = rendered_dataset_value
+        rendered_datasets[dataset_name] = create_input_dataset(
+            input_converters.convert(dataset_value, iteration_inputs[dataset_name]),
+            copy_mode=copy_modes.get(dataset_name),
+        )
 
     return rendered_datasets
 
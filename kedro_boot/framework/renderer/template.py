@@ -0,0 +1,197 @@
+"""A small interpolation engine for the ``${oc.select:key,default}`` expressions produced by the ``itertime_params`` resolver.
+
+The engine covers the subset of the OmegaConf grammar emitted by the resolver (literal text and ``oc.select`` interpolations with typed defaults).
+Any template or template argument outside of this subset is rendered through OmegaConf, so the engine always gives the same output as OmegaConf.
+"""
+
+import functools
+import re
+from typing import Any, List, Optional, Union
+
+from omegaconf import OmegaConf
+
+TEMPLATE_CACHE_SIZE = 4096
+
+_SELECT_PATTERN = re.compile(
+    r"\$\{oc\.select:\s*(?P<key>[A-Za-z_][\w\-]*(?:\.[A-Za-z_][\w\-]*)*)\s*(?:,(?P<default>[A-Za-z0-9_ \t./:+\-%*@?|]*))?\}"
+)
+_LITERAL_FORBIDDEN_CHARS = re.compile(r"[$\\{}]")
+# Same regex as find_config_interpolation_keys, used to report the keys of templates rendered by OmegaConf
+_INTERPOLATION_KEY_PATTERN = re.compile(r"\$\{oc\.select\s*:\s*([^,\s]+)\s*,")
+
+# Typed defaults, following the OmegaConf grammar lexer rules
+_INT_UNSIGNED = r"(?:0|[1-9](?:_?[0-9])*)"
+_POINT_FLOAT = rf"(?:{_INT_UNSIGNED}?\.[0-9](?:_?[0-9])*|{_INT_UNSIGNED}\.)"
+_EXPONENT_FLOAT = rf"(?:(?:{_POINT_FLOAT}|{_INT_UNSIGNED})[eE][+-]?[0-9](?:_?[0-9])*)"
+_INT_PATTERN = re.compile(rf"[+-]?{_INT_UNSIGNED}")
+_FLOAT_PATTERN = re.compile(
+    rf"[+-]?(?:{_EXPONENT_FLOAT}|{_POINT_FLOAT}|[Ii][Nn][Ff]|[Nn][Aa][Nn])"
+)
+_BOOL_PATTERN = re.compile(r"[Tt][Rr][Uu][Ee]|[Ff][Aa][Ll][Ss][Ee]")
+_NULL_PATTERN = re.compile(r"[Nn][Uu][Ll][Ll]")
+
+_MISSING = "???"
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+class _UnsupportedTemplateArgs(Exception):
+    """Raised internally when template args need the OmegaConf resolution"""
+
+
+class SelectToken:
+    """An ``${oc.select:key,default}`` interpolation"""
+
+    def __init__(self, key: str, default: Optional[str] = None) -> None:
+        self.key = key
+        self.key_path = tuple(key.split("."))
+        self.has_default = default is not None
+        self.default = parse_default(default) if self.has_default else None
+
+    def select(self, template_args: dict) -> Any:
+        value = template_args
+        for key in self.key_path:
+            if not isinstance(value, dict):
+                raise _UnsupportedTemplateArgs()
+            if key not in value:
+                return self.default
+            value = value[key]
+
+        if not isinstance(value, _PRIMITIVE_TYPES) or (
+            isinstance(value, str) and _LITERAL_FORBIDDEN_CHARS.search(value)
+        ):
+            raise _UnsupportedTemplateArgs()
+        if value == _MISSING:
+            return self.default
+        return value
+
+
+class CompiledTemplate:
+    """A template tokenized by the kedro boot engine"""
+
+    is_interpolation = True
+
+    def __init__(self, template: str, tokens: List[Union[str, SelectToken]]) -> None:
+        self.template = template
+        self.tokens = tokens
+        self.template_params = sorted(
+            {
+                token.key
+                for token in tokens
+                if isinstance(token, SelectToken) and token.has_default
+            }
+        )
+        # All the selected keys, including the ones without default that are not reported as template params
+        self.referenced_params = sorted(
+            {token.key for token in tokens if isinstance(token, SelectToken)}
+        )
+        self._single_token = tokens[0] if len(tokens) == 1 else None
+
+    def render(self, template_args: dict) -> Any:
+        try:
+            if self._single_token:
+                return self._single_token.select(template_args)
+            return "".join(
+                token if isinstance(token, str) else str(token.select(template_args))
+                for token in self.tokens
+            )
+        except _UnsupportedTemplateArgs:
+            return render_with_omegaconf(self.template, template_args)
+
+
+class OmegaConfTemplate:
+    """A template rendered through OmegaConf, used for the expressions not supported by the kedro boot engine"""
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self.is_interpolation = OmegaConf.is_interpolation(
+            OmegaConf.create({"dataset_entry": template}), "dataset_entry"
+        )
+        self.template_params = sorted(set(_INTERPOLATION_KEY_PATTERN.findall(template)))
+        # Any key of the template args could be resolved by OmegaConf
+        self.referenced_params = None
+
+    def render(self, template_args: dict) -> Any:
+        return render_with_omegaconf(self.template, template_args)
+
+
+def tokenize(template: str) -> Optional[List[Union[str, SelectToken]]]:
+    """Split a template into literal strings and ``SelectToken``.
+
+    Args:
+        template (str): template string
+
+    Returns:
+        Optional[List[Union[str, SelectToken]]]: the tokens, or None if the template is outside the engine grammar
+    """
+    tokens = []
+    position = 0
+    for match in _SELECT_PATTERN.finditer(template):
+        literal = template[position : match.start()]
+        if literal:
+            tokens.append(literal)
+        default = match.group("default")
+        if default is not None and not default.strip():
+            return None
+        tokens.append(SelectToken(match.group("key"), default))
+        position = match.end()
+
+    if position < len(template):
+        tokens.append(template[position:])
+
+    for token in tokens:
+        if isinstance(token, str) and _LITERAL_FORBIDDEN_CHARS.search(token):
+            return None
+
+    if not any(isinstance(token, SelectToken) for token in tokens):
+        return None
+
+    return tokens
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(template: str) -> Union[CompiledTemplate, OmegaConfTemplate]:
+    """Compile a template string, falling back to OmegaConf for the expressions not supported by the engine.
+
+    Args:
+        template (str): template string
+
+    Returns:
+        Union[CompiledTemplate, OmegaConfTemplate]: compiled template
+    """
+    tokens = tokenize(template)
+    if tokens:
+        return CompiledTemplate(template, tokens)
+    return OmegaConfTemplate(template)
+
+
+def is_template(value: str) -> bool:
+    """Check if a string contains interpolations"""
+    if "${" not in value:
+        return False
+    return compile_template(value).is_interpolation
+
+
+def parse_default(default: str) -> Any:
+    """Type an unquoted default value the same way the OmegaConf grammar does.
+
+    Args:
+        default (str): raw default value
+
+    Returns:
+        Any: None, bool, int, float or str
+    """
+    default = default.strip(" \t")
+    if _NULL_PATTERN.fullmatch(default):
+        return None
+    if _BOOL_PATTERN.fullmatch(default):
+        return default.lower() == "true"
+    if _INT_PATTERN.fullmatch(default):
+        return int(default.replace("_", ""))
+    if _FLOAT_PATTERN.fullmatch(default):
+        return float(default.replace("_", ""))
+    return default
+
+
+def render_with_omegaconf(template: str, template_args: dict) -> Any:
+    config = OmegaConf.create({**{"dataset_entry": template}, **template_args})
+    return config.dataset_entry
@@ -0,0 +1,62 @@
+"""Parameter grids of ``KedroBootSession.map``, and the iterations run by its forked worker processes."""
+
+import itertools
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+# State of a forked worker process of ``KedroBootSession.map``, set once by the pool initializer in the worker. The parent process never sets it
+_forked_worker_state = None
+
+# Threads whose locks may be held at fork time while they load artifacts
+FORK_UNSAFE_THREADS_PREFIX = "kedro-boot-prefetch"
+
+
+def iter_parameter_grid(
+    grid: Union[Dict[str, List[Any]], Iterable[dict]],
+) -> Iterator[dict]:
+    """Iterate over the parameters of a grid.
+
+    Args:
+        grid (Union[Dict[str, List[Any]], Iterable[dict]]): lists of values indexed by parameter name, whose cartesian product gives the grid points. Or an iterable of parameters dicts.
+
+    Returns:
+        Iterator[dict]: parameters of each grid point
+    """
+    if isinstance(grid, dict):
+        parameters_names = list(grid)
+        for values in itertools.product(*grid.values()):
+            yield dict(zip(parameters_names, values))
+    else:
+        yield from grid
+
+
+def live_kedro_boot_threads() -> List[str]:
+    """Names of the kedro boot threads alive in the current process, that would not survive a fork"""
+    return [
+        thread.name
+        for thread in threading.enumerate()
+        if thread.name.startswith("kedro-boot")
+        and thread is not threading.current_thread()
+    ]
+
+
+def init_forked_worker(
+    session: Any,
+    namespace: Optional[str],
+    inputs: Optional[dict],
+    itertime_params: Optional[dict],
+) -> None:
+    """Initializer of the forked worker processes. Its arguments are inherited through the fork, so they are neither pickled nor copied until written"""
+    global _forked_worker_state
+    _forked_worker_state = (session, namespace, inputs, itertime_params)
+
+
+def run_forked_iteration(parameters: dict) -> Any:
+    """Run an iteration in a forked worker process, with the session and the map arguments inherited from the parent process"""
+    session, namespace, inputs, itertime_params = _forked_worker_state
+    return session.run(
+        namespace=namespace,
+        inputs=inputs,
+        parameters=parameters,
+        itertime_params=itertime_params,
+    )
@@ -0,0 +1,106 @@
+"""Dispatch the kedro hooks of the namespaces iterations following their hook mode, and record the iterations timings."""
+
+import itertools
+import threading
+from collections import namedtuple
+from typing import Any
+
+from kedro.framework.hooks.manager import _NullPluginManager
+from pluggy import PluginManager
+
+IterationStats = namedtuple(
+    "IterationStats",
+    [
+        "iterations",
+        "hooked_iterations",
+        "render_time",
+        "run_time",
+        "max_iteration_time",
+    ],
+)
+
+
+class HookDispatcher:
+    """``HookDispatcher`` select the hook manager of each iteration of a namespace.
+
+    - ``full``: the project hooks are fired at each iteration
+    - ``sampled``: the project hooks are fired at the first iteration, then once every ``hook_sampling`` iterations
+    - ``off``: the project hooks are never fired at iteration time
+    """
+
+    def __init__(
+        self,
+        hook_manager: PluginManager,
+        hook_mode: str = "full",
+        hook_sampling: int = 1,
+    ) -> None:
+        """Init the ``HookDispatcher``.
+
+        Args:
+            hook_manager (PluginManager): kedro project hook manager
+            hook_mode (str): "full", "sampled" or "off"
+            hook_sampling (int): fire the hooks for 1 in ``hook_sampling`` iterations, in sampled mode
+        """
+        self.hook_manager = hook_manager
+        self.hook_mode = hook_mode
+        self.hook_sampling = hook_sampling
+        self._null_hook_manager = _NullPluginManager()
+        # next() on itertools.count is atomic, so concurrent iterations never share a sample
+        self._iterations_counter = itertools.count()
+
+    def select(self) -> Any:
+        """Select the hook manager of an iteration.
+
+        Returns:
+            Union[PluginManager, _NullPluginManager]: the project hook manager, or a hook manager ignoring all the hooks calls
+        """
+        if self.hook_mode == "full":
+            return self.hook_manager
+        if (
+            self.hook_mode == "sampled"
+            and next(self._iterations_counter) % self.hook_sampling == 0
+        ):
+            return self.hook_manager
+        return self._null_hook_manager
+
+    def is_hooked(self, hook_manager: Any) -> bool:
+        return hook_manager is not self._null_hook_manager
+
+
+class IterationStatsRecorder:
+    """``IterationStatsRecorder`` accumulate the timings of a namespace iterations. It's always on, whatever the hook mode."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._iterations = 0
+        self._hooked_iterations = 0
+        self._render_time = 0.0
+        self._run_time = 0.0
+        self._max_iteration_time = 0.0
+
+    def record(self, render_time: float, run_time: float, hooked: bool) -> None:
+        """Record an iteration timings.
+
+        Args:
+            render_time (float): catalog rendering time, in seconds
+            run_time (float): pipeline run time (outputs loading included), in seconds
+            hooked (bool): whether the project hooks were fired for this iteration
+        """
+        with self._lock:
+            self._iterations += 1
+            self._hooked_iterations += hooked
+            self._render_time += render_time
+            self._run_time += run_time
+            self._max_iteration_time = max(
+                self._max_iteration_time, render_time + run_time
+            )
+
+    def info(self) -> IterationStats:
+        with self._lock:
+            return IterationStats(
+                self._iterations,
+                self._hooked_iterations,
+                self._render_time,
+                self._run_time,
+                self._max_iteration_time,
+            )
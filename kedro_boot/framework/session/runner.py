@@ -1,8 +1,10 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from pluggy import PluginManager
 from kedro.runner import AbstractRunner, SequentialRunner
 from kedro.pipeline import Pipeline
-from kedro.io import DataCatalog
+from kedro.io import DataCatalog, MemoryDataset
+
+from kedro_boot.framework.compiler.executor import CompiledPipelineExecutor
 
 
 class KedroBootRunner:
@@ -23,14 +25,30 @@ class KedroBootRunner:
         self._hook_manager = hook_manager
 
     def run(
-        self, pipeline: Pipeline, catalog: DataCatalog, outputs_datasets: List[str]
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        outputs_datasets: List[str],
+        executor: Optional[CompiledPipelineExecutor] = None,
+        hook_manager: Optional[PluginManager] = None,
+        runner: Optional[AbstractRunner] = None,
     ) -> Dict[str, Any]:
-        self.runner.run(
-            pipeline=pipeline,
-            catalog=catalog,
-            hook_manager=self._hook_manager,
-            session_id=self._session_id,
-        )
+        # The hook manager of the iteration can be overridden by the session, following the namespace hook mode
+        hook_manager = hook_manager or self._hook_manager
+        if executor:
+            executor.run(
+                catalog=catalog,
+                hook_manager=hook_manager,
+                session_id=self._session_id,
+            )
+        else:
+            # The namespace runner, if any, takes precedence over the session runner
+            (runner or self.runner).run(
+                pipeline=pipeline,
+                catalog=catalog,
+                hook_manager=hook_manager,
+                session_id=self._session_id,
+            )
 
         output_datasets = {}
         # if multiple outputs datasets, load the returned datasets indexed by pipeline view outputs
@@ -46,8 +64,7 @@ class KedroBootRunner:
             output_datasets = {
                 dataset_name: catalog.load(dataset_name)
                 for dataset_name in pipeline.outputs()
-                if catalog._datasets[dataset_name].__class__.__name__.lower()
-                == "memorydataset"
+                if isinstance(catalog._datasets[dataset_name], MemoryDataset)
             }
         return output_datasets
 
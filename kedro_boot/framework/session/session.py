@@ -1,21 +1,69 @@
 """This module implements Kedro boot session. A user facing interface responsible for orchestring the interaction between kedro and the Apps."""
 
+import asyncio
+import contextvars
+import functools
+import itertools
 import logging
+import multiprocessing
+import os
+import threading
+import time
 import uuid
-from typing import Any, List, Optional
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from kedro import __version__ as kedro_version
 from kedro.config import OmegaConfigLoader
 from kedro.io import DataCatalog
 from pluggy import PluginManager
 from kedro.pipeline.pipeline import Pipeline
 
-from kedro_boot.framework.compiler.specs import CompilationSpec
+from kedro_boot.framework.compiler.specs import CompilationSpec, MaterializationSpec
 
 from kedro_boot.framework.context import KedroBootContext
+from kedro_boot.framework.context.artifacts import (
+    ArtifactsDeduplication,
+    ArtifactsMemoryInfo,
+    ArtifactsReadiness,
+)
+from .grid import (
+    FORK_UNSAFE_THREADS_PREFIX,
+    init_forked_worker,
+    iter_parameter_grid,
+    live_kedro_boot_threads,
+    run_forked_iteration,
+)
+from .hooks import HookDispatcher, IterationStats, IterationStatsRecorder
 from .runner import KedroBootRunner
 
 LOGGER = logging.getLogger(__name__)
 
+# Keys of the ``run_params`` given by ``KedroSession.run`` to the pipeline hooks
+KEDRO_RUN_PARAMS = (
+    "session_id",
+    "project_path",
+    "env",
+    "kedro_version",
+    "tags",
+    "from_nodes",
+    "to_nodes",
+    "node_names",
+    "from_inputs",
+    "to_outputs",
+    "load_versions",
+    "extra_params",
+    "pipeline_name",
+    "namespace",
+    "runner",
+)
+
 
 class KedroBootSession:
     """``KedroBootSession`` A user facing interface that expose kedro's resource to the kedro boot apps.
@@ -32,6 +80,7 @@ class KedroBootSession:
         session_id: str,
         app_runtime_params: dict,
         config_loader: OmegaConfigLoader,
+        run_params: Optional[dict] = None,
     ) -> None:
         """Init the kedro boot session.
 
@@ -42,20 +91,47 @@ class KedroBootSession:
             session_id (str): kedro ``KedroSession`` session_id
             app_runtime_params (dict): params given by an App specific CLI
             config_loader (OmegaConfigLoader): kedro ``OmegaConfigLoader`` object
+            run_params (dict): ``run_params`` of the kedro run booting the app, given to the pipeline hooks of the iterations. Default to None, built from the config loader
         """
         self._context = KedroBootContext(pipeline=pipeline, catalog=catalog)
         self._runner = KedroBootRunner(hook_manager=hook_manager, session_id=session_id)
+        self._hook_manager = hook_manager
+        self._hook_dispatchers = {}
+        self._iteration_stats = {}
+        self._iteration_executor = None
+        self._iteration_executor_workers = None
+        self._iteration_executor_lock = threading.Lock()
+        self._compile_lock = threading.Lock()
 
         self.app_runtime_params = app_runtime_params
         self.config_loader = config_loader
+        self.run_params = {
+            **dict.fromkeys(KEDRO_RUN_PARAMS),
+            "session_id": session_id,
+            "env": getattr(config_loader, "env", None),
+            "kedro_version": kedro_version,
+            "extra_params": getattr(config_loader, "runtime_params", None),
+            **(run_params or {}),
+        }
 
         self._is_catalog_compiled = False
 
-    def compile(self, compilation_specs: List[CompilationSpec] = None) -> None:
+    def compile(
+        self,
+        compilation_specs: List[CompilationSpec] = None,
+        materialization_spec: Optional[MaterializationSpec] = None,
+        snapshot_path: Optional[str] = None,
+        start_background_tasks: bool = True,
+    ) -> None:
         """Prepare the Catalog for iteration time. The goal is to achieve low latency by minimizing operations needed during the run of an iteration.
         A pipeline view provides a perspective on the underlying pipeline, filtered by a particular tag and organized by datasets categories according to their relevance to the external application.
         The compilation is triggered automatically by the kedro boot. To give the app the control of the compilation point, set the AbstractKedroBootApp class attribute 'LAZY_COMPILE' to True. If the compilation is neither triggered by the kedro project nor the app, it will be triggered lazily during the first run iteration.
 
+        Args:
+            compilation_specs (List[CompilationSpec]): Compilation Specs provided by the App. compilation_specs are infered from the pipeline if no compilation_specs provided.
+            materialization_spec (MaterializationSpec): How the artifacts datasets are materialized. Default to loading them in the process memory.
+            snapshot_path (str): Compiled snapshot file, loaded if it matches the compilation, written otherwise. Default to None, no snapshot
+            start_background_tasks (bool): Start the artifacts background tasks (prefetch and watcher) once compiled, otherwise they are started by ``start_artifacts_background_tasks``. Default to True
 
         Raises:
             KedroBootSessionError: _description_
@@ -63,9 +139,18 @@ class KedroBootSession:
         if self._is_catalog_compiled:
             LOGGER.warning("The session is already compiled")
         else:
-            self._context.compile(compilation_specs=compilation_specs)
+            self._context.compile(
+                compilation_specs=compilation_specs,
+                materialization_spec=materialization_spec,
+                snapshot_path=snapshot_path,
+                start_background_tasks=start_background_tasks,
+            )
             self._is_catalog_compiled = True
 
+    def start_artifacts_background_tasks(self) -> None:
+        """Start the artifacts background tasks (prefetch and watcher) deferred at compile time"""
+        self._context.start_artifacts_background_tasks()
+
     def run(
         self,
         namespace: Optional[str] = None,
@@ -73,8 +158,10 @@ class KedroBootSession:
         parameters: Optional[dict] = None,
         itertime_params: Optional[dict] = None,
         run_id: Optional[str] = None,
+        copy_mode: Optional[Union[str, Dict[str, str]]] = None,
     ) -> Any:
         """Perform a low-latency run of a pipeline's namespace using the provided inputs, parameters and itertime_params.
+        If the namespace hook mode fires the hooks for the run, ``before_pipeline_run`` and ``after_pipeline_run`` are fired around it, like for a ``run_batch`` of one item.
 
         Args:
             namespace (str): pipeline's namespace.
@@ -82,6 +169,7 @@ class KedroBootSession:
             parameters (dict): App parameters datasets that will be injected into the catalog.
             itertime_params (dict): App itertime params that will resolve the itertime_params resolvers.
             run_id (str): run_id can be generated by the app, otherwise the session generate it at each iteration.
+            copy_mode (Union[str, Dict[str, str]]): Copy mode of the inputs datasets, for all the inputs or by input name: "deepcopy", "copy", "assign" (zero-copy) or "readonly" (zero-copy read-only view). Override the namespace compilation spec copy mode.
 
         Raises:
             KedroBootSessionError: _description_
@@ -89,34 +177,507 @@ class KedroBootSession:
         Returns:
             Any: Run results
         """
+        self._compile_lazily()
+
+        hook_dispatcher = self._get_hook_dispatcher(namespace)
+        hook_manager = hook_dispatcher.select()
+        hooked = hook_dispatcher.is_hooked(hook_manager)
+        run_id = run_id or uuid.uuid4().hex
+        return self._run_pipeline(
+            namespace=namespace,
+            run_id=run_id,
+            hook_manager=hook_manager,
+            hooked=hooked,
+            run=lambda: self._run_iteration(
+                namespace=namespace,
+                inputs=inputs,
+                parameters=parameters,
+                itertime_params=itertime_params,
+                run_id=run_id,
+                copy_mode=copy_mode,
+                hook_manager=hook_manager,
+                hooked=hooked,
+            ),
+        )
+
+    def run_batch(
+        self,
+        namespace: Optional[str] = None,
+        inputs_list: Optional[List[dict]] = None,
+        parameters_list: Optional[List[dict]] = None,
+        itertime_params_list: Optional[List[dict]] = None,
+        copy_mode: Optional[Union[str, Dict[str, str]]] = None,
+        concurrent: bool = False,
+    ) -> List[Any]:
+        """Perform a batch of runs of a pipeline's namespace, one run per item of the inputs, parameters and itertime_params lists.
+        The namespace resources (compiled catalog, runner, hook mode, copy modes) are resolved once for the whole batch, the shared template datasets are rendered once per distinct itertime params, and the catalog of each iteration is an overlay of a catalog built once for the batch.
+        The batch is accounted as a single pipeline run by the hooks: if the namespace hook mode fires the hooks for the batch, ``before_pipeline_run`` and ``after_pipeline_run`` are fired once around the batch, and the node and dataset hooks are fired for every iteration. The "sampled" hook mode samples whole batches. The pipeline hooks get the ``run_params`` of the kedro run, with the ``batch_size``.
+        Args:
+            namespace (str): pipeline's namespace.
+            inputs_list (List[dict]): App inputs datasets of each iteration.
+            parameters_list (List[dict]): App parameters datasets of each iteration.
+            itertime_params_list (List[dict]): App itertime params of each iteration.
+            copy_mode (Union[str, Dict[str, str]]): Copy mode of the inputs datasets of all the iterations. Override the namespace compilation spec copy mode.
+            concurrent (bool): Run the iterations concurrently on the session iteration executor, instead of back-to-back in the calling thread. Default to False
+
+        Raises:
+            KedroBootSessionError: The given lists don't have the same length
+
+        Returns:
+            List[Any]: Run results, in the order of the given lists
+        """
+        batch_lists = [
+            batch_list
+            for batch_list in (inputs_list, parameters_list, itertime_params_list)
+            if batch_list is not None
+        ]
+        batch_sizes = {len(batch_list) for batch_list in batch_lists}
+        if len(batch_sizes) > 1:
+            raise KedroBootSessionError(
+                f"The inputs, parameters and itertime_params lists of a batch should have the same length. Got lists of {sorted(batch_sizes)} items"
+            )
+        batch_size = batch_sizes.pop() if batch_sizes else 0
+        inputs_list = inputs_list or [None] * batch_size
+        parameters_list = parameters_list or [None] * batch_size
+        itertime_params_list = itertime_params_list or [None] * batch_size
+
+        self._compile_lazily()
+
+        hook_dispatcher = self._get_hook_dispatcher(namespace)
+        batch_hook_manager = hook_dispatcher.select()
+        batch_hooked = hook_dispatcher.is_hooked(batch_hook_manager)
+
+        batch_render = self._context.get_batch_renderer(namespace, copy_mode)
+
+        def run_iteration(index: int) -> Any:
+            return self._run_iteration(
+                namespace=namespace,
+                inputs=inputs_list[index],
+                parameters=parameters_list[index],
+                itertime_params=itertime_params_list[index],
+                hook_manager=batch_hook_manager,
+                hooked=batch_hooked,
+                render=batch_render,
+            )
+
+        def run_iterations() -> List[Any]:
+            if concurrent:
+                return list(
+                    self.get_iteration_executor().map(run_iteration, range(batch_size))
+                )
+            return [run_iteration(index) for index in range(batch_size)]
+
+        return self._run_pipeline(
+            namespace=namespace,
+            run_id=uuid.uuid4().hex,
+            hook_manager=batch_hook_manager,
+            hooked=batch_hooked,
+            run=run_iterations,
+            batch_size=batch_size,
+        )
+
+    def map(
+        self,
+        namespace: Optional[str] = None,
+        grid: Union[Dict[str, List[Any]], Iterable[dict]] = None,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        inputs: Optional[dict] = None,
+        itertime_params: Optional[dict] = None,
+    ) -> Iterator[Tuple[dict, Any]]:
+        """Run a pipeline's namespace over a parameter grid, in parallel with a pool of threads or processes. Results are streamed as the runs complete.
+
+        In process mode, the workers are forked from the app process, so they inherit the compiled catalog, the materialized artifacts and the map inputs instead of loading or pickling them again. Only the grid points and the run results, that should be picklable, are sent between the processes.
+
+        Args:
+            namespace (str): pipeline's namespace.
+            grid (Union[Dict[str, List[Any]], Iterable[dict]]): lists of parameters values indexed by parameter name, whose cartesian product gives the grid points. Or an iterable of App parameters dicts.
+            executor (str): "thread" for I/O bound namespaces, "process" for CPU bound namespaces. Default to "thread"
+            max_workers (int): maximum number of concurrent runs. Default to the pool executor default
+            inputs (dict): App inputs datasets of all the runs.
+            itertime_params (dict): App itertime params of all the runs.
+
+        Raises:
+            KedroBootSessionError: unsupported executor, or process executor forking while the artifacts are prefetched
+
+        Returns:
+            Iterator[Tuple[dict, Any]]: (parameters, run results) of each grid point, in completion order
+        """
+        if executor not in ("thread", "process"):
+            raise KedroBootSessionError(
+                f"Invalid map executor: {executor}. Executor should be one of ('thread', 'process')"
+            )
+        if (
+            executor == "process"
+            and "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            raise KedroBootSessionError(
+                "The process map executor needs the 'fork' start method, that is not available on this platform. Please use the thread map executor"
+            )
+
+        # The catalog is compiled before the workers creation, so the forked workers inherit it
+        self._compile_lazily()
+
+        if max_workers is None:
+            # The pools defaults, resolved here as the pending runs are bounded by the number of workers
+            max_workers = (
+                os.cpu_count() or 1
+                if executor == "process"
+                else min(32, (os.cpu_count() or 1) + 4)
+            )
+
+        return self._stream_map_results(
+            namespace=namespace,
+            grid=grid,
+            executor=executor,
+            max_workers=max_workers,
+            inputs=inputs,
+            itertime_params=itertime_params,
+        )
+
+    def _stream_map_results(
+        self,
+        namespace: Optional[str],
+        grid: Union[Dict[str, List[Any]], Iterable[dict]],
+        executor: str,
+        max_workers: int,
+        inputs: Optional[dict],
+        itertime_params: Optional[dict],
+    ) -> Iterator[Tuple[dict, Any]]:
+        # The pool is created at the first result request, and shut down once the results are consumed
+        if executor == "process":
+            live_threads = live_kedro_boot_threads()
+            if any(
+                thread_name.startswith(FORK_UNSAFE_THREADS_PREFIX)
+                for thread_name in live_threads
+            ):
+                raise KedroBootSessionError(
+                    "The process map executor cannot fork the app process while the artifacts are prefetched, as the forked workers could inherit the artifacts locks held by the prefetch threads. Please wait for the 'all' artifacts readiness (KedroBootSession.get_artifacts_readiness) or use the thread map executor"
+                )
+            if live_threads:
+                LOGGER.warning(
+                    f"Forking the map workers while these kedro boot threads are alive: {live_threads}. They will not run in the forked workers"
+                )
+            # The map arguments are inherited by the forked workers, so only the grid points are pickled at each submit
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=init_forked_worker,
+                initargs=(self, namespace, inputs, itertime_params),
+            )
+            run_iteration = run_forked_iteration
+        else:
+            pool = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="kedro-boot-map"
+            )
+            run_iteration = functools.partial(
+                self._run_map_iteration, namespace, inputs, itertime_params
+            )
+
+        # The pending runs are bounded, so a large grid is never fully submitted ahead of its results consumption
+        max_pending_runs = 2 * max_workers
+        grid_points = iter_parameter_grid(grid or {})
+        pending_runs = {}
+        try:
+            while True:
+                for parameters in itertools.islice(
+                    grid_points, max_pending_runs - len(pending_runs)
+                ):
+                    future = pool.submit(run_iteration, parameters)
+                    pending_runs[future] = parameters
+                if not pending_runs:
+                    return
+                completed_runs, _ = wait(pending_runs, return_when=FIRST_COMPLETED)
+                for future in completed_runs:
+                    yield pending_runs.pop(future), future.result()
+        finally:
+            # Runs not started yet are cancelled if the results consumer stops early
+            for future in pending_runs:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+    def _run_map_iteration(
+        self,
+        namespace: Optional[str],
+        inputs: Optional[dict],
+        itertime_params: Optional[dict],
+        parameters: dict,
+    ) -> Any:
+        return self.run(
+            namespace=namespace,
+            inputs=inputs,
+            parameters=parameters,
+            itertime_params=itertime_params,
+        )
+
+    def _run_pipeline(
+        self,
+        namespace: Optional[str],
+        run_id: str,
+        hook_manager: Any,
+        hooked: bool,
+        run: Callable[[], Any],
+        batch_size: Optional[int] = None,
+    ) -> Any:
+        # The runs and the batches are accounted as kedro pipeline runs by the pipeline hooks
+        if not hooked:
+            return run()
+
+        hook = hook_manager.hook
+        run_params = dict(
+            self.run_params,
+            run_id=run_id,
+            namespace=namespace,
+            runner=self._get_runner_name(namespace),
+            batch_size=batch_size,
+        )
+        run_pipeline = self._context.get_pipeline(namespace)
+        hook.before_pipeline_run(
+            run_params=run_params,
+            pipeline=run_pipeline,
+            catalog=self._context.catalog,
+        )
+        try:
+            run_result = run()
+        except Exception as error:
+            hook.on_pipeline_error(
+                error=error,
+                run_params=run_params,
+                pipeline=run_pipeline,
+                catalog=self._context.catalog,
+            )
+            raise
+        hook.after_pipeline_run(
+            run_params=run_params,
+            run_result=run_result,
+            pipeline=run_pipeline,
+            catalog=self._context.catalog,
+        )
+        return run_result
+
+    def _get_runner_name(self, namespace: Optional[str]) -> str:
+        if self._context.get_executor(namespace):
+            return "compiled"
+        runner = self._context.get_runner(namespace) or self._runner.runner
+        return runner.__class__.__name__
+
+    def _run_iteration(
+        self,
+        namespace: Optional[str],
+        inputs: Optional[dict],
+        parameters: Optional[dict],
+        itertime_params: Optional[dict],
+        hook_manager: Any,
+        hooked: bool,
+        run_id: Optional[str] = None,
+        copy_mode: Optional[Union[str, Dict[str, str]]] = None,
+        render: Optional[Callable[..., Tuple[Pipeline, DataCatalog, List[str]]]] = None,
+    ) -> Any:
         # pipeline_view_name = name or DEFAULT_PIPELINE_VIEW_NAME
         iteration_run_id = run_id or uuid.uuid4().hex
         itertime_params = itertime_params or {}
         iteration_template_params = {**itertime_params, **{"run_id": iteration_run_id}}
 
         LOGGER.info(f"Running iteration {iteration_run_id}")
-        # Coompile catalog lazily at first iteration, if it is not already compiled earlier by the app
-        if not self._is_catalog_compiled:
-            LOGGER.warning(
-                "Lazy Catalog compilation at first iteration run. Beware, since no compilation specs given, the compilation specs are infered from the pipeline."
-            )
-            self.compile()
 
-        pipeline, catalog, outputs_datasets = self._context.render(
-            namespace=namespace,
+        render_start = time.perf_counter()
+        if render is None:
+            # The batches render their iterations with the renderer of the batch
+            render = functools.partial(
+                self._context.render, namespace=namespace, copy_mode=copy_mode
+            )
+        pipeline, catalog, outputs_datasets = render(
             inputs=inputs,
             parameters=parameters,
             itertime_params=iteration_template_params,
         )
+        run_start = time.perf_counter()
 
         iteration_outputs = self._runner.run(
-            pipeline=pipeline, catalog=catalog, outputs_datasets=outputs_datasets
+            pipeline=pipeline,
+            catalog=catalog,
+            outputs_datasets=outputs_datasets,
+            executor=self._context.get_executor(namespace),
+            hook_manager=hook_manager,
+            runner=self._context.get_runner(namespace),
+        )
+
+        run_end = time.perf_counter()
+        self._iteration_stats[namespace].record(
+            render_time=run_start - render_start,
+            run_time=run_end - run_start,
+            hooked=hooked,
         )
 
         LOGGER.info(f"Iteration {iteration_run_id} completed")
 
         return iteration_outputs
 
+    def _compile_lazily(self) -> None:
+        # Coompile catalog lazily at first iteration, if it is not already compiled earlier by the app
+        if not self._is_catalog_compiled:
+            with self._compile_lock:
+                # Concurrent first iterations compile the catalog once
+                if not self._is_catalog_compiled:
+                    LOGGER.warning(
+                        "Lazy Catalog compilation at first iteration run. Beware, since no compilation specs given, the compilation specs are infered from the pipeline."
+                    )
+                    self.compile()
+
+    async def arun(
+        self,
+        namespace: Optional[str] = None,
+        inputs: Optional[dict] = None,
+        parameters: Optional[dict] = None,
+        itertime_params: Optional[dict] = None,
+        run_id: Optional[str] = None,
+        copy_mode: Optional[Union[str, Dict[str, str]]] = None,
+    ) -> Any:
+        """Awaitable version of ``run``, for the apps running an event loop. The iteration runs on the session iteration executor, so the event loop is never blocked by a pipeline run.
+
+        Args:
+            namespace (str): pipeline's namespace.
+            inputs (dict): App inputs datasets that will be injected into the catalog.
+            parameters (dict): App parameters datasets that will be injected into the catalog.
+            itertime_params (dict): App itertime params that will resolve the itertime_params resolvers.
+            run_id (str): run_id can be generated by the app, otherwise the session generate it at each iteration.
+            copy_mode (Union[str, Dict[str, str]]): Copy mode of the inputs datasets. Override the namespace compilation spec copy mode.
+
+        Returns:
+            Any: Run results
+        """
+        loop = asyncio.get_running_loop()
+        # The caller context (ex: contextvars set by the app) is propagated to the iteration, as asyncio.to_thread does
+        iteration_context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.get_iteration_executor(),
+            functools.partial(
+                iteration_context.run,
+                self.run,
+                namespace=namespace,
+                inputs=inputs,
+                parameters=parameters,
+                itertime_params=itertime_params,
+                run_id=run_id,
+                copy_mode=copy_mode,
+            ),
+        )
+
+    def set_iteration_executor(
+        self,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Set the executor running the ``arun`` iterations. By default, a thread pool is created at the first ``arun`` call.
+
+        Args:
+            executor (Executor): executor running the iterations. Its lifecycle is managed by the caller.
+            max_workers (int): maximum number of concurrent iterations of the default thread pool, if no executor given. Default to the ``ThreadPoolExecutor`` default.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise KedroBootSessionError(
+                f"The iteration executor max_workers should be a positive integer, {max_workers} given instead"
+            )
+        with self._iteration_executor_lock:
+            self._iteration_executor = executor
+            self._iteration_executor_workers = max_workers
+
+    def get_iteration_executor(self) -> Executor:
+        """Get the executor running the ``arun`` iterations. The default thread pool is created lazily, so it's created in the process serving the app (ex: after a gunicorn worker fork)."""
+        if self._iteration_executor is None:
+            with self._iteration_executor_lock:
+                if self._iteration_executor is None:
+                    self._iteration_executor = ThreadPoolExecutor(
+                        max_workers=self._iteration_executor_workers,
+                        thread_name_prefix="kedro-boot-iteration",
+                    )
+        return self._iteration_executor
+
+    def get_template_cache_info(self, namespace: Optional[str] = None) -> Any:
+        """Get the hits and misses of the rendered template datasets cache of a namespace.
+
+        Args:
+            namespace (str): pipeline's namespace.
+
+        Returns:
+            TemplateCacheInfo: (hits, misses, maxsize, currsize) of the namespace cache
+        """
+        return self._context.get_template_cache_info(namespace)
+
+    def get_iteration_stats(self, namespace: Optional[str] = None) -> IterationStats:
+        """Get the timings of the iterations of a namespace. They are recorded at each iteration, whatever the namespace hook mode.
+
+        Args:
+            namespace (str): pipeline's namespace.
+
+        Returns:
+            IterationStats: (iterations, hooked_iterations, render_time, run_time, max_iteration_time) of the namespace, times in seconds
+        """
+        iteration_stats = self._iteration_stats.get(namespace)
+        if iteration_stats is None:
+            return IterationStatsRecorder().info()
+        return iteration_stats.info()
+
+    def get_artifacts_load_times(self) -> Dict[str, float]:
+        """Get the load time of the artifacts materialized at compile time.
+
+        Returns:
+            Dict[str, float]: load time in seconds, indexed by artifact dataset name
+        """
+        return self._context.get_artifacts_load_times()
+
+    def refresh_artifacts(self, names: Optional[List[str]] = None) -> List[str]:
+        """Reload artifacts from the project catalog (ex: a retrained model), and swap them in the compiled catalog without stopping the iterations.
+
+        Args:
+            names (List[str]): artifacts datasets names. Default to None, all the artifacts
+
+        Returns:
+            List[str]: refreshed artifacts names
+        """
+        self._compile_lazily()
+        return self._context.refresh_artifacts(names)
+
+    def get_artifacts_deduplication(self) -> ArtifactsDeduplication:
+        """Get the artifacts materialized once and shared under several names.
+
+        Returns:
+            ArtifactsDeduplication: (aliases, saved_bytes) of the deduplicated artifacts
+        """
+        return self._context.get_artifacts_deduplication()
+
+    def get_artifacts_memory_info(self) -> ArtifactsMemoryInfo:
+        """Get the metrics of the artifacts memory budget.
+
+        Returns:
+            ArtifactsMemoryInfo: metrics of the evictable artifacts, times in seconds
+        """
+        return self._context.get_artifacts_memory_info()
+
+    def get_artifacts_readiness(self) -> ArtifactsReadiness:
+        """Get the readiness of the artifacts.
+
+        Returns:
+            ArtifactsReadiness: (ready, loaded_artifacts, artifacts, failed_artifacts) of the session
+        """
+        return self._context.get_artifacts_readiness()
+
+    def _get_hook_dispatcher(self, namespace: Optional[str]) -> HookDispatcher:
+        hook_dispatcher = self._hook_dispatchers.get(namespace)
+        if hook_dispatcher is None:
+            compilation_spec = self._context.get_compilation_spec(namespace)
+            # The stats recorder is set before the dispatcher, as concurrent iterations record their stats once they get the dispatcher
+            self._iteration_stats.setdefault(namespace, IterationStatsRecorder())
+            hook_dispatcher = self._hook_dispatchers.setdefault(
+                namespace,
+                HookDispatcher(
+                    self._hook_manager,
+                    hook_mode=compilation_spec.hook_mode,
+                    hook_sampling=compilation_spec.hook_sampling,
+                ),
+            )
+        return hook_dispatcher
+
     def get_credentials(self) -> dict:
         return self.config_loader["credentials"]
 
@@ -1,8 +1,21 @@
+import gc
+import logging
 from collections import Counter
 
+LOGGER = logging.getLogger(__name__)
+
 
 def find_duplicates(lst):
     counter = Counter(lst)
     duplicates = [value for value, count in counter.items() if count > 1]
 
     return duplicates
+
+
+def freeze_heap_before_fork() -> None:
+    """Move all the objects tracked by the garbage collector to a permanent generation, right before forking worker processes.
+    The collections of the workers never visit these objects, so the memory pages they share with the parent (ex: materialized artifacts) are not copied on write by the garbage collector.
+    """
+    gc.collect()
+    gc.freeze()
+    LOGGER.info(f"{gc.get_freeze_count()} objects frozen before forking the workers")
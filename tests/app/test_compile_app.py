@@ -0,0 +1,71 @@
+import logging
+
+import pytest
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+
+from kedro_boot.app import CompileApp
+
+
+def multiply(x, y):
+    return x * y
+
+
+def test_compile_app_snapshot_loaded_by_fastapi_app(tmp_path, monkeypatch, caplog):
+    for module in ["gunicorn", "uvicorn", "pyctuator"]:
+        pytest.importorskip(module)
+    from kedro_boot.app.fastapi import app as fastapi_app_module
+    from kedro_boot.app.fastapi import gunicorn as gunicorn_module
+
+    snapshot_path = tmp_path / "snapshot.pkl"
+    for env in ["base", "local"]:
+        (tmp_path / env).mkdir()
+    # The runtime materialization options are applied by the loading app, they don't outdate the snapshot
+    (tmp_path / "base" / "fastapi.yml").write_text(
+        f"snapshot_path: {snapshot_path}\n"
+        "server:\n  preload_app: true\n"
+        "runners:\n  default: compiled\n"
+        "artifacts:\n  workers: 2\n"
+    )
+
+    class IdleGunicornApp:
+        def __init__(self, app, options=None):
+            pass
+
+        def run(self):
+            pass
+
+    monkeypatch.setattr(gunicorn_module, "GunicornApp", IdleGunicornApp)
+    monkeypatch.setattr(fastapi_app_module, "freeze_heap_before_fork", lambda: None)
+    monkeypatch.setattr(fastapi_app_module.platform, "system", lambda: "Linux")
+
+    def run_app(app, app_runtime_params):
+        app.run(
+            pipeline=pipeline([node(multiply, ["A", "params:B"], "C")]),
+            catalog=DataCatalog(
+                {
+                    "A": MemoryDataset(2),
+                    "params:B": MemoryDataset(3),
+                    "C": MemoryDataset(),
+                }
+            ),
+            hook_manager=_NullPluginManager(),
+            session_id="test1234",
+            app_runtime_params=app_runtime_params,
+            config_loader=OmegaConfigLoader(
+                str(tmp_path), base_env="base", default_run_env="local"
+            ),
+        )
+
+    # kedro boot compile --app kedro_boot.app.fastapi.app.FastApiApp
+    run_app(CompileApp(), {"app": "kedro_boot.app.fastapi.app.FastApiApp"})
+    assert snapshot_path.exists()
+
+    with caplog.at_level(logging.INFO):
+        run_app(fastapi_app_module.FastApiApp(), {})
+    assert (
+        f"Catalog compilation loaded from the compiled snapshot {snapshot_path}"
+        in caplog.text
+    )
@@ -0,0 +1,119 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from kedro_boot.app.fastapi.batching import MicroBatcher, MicroBatcherError, split_rows
+
+
+def test_micro_batcher():
+    batches = []
+
+    async def run_batch(records, parameters, itertime_params):
+        batches.append((len(records), parameters))
+        frame = pd.DataFrame(records)
+        return frame.assign(y=frame["x"] * int(parameters.get("factor", 1)))
+
+    async def send_requests():
+        batcher = MicroBatcher(run_batch, max_batch_size=4, max_wait_ms=20)
+        return await asyncio.gather(
+            batcher.submit({"x": 1}),
+            batcher.submit([{"x": 2}, {"x": 3}]),
+            batcher.submit({"x": 4}),
+            batcher.submit({"x": 5}),
+            batcher.submit({"x": 6}, parameters={"factor": "10"}),
+        )
+
+    results = asyncio.run(send_requests())
+
+    assert sorted(batches, key=str) == sorted(
+        [(4, {}), (1, {}), (1, {"factor": "10"})], key=str
+    )
+    assert [result["y"].tolist() for result in results] == [
+        [1],
+        [2, 3],
+        [4],
+        [5],
+        [60],
+    ]
+
+
+def test_micro_batcher_close():
+    async def run_batch(records, parameters, itertime_params):
+        await asyncio.sleep(0.01)
+        return [record["x"] * 2 for record in records]
+
+    async def close_with_pending_batch():
+        batcher = MicroBatcher(run_batch, max_batch_size=2, max_wait_ms=60_000)
+        running_request = asyncio.ensure_future(batcher.submit([{"x": 1}, {"x": 2}]))
+        pending_request = asyncio.ensure_future(batcher.submit({"x": 3}))
+        await asyncio.sleep(0)
+        # The running batch task is referenced by the batcher until it's done
+        assert len(batcher._tasks) == 1
+        await batcher.close()
+        assert not batcher._tasks
+        return running_request.result(), pending_request.result()
+
+    # The pending batch is run at close, without waiting for its window
+    assert asyncio.run(asyncio.wait_for(close_with_pending_batch(), 5)) == (
+        [2, 4],
+        [6],
+    )
+
+
+def test_fastapi_session_closes_batchers_on_shutdown():
+    import contextlib
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from kedro_boot.app.fastapi.session import KedroFastApiSession
+
+    events = []
+
+    @contextlib.asynccontextmanager
+    async def app_lifespan(app):
+        yield
+        events.append("app shutdown")
+
+    class RecordingBatcher:
+        async def close(self):
+            events.append("batcher closed")
+
+    app = FastAPI(lifespan=app_lifespan)
+    fastapi_session = KedroFastApiSession()
+    fastapi_session._batchers = {"predict": RecordingBatcher()}
+    fastapi_session.close_on_shutdown(app)
+    with TestClient(app):
+        assert events == []
+    assert events == ["app shutdown", "batcher closed"]
+
+
+def test_split_rows():
+    offsets = [0, 1, 3]
+    assert split_rows([1, 2, 3], offsets) == [[1], [2, 3]]
+    assert split_rows({"a": [1, 2, 3]}, offsets) == [{"a": [1]}, {"a": [2, 3]}]
+    with pytest.raises(MicroBatcherError):
+        split_rows([1, 2], offsets)
+    with pytest.raises(MicroBatcherError):
+        split_rows(3, offsets)
+
+
+@pytest.mark.parametrize(
+    "operation_id, expected_args",
+    [
+        ("predict", dict(hook_mode="sampled", hook_sampling=1000)),
+        ("evaluate", dict(hook_mode="off")),
+    ],
+)
+def test_resolve_route_hook_mode(operation_id, expected_args):
+    from kedro_boot.app.fastapi.session import (
+        KedroFastApiSessionError,
+        resolve_route_hook_mode,
+    )
+
+    hook_modes = {"default": "off", "predict": {"mode": "sampled", "sampling": 1000}}
+    assert resolve_route_hook_mode(hook_modes, operation_id) == expected_args
+    assert resolve_route_hook_mode({}, operation_id) == {}
+    with pytest.raises(KedroFastApiSessionError, match="'mode' and 'sampling'"):
+        resolve_route_hook_mode({operation_id: {"rate": 10}}, operation_id)
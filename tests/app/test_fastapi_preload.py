@@ -0,0 +1,117 @@
+import gc
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline
+
+from kedro_boot.framework.session import KedroBootSession
+from kedro_boot.utils import freeze_heap_before_fork
+
+
+class RecordingFastApiSession:
+    def __init__(self, is_compiled: bool) -> None:
+        self.is_compiled = is_compiled
+        self.calls = []
+
+    def compile(self, app, start_background_tasks=True):
+        self.calls.append(("compile", start_background_tasks))
+        self.is_compiled = True
+
+    def start_background_tasks(self):
+        self.calls.append(("start_background_tasks",))
+
+
+@pytest.mark.parametrize(
+    "preloaded, expected_calls",
+    [
+        # The preloaded master compiled the catalog, the worker only starts the artifacts threads
+        (True, [("start_background_tasks",)]),
+        (False, [("compile", True)]),
+    ],
+)
+def test_post_worker_init(preloaded, expected_calls):
+    pytest.importorskip("gunicorn")
+    from kedro_boot.app.fastapi.gunicorn.config import post_worker_init
+    from kedro_boot.app.fastapi.session import kedro_fastapi_session
+
+    app = FastAPI()
+    fastapi_session = RecordingFastApiSession(is_compiled=preloaded)
+    app.dependency_overrides[kedro_fastapi_session] = fastapi_session
+
+    post_worker_init(SimpleNamespace(app=SimpleNamespace(wsgi=lambda: app)))
+
+    assert fastapi_session.calls == expected_calls
+
+
+def test_freeze_heap_before_fork():
+    try:
+        freeze_heap_before_fork()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_fastapi_app_preload(tmp_path, monkeypatch, mock_pipeline: Pipeline):
+    for module in ["gunicorn", "uvicorn", "pyctuator"]:
+        pytest.importorskip(module)
+    from kedro_boot.app.fastapi import app as fastapi_app_module
+    from kedro_boot.app.fastapi import gunicorn as gunicorn_module
+    from kedro_boot.app.fastapi.session import kedro_fastapi_session
+
+    for env in ["base", "local"]:
+        (tmp_path / env).mkdir()
+    (tmp_path / "base" / "fastapi.yml").write_text("server:\n  preload_app: true\n")
+
+    events = []
+    compile_session = KedroBootSession.compile
+
+    def record_compile(self, *args, **kwargs):
+        events.append(("compile", kwargs.get("start_background_tasks", True)))
+        return compile_session(self, *args, **kwargs)
+
+    class RecordingGunicornApp:
+        def __init__(self, app, options=None):
+            self.app = app
+            self.options = options
+
+        def run(self):
+            events.append(("fork_workers", self.options.get("preload_app")))
+
+    monkeypatch.setattr(KedroBootSession, "compile", record_compile)
+    monkeypatch.setattr(
+        fastapi_app_module,
+        "freeze_heap_before_fork",
+        lambda: events.append(("freeze_heap",)),
+    )
+    monkeypatch.setattr(gunicorn_module, "GunicornApp", RecordingGunicornApp)
+    monkeypatch.setattr(fastapi_app_module.platform, "system", lambda: "Linux")
+
+    fastapi_app_module.FastApiApp().run(
+        pipeline=mock_pipeline,
+        catalog=DataCatalog(
+            {
+                "A": MemoryDataset(2),
+                "params:B": MemoryDataset(3),
+                **{dataset_name: MemoryDataset() for dataset_name in "CDEF"},
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="test1234",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(
+            str(tmp_path), base_env="base", default_run_env="local"
+        ),
+    )
+
+    # The catalog is compiled in the master without its artifacts threads, then the heap is frozen before forking the workers
+    assert events == [
+        ("compile", False),
+        ("freeze_heap",),
+        ("fork_workers", True),
+    ]
+    fastapi_app = fastapi_app_module.FastApiApp().load_app(None)
+    assert fastapi_app.dependency_overrides[kedro_fastapi_session].is_compiled
@@ -1,9 +1,18 @@
+import time
+from typing import Dict, Optional
+
+import numpy as np
 import pytest
 from kedro.pipeline.modular_pipeline import pipeline
 from kedro.pipeline import Pipeline, node
 from cookiecutter.main import cookiecutter
 from kedro import __version__ as kedro_version
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _NullPluginManager
 from kedro.framework.startup import _add_src_to_path
+from kedro.io import AbstractDataset, DataCatalog, MemoryDataset
+
+from kedro_boot.framework.session import KedroBootSession
 
 
 @pytest.fixture
@@ -26,6 +35,60 @@ def mock_pipeline() -> Pipeline:
     return pipeline(nodes)
 
 
+class SlowDataset(MemoryDataset):
+    def __init__(self, data, load_time=0.0):
+        super().__init__(data)
+        self.load_time = load_time
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        time.sleep(self.load_time)
+        return super().load()
+
+
+def add_artifacts(features, *artifacts):
+    return features + sum(float(np.sum(artifact)) for artifact in artifacts)
+
+
+@pytest.fixture
+def artifacts_session():
+    """Create sessions whose namespaces add the sum of their artifacts to their features"""
+
+    def create_artifacts_session(
+        namespaces_artifacts: Dict[str, Dict[str, AbstractDataset]],
+        datasets: Optional[Dict[str, AbstractDataset]] = None,
+    ) -> KedroBootSession:
+        artifacts_pipeline = Pipeline([])
+        catalog = {}
+        for namespace, artifacts in namespaces_artifacts.items():
+            artifacts_pipeline += pipeline(
+                [node(add_artifacts, ["features", *artifacts], "prediction")],
+                namespace=namespace,
+            )
+            catalog.update(
+                {
+                    f"{namespace}.features": MemoryDataset(),
+                    f"{namespace}.prediction": MemoryDataset(),
+                    **{
+                        f"{namespace}.{artifact}": dataset
+                        for artifact, dataset in artifacts.items()
+                    },
+                }
+            )
+        catalog.update(datasets or {})
+        return KedroBootSession(
+            pipeline=artifacts_pipeline,
+            catalog=DataCatalog(catalog),
+            hook_manager=_NullPluginManager(),
+            session_id="test1234",
+            app_runtime_params={},
+            config_loader=OmegaConfigLoader(""),
+        )
+
+    return create_artifacts_session
+
+
 _FAKE_PROJECT_NAME = "fake_project"
 
 
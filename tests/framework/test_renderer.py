@@ -0,0 +1,286 @@
+import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+from kedro.io import MemoryDataset
+from kedro.io.memory_dataset import _infer_copy_mode
+from kedro_datasets.json import JSONDataset
+from kedro_datasets.pandas import CSVDataset
+
+from kedro_boot.framework.compiler.specs import CompilationSpec
+from kedro_boot.framework.renderer import datasets
+from kedro_boot.framework.renderer.catalog import LayeredDataCatalog, freeze_datasets
+from kedro_boot.framework.renderer.converters import (
+    InputConverterRegistry,
+    TypedRecords,
+    input_converters,
+)
+from kedro_boot.framework.renderer.datasets import (
+    infer_copy_mode,
+    new_iteration_memory_dataset,
+)
+from kedro_boot.framework.renderer.plan import (
+    DatasetRenderPlan,
+    DatasetSlot,
+    ParameterRenderPlan,
+    TemplateRenderPlan,
+)
+from kedro_boot.framework.renderer.renderer import (
+    recursively_render_parametrized_dataset_template,
+)
+from kedro_boot.framework.renderer.template import (
+    compile_template,
+    render_with_omegaconf,
+)
+
+
+@pytest.mark.parametrize(
+    "template_dataset, template_args",
+    [
+        (
+            JSONDataset(filepath="data_${oc.select:date_param,01_01_1960}.json"),
+            {"date_param": "2024_01_01"},
+        ),
+        (
+            JSONDataset(filepath="data_${oc.select:date_param,01_01_1960}.json"),
+            {},
+        ),
+        (
+            JSONDataset(
+                filepath="${oc.select:folder,data}/${oc.select:run_id,None}.json",
+                save_args={"indent": 4},
+            ),
+            {"folder": "reports", "run_id": "1234"},
+        ),
+    ],
+)
+def test_template_render_plan(template_dataset, template_args):
+    expected_dataset = copy.deepcopy(template_dataset)
+    recursively_render_parametrized_dataset_template(expected_dataset, template_args)
+
+    template_render_plan = TemplateRenderPlan({"dataset": template_dataset})
+    rendered_dataset = template_render_plan.render(template_args)["dataset"]
+
+    assert rendered_dataset is not template_dataset
+    assert rendered_dataset._filepath == expected_dataset._filepath
+    assert rendered_dataset._init_args == expected_dataset._init_args
+    assert "${" in str(template_dataset._filepath)
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "${oc.select:x,01_01_1960}",
+        "data_${oc.select:x,01_01_1960}.csv",
+        "${oc.select:x,1_000}",
+        "${oc.select:x,1.5e3}",
+        "${oc.select:x,true}",
+        "${oc.select:x,null}",
+        "${oc.select:x,None}",
+        "${oc.select:x, spaced value }",
+        "${oc.select:x,s3://bucket/key}",
+        "${oc.select:x,a}/${oc.select:y,b}",
+        "${oc.select:x.y,d}",
+        "${oc.select:x}",
+        "${oc.select:x,'quoted, value'}",
+        "a\\${x}",
+        "${x}",
+    ],
+)
+@pytest.mark.parametrize(
+    "template_args",
+    [{}, {"x": 2}, {"x": "2024_01_01", "y": None}, {"x": {"y": 1.5}}, {"x": "???"}],
+)
+def test_template_engine_matches_omegaconf(template, template_args):
+    try:
+        expected = render_with_omegaconf(template, template_args)
+    except Exception as exc:
+        with pytest.raises(exc.__class__):
+            compile_template(template).render(template_args)
+    else:
+        rendered = compile_template(template).render(template_args)
+        assert rendered == expected
+        assert type(rendered) == type(expected)
+
+
+def test_template_render_plan_cache():
+    template_render_plan = TemplateRenderPlan(
+        {
+            "eval": JSONDataset(filepath="eval_${oc.select:eval_date,none}.json"),
+            "run": JSONDataset(filepath="run_${oc.select:run_id,none}.json"),
+        },
+        cache_size=1,
+    )
+
+    first = template_render_plan.render({"eval_date": "d1", "run_id": "r1"})
+    second = template_render_plan.render({"eval_date": "d1", "run_id": "r2"})
+    third = template_render_plan.render({"eval_date": 1, "run_id": "r3"})
+    fourth = template_render_plan.render({"eval_date": True, "run_id": "r4"})
+
+    assert second["eval"] is first["eval"]
+    assert second["run"]._filepath.name == "run_r2.json"
+    assert third["eval"]._filepath.name == "eval_1.json"
+    assert fourth["eval"]._filepath.name == "eval_True.json"
+    assert template_render_plan.cache_info() == (1, 3, 1, 1)
+
+
+def test_dataset_render_plan_cacheable():
+    class TemplateMemoryDataset(MemoryDataset):
+        def __init__(self, data, filepath):
+            super().__init__(data)
+            self.filepath = filepath
+
+    memory_plan = DatasetRenderPlan(
+        TemplateMemoryDataset(1, "data_${oc.select:eval_date,none}")
+    )
+    json_plan = DatasetRenderPlan(
+        JSONDataset(filepath="eval_${oc.select:eval_date,none}.json")
+    )
+
+    # A memory dataset subclass holds data, each iteration gets its own instance
+    assert not memory_plan.cacheable
+    assert memory_plan.slot.deepcopy
+    assert json_plan.cacheable
+
+
+def test_layered_data_catalog():
+    base_datasets = freeze_datasets({"A": MemoryDataset(1), "B": MemoryDataset(2)})
+    catalog = LayeredDataCatalog(
+        datasets={"B": MemoryDataset(3)}, base_datasets=base_datasets
+    )
+    catalog.add("C", MemoryDataset(4))
+    copied_catalog = catalog.shallow_copy()
+    copied_catalog.add("D", MemoryDataset(5))
+
+    assert catalog.load("A") == 1
+    assert catalog.load("B") == 3
+    assert catalog.load("C") == 4
+    assert copied_catalog.load("D") == 5
+    assert "D" not in catalog
+    assert set(base_datasets) == {"A", "B"}
+
+    # The overlays of a catalog share its base datasets, not its overlay
+    overlay_catalog = catalog.overlay({"E": MemoryDataset(6)})
+    overlay_catalog.add("F", MemoryDataset(7))
+    assert overlay_catalog.load("A") == 1
+    assert overlay_catalog.load("E") == 6
+    assert overlay_catalog.datasets.F.load() == 7
+    assert "C" not in overlay_catalog
+    assert "E" not in catalog and "F" not in catalog
+
+
+def test_dataset_slot():
+    output_slot = DatasetSlot(MemoryDataset())
+    json_slot = DatasetSlot(JSONDataset(filepath="data.json", save_args={"indent": 4}))
+    filled_slot = DatasetSlot(MemoryDataset({"key": "value"}))
+
+    first_output, second_output = output_slot(), output_slot()
+    first_output.save(1)
+    first_json, second_json = json_slot(), json_slot()
+    first_json._save_args["indent"] = 2
+    first_filled = filled_slot()
+    first_filled.load()["key"] = "modified"
+
+    assert not second_output.exists()
+    assert not output_slot.dataset.exists()
+    assert second_json._save_args["indent"] == 4
+    assert second_json._init_args is json_slot.dataset._init_args
+    assert filled_slot().load() == {"key": "value"}
+
+
+def test_parameter_render_plan():
+    parameters = {"model": {"alpha": 1, "layers": [8, 4]}, "threshold": 0.5}
+    parameter_render_plan = ParameterRenderPlan(
+        {
+            "parameters": MemoryDataset(parameters),
+            "params:threshold": MemoryDataset(0.5),
+        }
+    )
+
+    rendered_parameters = parameter_render_plan.render(
+        "parameters", {"model": {"alpha": 2}}
+    )
+    rendered_threshold = parameter_render_plan.render("params:threshold", 0.8)
+
+    assert rendered_parameters.load() == {
+        "model": {"alpha": 2, "layers": [8, 4]},
+        "threshold": 0.5,
+    }
+    assert rendered_threshold.load() == 0.8
+    assert parameter_render_plan.snapshots["parameters"] == parameters
+    assert (
+        rendered_parameters._data["model"]["layers"]
+        is parameter_render_plan.snapshots["parameters"]["model"]["layers"]
+    )
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"a": 1, "b": "x"},
+        [{"a": 1, "b": 2.5, "c": [1, 2]}, {"a": 2, "b": None, "c": []}],
+        [{"a": 1}, {"b": 2}],
+        [{"a": {"x": 1}, "b": 1}],
+        [],
+    ],
+)
+def test_pandas_input_converter(payload):
+    converted = input_converters.convert(CSVDataset(filepath="data.csv"), payload)
+    pd.testing.assert_frame_equal(converted, pd.json_normalize(payload))
+
+
+def test_input_converter_registry():
+    registry = InputConverterRegistry()
+    registry.register("json", lambda data: "path")
+    registry.register(JSONDataset, lambda data: "class")
+    dataset = JSONDataset(filepath="data.json")
+
+    assert registry.convert(dataset, {"a": 1}) == "class"
+    assert registry.convert(dataset, "raw") == "raw"
+    assert registry.convert(MemoryDataset(), {"a": 1}) == {"a": 1}
+
+
+def test_typed_records_input_converter():
+    records = TypedRecords(
+        [{"a": 1, "b": 2, "c": "true"}, {"a": 3, "b": None, "c": "false"}],
+        {"a": "float64", "b": "int64", "c": "bool"},
+    )
+
+    converted = input_converters.convert(CSVDataset(filepath="data.csv"), records)
+
+    assert converted["a"].dtype == "float64"
+    # Values that can't be stored in the declared dtype are inferred
+    assert converted["b"].tolist()[0] == 2
+    assert converted["c"].tolist() == ["true", "false"]
+
+
+def test_typed_records_input_converter_overflow():
+    records = TypedRecords([{"a": 2**70}, {"a": 1}], {"a": "int64"})
+
+    converted = input_converters.convert(CSVDataset(filepath="data.csv"), records)
+
+    # An int beyond the declared dtype is inferred instead of failing the request
+    assert converted["a"].tolist() == [2**70, 1]
+
+
+@pytest.mark.parametrize(
+    "data", [{"a": [1, 2]}, np.arange(3), pd.DataFrame({"a": [1, 2]})]
+)
+def test_iteration_memory_dataset(data):
+    dataset = new_iteration_memory_dataset(data)
+
+    assert infer_copy_mode(data) == _infer_copy_mode(data)
+    assert dataset.load() is not data
+    assert not new_iteration_memory_dataset().exists()
+
+
+def test_readonly_copy_mode_without_copy_on_write(monkeypatch, caplog):
+    monkeypatch.setattr(datasets, "is_pandas_copy_on_write_enabled", lambda pd: False)
+    monkeypatch.setattr(datasets, "_readonly_copy_warned", False)
+
+    CompilationSpec(namespace="n1", inputs=["A"], copy_mode="readonly")
+    CompilationSpec(namespace="n2", inputs=["A"], copy_mode={"A": "readonly"})
+    CompilationSpec(namespace="n3", inputs=["A"], copy_mode="assign")
+
+    assert caplog.text.count("pandas Copy-on-Write is not enabled") == 1
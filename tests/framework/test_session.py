@@ -1,14 +1,35 @@
-from typing import List
-from kedro_boot.framework.session.session import KedroBootSession
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List
+from kedro_boot.framework.compiler.specs import CompilationSpec, MaterializationSpec
+from kedro_boot.framework.session.session import (
+    KEDRO_RUN_PARAMS,
+    KedroBootSession,
+    KedroBootSessionError,
+)
+import numpy as np
 import pytest
-from kedro.pipeline import Pipeline
+from kedro.pipeline import Pipeline, node
 from kedro.pipeline.modular_pipeline import pipeline
-from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.framework.hooks import hook_impl
+from kedro.framework.hooks.manager import _NullPluginManager, _create_hook_manager
 from kedro.config import OmegaConfigLoader
 from kedro.io import DataCatalog, MemoryDataset
 from kedro_datasets.json import JSONDataset
 
+from tests.conftest import SlowDataset
+
 template_filepath = "test_data_${oc.select:date_param,01_01_1960}.csv"
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp_path(tmp_path, monkeypatch):
+    # The templated datasets of the scenarios catalogs are written relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+
 parametrized_test_session_scenarios = [
     (  # Test a non-namespaced pipeline
         [{"namespace": None}],
@@ -229,3 +250,1198 @@ def test_session(
 # TODO: Test that cover warning
 
 # TODO: Tests that covers Exceptions
+
+
+@pytest.mark.parametrize(
+    "spec_copy_mode, run_copy_mode, expected_run_results",
+    [
+        (None, None, {"shares_memory": False, "writeable": True}),
+        ("assign", None, {"shares_memory": True, "writeable": True}),
+        ({"A": "readonly"}, None, {"shares_memory": True, "writeable": False}),
+        ("readonly", "copy", {"shares_memory": False, "writeable": True}),
+    ],
+)
+def test_session_copy_mode(spec_copy_mode, run_copy_mode, expected_run_results):
+    input_data = np.arange(10)
+
+    def describe(x):
+        return {
+            "shares_memory": bool(np.shares_memory(x, input_data)),
+            "writeable": x.flags.writeable,
+        }
+
+    session = KedroBootSession(
+        pipeline=pipeline([node(describe, "A", "B")]),
+        catalog=DataCatalog({"A": MemoryDataset(), "B": MemoryDataset()}),
+        hook_manager=_NullPluginManager(),
+        session_id="test1234",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [CompilationSpec(inputs=["A"], outputs=["B"], copy_mode=spec_copy_mode)]
+    )
+
+    results = session.run(inputs={"A": input_data}, copy_mode=run_copy_mode)
+
+    assert results == expected_run_results
+    assert input_data.flags.writeable
+
+
+class RecordingHooks:
+    def __init__(self):
+        self.calls = []
+        self.run_params = []
+
+    @hook_impl
+    def before_node_run(self, node):
+        self.calls.append(("before_node_run", node.name))
+
+    @hook_impl
+    def after_node_run(self, node):
+        self.calls.append(("after_node_run", node.name))
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name):
+        self.calls.append(("after_dataset_loaded", dataset_name))
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name):
+        self.calls.append(("after_dataset_saved", dataset_name))
+
+    @hook_impl
+    def before_pipeline_run(self, run_params):
+        self.calls.append(("before_pipeline_run", run_params["batch_size"]))
+        self.run_params.append(run_params)
+
+    @hook_impl
+    def after_pipeline_run(self, run_params):
+        self.calls.append(("after_pipeline_run", run_params["batch_size"]))
+
+
+class CatalogReadingHooks:
+    def __init__(self):
+        self.datasets = []
+
+    @hook_impl
+    def before_node_run(self, catalog):
+        self.datasets.append(
+            (catalog.datasets.n1__model.load(), "n1.model" in catalog.list())
+        )
+
+
+@pytest.mark.parametrize("runner", ["sequential", "compiled"])
+def test_session_hooks_read_base_datasets(runner):
+    hooks = CatalogReadingHooks()
+    hook_manager = _create_hook_manager()
+    hook_manager.register(hooks)
+    session = KedroBootSession(
+        pipeline=pipeline([node(multiply, ["A", "model"], "B")], namespace="n1"),
+        catalog=DataCatalog(
+            {
+                "n1.A": MemoryDataset(),
+                "n1.model": MemoryDataset(3),
+                "n1.B": MemoryDataset(),
+            }
+        ),
+        hook_manager=hook_manager,
+        session_id="test1234",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [CompilationSpec(namespace="n1", inputs=["A"], outputs=["B"], runner=runner)]
+    )
+
+    assert session.run(namespace="n1", inputs={"A": 2}) == 6
+    assert hooks.datasets == [(3, True)]
+
+
+def test_session_compiled_runner(mock_pipeline: Pipeline):
+    results = {}
+    calls = {}
+    for runner in ["sequential", "compiled"]:
+        hooks = RecordingHooks()
+        hook_manager = _create_hook_manager()
+        hook_manager.register(hooks)
+        session = KedroBootSession(
+            pipeline=pipeline(mock_pipeline, namespace="n1"),
+            catalog=DataCatalog(
+                {
+                    "n1.A": MemoryDataset(),
+                    "params:n1.B": MemoryDataset(3),
+                    "n1.C": MemoryDataset(),
+                    "n1.D": MemoryDataset(),
+                    "n1.E": MemoryDataset(),
+                    "n1.F": MemoryDataset(),
+                }
+            ),
+            hook_manager=hook_manager,
+            session_id="test1234",
+            app_runtime_params={},
+            config_loader=OmegaConfigLoader(""),
+        )
+        session.compile(
+            [
+                CompilationSpec(
+                    namespace="n1",
+                    inputs=["A"],
+                    outputs=["E", "F"],
+                    parameters=["B"],
+                    runner=runner,
+                )
+            ]
+        )
+        results[runner] = session.run(
+            namespace="n1", inputs={"A": 2}, parameters={"B": 2}
+        )
+        calls[runner] = hooks.calls
+
+    assert results["compiled"] == results["sequential"]
+    assert calls["compiled"] == calls["sequential"]
+
+
+@pytest.mark.parametrize(
+    "hook_mode, expected_hooked_iterations",
+    [("full", 5), ("sampled", 3), ("off", 0)],
+)
+def test_session_hook_mode(
+    mock_pipeline: Pipeline, hook_mode, expected_hooked_iterations
+):
+    hooks = RecordingHooks()
+    hook_manager = _create_hook_manager()
+    hook_manager.register(hooks)
+    session = KedroBootSession(
+        pipeline=pipeline(mock_pipeline, namespace="n1"),
+        catalog=DataCatalog(
+            {
+                "n1.A": MemoryDataset(),
+                "params:n1.B": MemoryDataset(3),
+                "n1.C": MemoryDataset(),
+                "n1.D": MemoryDataset(),
+                "n1.E": MemoryDataset(),
+                "n1.F": MemoryDataset(),
+            }
+        ),
+        hook_manager=hook_manager,
+        session_id="test1234",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [
+            CompilationSpec(
+                namespace="n1",
+                inputs=["A"],
+                outputs=["E", "F"],
+                parameters=["B"],
+                hook_mode=hook_mode,
+                hook_sampling=2,
+            )
+        ]
+    )
+    for _ in range(5):
+        session.run(namespace="n1", inputs={"A": 2}, parameters={"B": 2})
+
+    node_runs = [call for call in hooks.calls if call[0] == "before_node_run"]
+    assert len(node_runs) == expected_hooked_iterations * len(mock_pipeline.nodes)
+
+    iteration_stats = session.get_iteration_stats("n1")
+    assert iteration_stats.iterations == 5
+    assert iteration_stats.hooked_iterations == expected_hooked_iterations
+    assert iteration_stats.run_time > 0
+
+
+def test_compilation_spec_hook_mode():
+    with pytest.raises(ValueError):
+        CompilationSpec(hook_mode="partial")
+    with pytest.raises(ValueError):
+        CompilationSpec(hook_mode="sampled", hook_sampling=0)
+
+
+def branches_pipeline(tags=None) -> Pipeline:
+    def score(x, weight):
+        return x * weight
+
+    def total(*scores):
+        return sum(scores)
+
+    return pipeline(
+        [
+            node(
+                score,
+                ["A", f"params:w{branch}"],
+                f"S{branch}",
+                name=f"s{branch}",
+                tags=tags,
+            )
+            for branch in range(4)
+        ]
+        + [node(total, [f"S{branch}" for branch in range(4)], "T", name="total")],
+        namespace="n1",
+    )
+
+
+@pytest.mark.parametrize(
+    "runner, runner_workers, expected_runner, expected_workers",
+    [
+        ("sequential", None, "sequential", None),
+        ("thread", None, "thread", 4),
+        ("thread", 2, "thread", 2),
+        ("auto", None, "compiled", None),
+        ("compiled", None, "compiled", None),
+    ],
+)
+def test_session_runners(runner, runner_workers, expected_runner, expected_workers):
+    session = KedroBootSession(
+        pipeline=branches_pipeline(),
+        catalog=DataCatalog(
+            {
+                "n1.A": MemoryDataset(),
+                "n1.T": MemoryDataset(),
+                **{
+                    f"params:n1.w{branch}": MemoryDataset(branch) for branch in range(4)
+                },
+                **{f"n1.S{branch}": MemoryDataset() for branch in range(4)},
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="test1234",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [
+            CompilationSpec(
+                namespace="n1",
+                inputs=["A"],
+                outputs=["T"],
+                runner=runner,
+                runner_workers=runner_workers,
+            )
+        ]
+    )
+
+    namespace_runner = session._context.get_runner("n1")
+    if expected_runner == "thread":
+        assert namespace_runner._max_workers == expected_workers
+    else:
+        assert namespace_runner is None
+    assert (session._context.get_executor("n1") is not None) == (
+        expected_runner == "compiled"
+    )
+    assert session.run(namespace="n1", inputs={"A": 2}) == 12
+
+
+def test_compile_auto_runner_linear_pipeline(mock_pipeline: Pipeline):
+    from kedro_boot.framework.compiler.compiler import compile_runner
+
+    assert compile_runner(mock_pipeline, "auto") == ("compiled", None)
+    assert compile_runner(mock_pipeline, "auto", 4) == ("compiled", None)
+    assert compile_runner(mock_pipeline, None) == (None, None)
+
+
+def test_compile_auto_runner_io_bound_branches():
+    from kedro_boot.framework.compiler.compiler import compile_runner
+
+    # In memory branches would only contend for the GIL
+    assert compile_runner(branches_pipeline(), "auto") == ("compiled", None)
+    assert compile_runner(branches_pipeline(), "thread") == ("thread", 4)
+    assert compile_runner(branches_pipeline(tags=["io_bound"]), "auto") == (
+        "thread",
+        4,
+    )
+    assert compile_runner(branches_pipeline(tags=["io_bound"]), "auto", 2) == (
+        "thread",
+        2,
+    )
+    assert compile_runner(
+        branches_pipeline(), "auto", io_datasets=["n1.S0", "n1.S1"]
+    ) == ("thread", 2)
+    assert compile_runner(branches_pipeline(), "auto", io_datasets=["n1.T"]) == (
+        "compiled",
+        None,
+    )
+
+
+def test_session_arun(mock_pipeline: Pipeline):
+    session = KedroBootSession(
+        pipeline=pipeline(mock_pipeline, namespace="n1"),
+        catalog=DataCatalog(
+            {
+                "n1.A": MemoryDataset(),
+                "params:n1.B": MemoryDataset(3),
+                "n1.C": MemoryDataset(),
+                "n1.D": MemoryDataset(),
+                "n1.E": MemoryDataset(),
+                "n1.F": MemoryDataset(),
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="test1234",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.set_iteration_executor(max_workers=2)
+
+    async def run_iterations():
+        return await asyncio.gather(
+            *[
+                session.arun(namespace="n1", inputs={"A": a}, parameters={"B": 1})
+                for a in range(1, 9)
+            ]
+        )
+
+    results = asyncio.run(run_iterations())
+
+    assert [result["n1.E"] for result in results] == [a**6 for a in range(1, 9)]
+    assert session.get_iteration_executor()._max_workers == 2
+    assert session.get_iteration_stats("n1").iterations == 8
+
+    with pytest.raises(KedroBootSessionError):
+        session.set_iteration_executor(max_workers=0)
+
+
+def test_session_run_batch(mock_pipeline: Pipeline):
+    hooks = RecordingHooks()
+    hook_manager = _create_hook_manager()
+    hook_manager.register(hooks)
+    session = KedroBootSession(
+        pipeline=pipeline(mock_pipeline, namespace="n1"),
+        catalog=DataCatalog(
+            {
+                "n1.A": MemoryDataset(),
+                "params:n1.B": MemoryDataset(3),
+                "n1.C": MemoryDataset(),
+                "n1.D": MemoryDataset(),
+                "n1.E": MemoryDataset(),
+                "n1.F": MemoryDataset(),
+            }
+        ),
+        hook_manager=hook_manager,
+        session_id="test1234",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [CompilationSpec(namespace="n1", inputs=["A"], outputs=["E"], parameters=["B"])]
+    )
+
+    for concurrent in [False, True]:
+        results = session.run_batch(
+            namespace="n1",
+            inputs_list=[{"A": a} for a in range(1, 6)],
+            parameters_list=[{"B": 1}] * 5,
+            concurrent=concurrent,
+        )
+        assert results == [a**6 for a in range(1, 6)]
+
+    # Each batch is one pipeline run, whose iterations all fire the node hooks
+    pipeline_runs = [call for call in hooks.calls if "pipeline_run" in call[0]]
+    assert (
+        pipeline_runs
+        == [
+            ("before_pipeline_run", 5),
+            ("after_pipeline_run", 5),
+        ]
+        * 2
+    )
+    node_runs = [call for call in hooks.calls if call[0] == "before_node_run"]
+    assert len(node_runs) == 10 * len(mock_pipeline.nodes)
+    iteration_stats = session.get_iteration_stats("n1")
+    assert iteration_stats.iterations == 10
+    assert iteration_stats.hooked_iterations == 10
+
+    # A single run is a pipeline run too, and the pipeline hooks get the kedro run_params
+    hooks.calls.clear()
+    session.run(namespace="n1", inputs={"A": 2}, run_id="run1234")
+    assert [call for call in hooks.calls if "pipeline_run" in call[0]] == [
+        ("before_pipeline_run", None),
+        ("after_pipeline_run", None),
+    ]
+    batch_run_params, run_params = hooks.run_params[-2:]
+    for params in [batch_run_params, run_params]:
+        assert set(KEDRO_RUN_PARAMS) <= set(params)
+        assert params["session_id"] == "test1234"
+        assert params["namespace"] == "n1"
+        assert params["runner"] == "SequentialRunner"
+        assert params["kedro_version"]
+    assert run_params["run_id"] == "run1234"
+    assert batch_run_params["run_id"] != run_params["run_id"]
+
+    with pytest.raises(KedroBootSessionError):
+        session.run_batch(
+            namespace="n1", inputs_list=[{"A": 1}], parameters_list=[{}, {}]
+        )
+
+
+def test_session_run_batch_templates(tmp_path, mock_pipeline: Pipeline):
+    session = KedroBootSession(
+        pipeline=pipeline(mock_pipeline, namespace="n1"),
+        catalog=DataCatalog(
+            {
+                "n1.A": MemoryDataset(),
+                "params:n1.B": MemoryDataset(1),
+                "n1.C": MemoryDataset(),
+                "n1.D": MemoryDataset(),
+                "n1.E": MemoryDataset(),
+                "n1.F": JSONDataset(filepath=template_filepath),
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="test1234",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile([CompilationSpec(namespace="n1", inputs=["A"], outputs=["E"])])
+
+    results = session.run_batch(
+        namespace="n1",
+        inputs_list=[{"A": a} for a in [1, 2, 3]],
+        itertime_params_list=[{"date_param": date} for date in ["d1", "d1", "d2"]],
+    )
+    assert results == [1, 64, 729]
+    # The shared template datasets are rendered once per distinct itertime params
+    assert session.get_template_cache_info("n1").misses == 2
+    assert json.loads((tmp_path / "test_data_d1.csv").read_text()) == {"results": 64}
+    assert json.loads((tmp_path / "test_data_d2.csv").read_text()) == {"results": 729}
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_session_map(mock_pipeline: Pipeline, executor):
+    session = KedroBootSession(
+        pipeline=pipeline(mock_pipeline, namespace="n1"),
+        catalog=DataCatalog(
+            {
+                "n1.A": MemoryDataset(),
+                "params:n1.B": MemoryDataset(3),
+                "n1.C": MemoryDataset(),
+                "n1.D": MemoryDataset(),
+                "n1.E": MemoryDataset(),
+                "n1.F": MemoryDataset(),
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="test1234",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [CompilationSpec(namespace="n1", inputs=["A"], outputs=["E"], parameters=["B"])]
+    )
+
+    results = session.map(
+        namespace="n1",
+        grid={"B": list(range(1, 6))},
+        executor=executor,
+        max_workers=2,
+        inputs={"A": 1},
+    )
+
+    assert sorted((parameters["B"], result) for parameters, result in results) == [
+        (b, b**6) for b in range(1, 6)
+    ]
+
+    with pytest.raises(KedroBootSessionError):
+        session.map(namespace="n1", grid=[{"B": 1}], executor="cluster")
+
+
+def test_session_map_process_with_live_threads(mock_pipeline: Pipeline, caplog):
+    import threading
+
+    session = KedroBootSession(
+        pipeline=pipeline(mock_pipeline, namespace="n1"),
+        catalog=DataCatalog(
+            {
+                "n1.A": MemoryDataset(),
+                "params:n1.B": MemoryDataset(3),
+                "n1.C": MemoryDataset(),
+                "n1.D": MemoryDataset(),
+                "n1.E": MemoryDataset(),
+                "n1.F": MemoryDataset(),
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="test1234",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [CompilationSpec(namespace="n1", inputs=["A"], outputs=["E"], parameters=["B"])]
+    )
+
+    # Interleaved maps of the same session keep their own inputs
+    results_a1 = session.map(
+        namespace="n1", grid={"B": [1, 2]}, executor="process", inputs={"A": 1}
+    )
+    results_a2 = session.map(
+        namespace="n1", grid={"B": [1, 2]}, executor="process", inputs={"A": 2}
+    )
+    first_result_a1 = next(results_a1)
+    assert sorted(result for _, result in results_a2) == [2**6, 4**6]
+    assert sorted(result for _, result in [first_result_a1, *results_a1]) == [1, 2**6]
+
+    thread_released = threading.Event()
+    for thread_name, forbidden in [
+        ("kedro-boot-iteration_0", False),
+        ("kedro-boot-prefetch-0", True),
+    ]:
+        live_thread = threading.Thread(target=thread_released.wait, name=thread_name)
+        live_thread.start()
+        try:
+            results = session.map(
+                namespace="n1", grid={"B": [1]}, executor="process", inputs={"A": 2}
+            )
+            if forbidden:
+                with pytest.raises(KedroBootSessionError):
+                    list(results)
+            else:
+                with caplog.at_level("WARNING"):
+                    assert list(results) == [({"B": 1}, 2**6)]
+                assert thread_name in caplog.text
+        finally:
+            thread_released.set()
+            live_thread.join()
+            thread_released.clear()
+
+
+def test_session_artifact_store(tmp_path):
+    from kedro_datasets.pickle import PickleDataset
+    import pandas as pd
+
+    def predict(features, weights, lookup):
+        return float(weights @ features) + lookup["bias"].sum()
+
+    PickleDataset(filepath=str(tmp_path / "weights.pkl")).save(np.arange(3.0))
+    PickleDataset(filepath=str(tmp_path / "lookup.pkl")).save(
+        pd.DataFrame({"bias": [1.0, 2.0], "label": ["a", "b"]})
+    )
+
+    artifacts_datasets = []
+    results = []
+    for _ in range(2):
+        session = KedroBootSession(
+            pipeline=pipeline(
+                [node(predict, ["features", "weights", "lookup"], "prediction")],
+                namespace="n1",
+            ),
+            catalog=DataCatalog(
+                {
+                    "n1.features": MemoryDataset(),
+                    "n1.weights": PickleDataset(filepath=str(tmp_path / "weights.pkl")),
+                    "n1.lookup": PickleDataset(filepath=str(tmp_path / "lookup.pkl")),
+                    "n1.prediction": MemoryDataset(),
+                }
+            ),
+            hook_manager=_NullPluginManager(),
+            session_id="test1234",
+            app_runtime_params={},
+            config_loader=OmegaConfigLoader(""),
+        )
+        session.compile(
+            [
+                CompilationSpec(
+                    namespace="n1", inputs=["features"], outputs=["prediction"]
+                )
+            ],
+            materialization_spec=MaterializationSpec(store_dir=str(tmp_path / "store")),
+        )
+        results.append(session.run(namespace="n1", inputs={"features": np.ones(3)}))
+        artifacts_datasets.append(
+            session._context._namespaces_registry["n1"]["catalog"].artifacts
+        )
+
+    assert results == [6.0, 6.0]
+    for artifacts in artifacts_datasets:
+        weights = artifacts["n1.weights"].load()
+        lookup = artifacts["n1.lookup"].load()
+        assert isinstance(weights, np.memmap) and not weights.flags.writeable
+        assert lookup["label"].tolist() == ["a", "b"]
+        bias_buffer = lookup["bias"].to_numpy()
+        while bias_buffer.base is not None and not isinstance(bias_buffer, np.memmap):
+            bias_buffer = bias_buffer.base
+        assert isinstance(bias_buffer, np.memmap)
+    assert len(list((tmp_path / "store").iterdir())) == 2
+
+
+def slow_artifacts(*load_times: float) -> Dict[str, SlowDataset]:
+    return {
+        f"artifact_{index}": SlowDataset(1, load_time)
+        for index, load_time in enumerate(load_times)
+    }
+
+
+def artifacts_specs(namespaces: List[str]) -> List[CompilationSpec]:
+    return [
+        CompilationSpec(
+            namespace=namespace, inputs=["features"], outputs=["prediction"]
+        )
+        for namespace in namespaces
+    ]
+
+
+def test_session_parallel_artifacts_materialization(artifacts_session):
+    session = artifacts_session({"n1": slow_artifacts(0.3, 0.3, 0.3, 0.1)})
+    start_time = time.perf_counter()
+    session.compile(
+        artifacts_specs(["n1"]),
+        materialization_spec=MaterializationSpec(workers=4, timeout=5),
+    )
+
+    assert time.perf_counter() - start_time < 0.8
+    assert session.run(namespace="n1", inputs={"features": 1}) == 5
+    load_times = session.get_artifacts_load_times()
+    assert set(load_times) == {f"n1.artifact_{index}" for index in range(4)}
+    assert load_times["n1.artifact_0"] >= 0.3
+
+
+def test_session_artifacts_materialization_timeout(artifacts_session):
+    import threading
+
+    from kedro_boot.framework.context.artifacts import ArtifactMaterializationError
+
+    session = artifacts_session({"n1": slow_artifacts(0.05, 1)})
+    with pytest.raises(ArtifactMaterializationError, match="n1.artifact_1"):
+        session.compile(
+            artifacts_specs(["n1"]),
+            materialization_spec=MaterializationSpec(workers=2, timeout=0.3),
+        )
+
+    # The timed out load keeps running in a daemon thread, that doesn't block the interpreter exit
+    load_threads = [
+        thread
+        for thread in threading.enumerate()
+        if thread.name == "kedro-boot-artifacts-load"
+    ]
+    assert load_threads and all(thread.daemon for thread in load_threads)
+
+
+@pytest.mark.parametrize(
+    "materialization_options, error_match",
+    [
+        (dict(executor="dask"), "executor"),
+        (dict(workers=0), "workers"),
+        (dict(policy="on_demand"), "policy"),
+        (dict(memory_budget="lots"), "Invalid memory size"),
+        (dict(deduplication="hash"), "Invalid artifacts deduplication"),
+        (dict(policy="lazy", prefetch=False), "needs the prefetch"),
+    ],
+)
+def test_materialization_spec_validation(materialization_options, error_match):
+    with pytest.raises(ValueError, match=error_match):
+        MaterializationSpec(**materialization_options)
+
+
+def multiply(x, y):
+    return x * y
+
+
+def test_session_compiled_snapshot(tmp_path, monkeypatch, artifacts_session):
+    from kedro_datasets.pickle import PickleDataset
+
+    import kedro_boot.framework.context.artifacts as artifacts_module
+
+    snapshot_path = str(tmp_path / "snapshot.pkl")
+    compilation_specs = [
+        CompilationSpec(
+            namespace="n1",
+            inputs=["features"],
+            outputs=["prediction"],
+            runner="compiled",
+        )
+    ]
+    PickleDataset(filepath=str(tmp_path / "model.pkl")).save(3)
+
+    def snapshot_session():
+        return artifacts_session(
+            {"n1": {"model": PickleDataset(filepath=str(tmp_path / "model.pkl"))}},
+            datasets={
+                "n1.prediction": JSONDataset(
+                    filepath=str(
+                        tmp_path / "prediction_${oc.select:date_param,01_01_1960}.json"
+                    ),
+                    credentials={"token": "secret-token"},
+                )
+            },
+        )
+
+    session = snapshot_session()
+    session.compile(compilation_specs, snapshot_path=snapshot_path)
+    assert session.run(namespace="n1", inputs={"features": 2}) == 5
+    # The catalog datasets are referenced by name, their credentials are not written
+    assert os.stat(snapshot_path).st_mode & 0o777 == 0o600
+    with open(snapshot_path, "rb") as snapshot_file:
+        assert b"secret-token" not in snapshot_file.read()
+
+    # The compiled catalog and its artifacts are loaded from the snapshot
+    def fail_load_artifacts(*args, **kwargs):
+        raise AssertionError("The artifacts should be loaded from the snapshot")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(artifacts_module, "load_artifacts", fail_load_artifacts)
+        session = snapshot_session()
+        session.compile(compilation_specs, snapshot_path=snapshot_path)
+    assert session.run(namespace="n1", inputs={"features": 2}) == 5
+    assert (
+        session.run(
+            namespace="n1",
+            inputs={"features": 2},
+            itertime_params={"date_param": "1234"},
+        )
+        == 5
+    )
+    assert (tmp_path / "prediction_1234.json").exists()
+
+    # An updated artifact file outdates the snapshot
+    time.sleep(0.01)
+    PickleDataset(filepath=str(tmp_path / "model.pkl")).save(4)
+    session = snapshot_session()
+    session.compile(compilation_specs, snapshot_path=snapshot_path)
+    assert session.run(namespace="n1", inputs={"features": 2}) == 6
+
+
+def test_session_compiled_snapshot_artifact_store(tmp_path, caplog, artifacts_session):
+    from kedro_datasets.pickle import PickleDataset
+
+    snapshot_path = tmp_path / "snapshot.pkl"
+    PickleDataset(filepath=str(tmp_path / "model.pkl")).save(np.ones(2**20))
+    materialization_spec = MaterializationSpec(store_dir=str(tmp_path / "store"))
+
+    for _ in range(2):
+        session = artifacts_session(
+            {"n1": {"model": PickleDataset(filepath=str(tmp_path / "model.pkl"))}}
+        )
+        with caplog.at_level("INFO"):
+            session.compile(
+                artifacts_specs(["n1"]),
+                materialization_spec=materialization_spec,
+                snapshot_path=str(snapshot_path),
+            )
+        assert session.run(namespace="n1", inputs={"features": 1}) == 2**20 + 1
+    assert "Catalog compilation loaded from the compiled snapshot" in caplog.text
+
+    # The snapshot references the stored artifact, that is mapped again read-only at load time
+    assert snapshot_path.stat().st_size < 2**20
+    model = (
+        session._context._namespaces_registry["n1"]["catalog"]
+        .artifacts["n1.model"]
+        .load()
+    )
+    assert isinstance(model, np.memmap) and model._mmap is not None
+    assert not model.flags.writeable
+
+
+def test_session_compiled_snapshot_remote_artifact(
+    tmp_path, monkeypatch, caplog, artifacts_session
+):
+    from kedro_datasets.pickle import PickleDataset
+
+    snapshot_path = str(tmp_path / "snapshot.pkl")
+    model_filepath = f"memory:///{tmp_path.name}/model.pkl"
+    PickleDataset(filepath=model_filepath).save(3)
+
+    def compile_session():
+        model_dataset = PickleDataset(filepath=model_filepath)
+        session = artifacts_session({"n1": {"model": model_dataset}})
+        with caplog.at_level("INFO"):
+            session.compile(artifacts_specs(["n1"]), snapshot_path=snapshot_path)
+        return session, model_dataset
+
+    compile_session()
+    # An updated remote artifact outdates the snapshot
+    PickleDataset(filepath=model_filepath).save(4)
+    caplog.clear()
+    session, _ = compile_session()
+    assert "loaded from the compiled snapshot" not in caplog.text
+    assert session.run(namespace="n1", inputs={"features": 1}) == 5
+
+    # An artifact source that can't be stat'ed could be stale, the snapshot is not used
+    def fail_info(path, **kwargs):
+        raise PermissionError(path)
+
+    model_dataset = PickleDataset(filepath=model_filepath)
+    monkeypatch.setattr(model_dataset._fs, "info", fail_info)
+    caplog.clear()
+    session = artifacts_session({"n1": {"model": model_dataset}})
+    with caplog.at_level("INFO"):
+        session.compile(artifacts_specs(["n1"]), snapshot_path=snapshot_path)
+    assert f"The compiled snapshot {snapshot_path} is not used" in caplog.text
+    assert "loaded from the compiled snapshot" not in caplog.text
+    assert session.run(namespace="n1", inputs={"features": 1}) == 5
+
+
+def test_session_lazy_artifacts_materialization(artifacts_session):
+    from concurrent.futures import ThreadPoolExecutor
+
+    fast_artifact, slow_artifact = SlowDataset(1, 0.01), SlowDataset(2, 0.3)
+    session = artifacts_session(
+        {
+            "critical": {"fast_artifact": fast_artifact},
+            "rare": {"slow_artifact": slow_artifact},
+        }
+    )
+    start_time = time.perf_counter()
+    session.compile(
+        artifacts_specs(["critical", "rare"]),
+        materialization_spec=MaterializationSpec(
+            policy="lazy",
+            critical_namespaces=["critical"],
+            prefetch=False,
+            readiness="critical",
+        ),
+    )
+
+    assert time.perf_counter() - start_time < 0.3
+    assert fast_artifact.loads == 1 and slow_artifact.loads == 0
+    assert session.get_artifacts_readiness() == (True, 1, 2, {})
+
+    # Concurrent first uses of the lazy artifact load it once
+    with ThreadPoolExecutor(4) as executor:
+        results = list(
+            executor.map(
+                lambda _: session.run(namespace="rare", inputs={"features": 1}),
+                range(4),
+            )
+        )
+    assert results == [3, 3, 3, 3]
+    assert slow_artifact.loads == 1
+    assert session.get_artifacts_readiness() == (True, 2, 2, {})
+    assert session.get_artifacts_load_times()["rare.slow_artifact"] >= 0.3
+
+
+@pytest.mark.parametrize("start_background_tasks", [True, False])
+def test_session_lazy_artifacts_prefetch(artifacts_session, start_background_tasks):
+    import threading
+
+    session = artifacts_session({"n1": slow_artifacts(0.1, 0.1)})
+    session.compile(
+        artifacts_specs(["n1"]),
+        materialization_spec=MaterializationSpec(
+            policy="lazy", readiness="critical", workers=2, watch_interval=60
+        ),
+        start_background_tasks=start_background_tasks,
+    )
+    assert session.get_artifacts_readiness().ready
+
+    if not start_background_tasks:
+        # Nothing runs in the background until the tasks are started, ex: by the workers forked from a preloaded master
+        time.sleep(0.3)
+        assert session.get_artifacts_readiness() == (True, 0, 2, {})
+        assert not [
+            thread
+            for thread in threading.enumerate()
+            if thread.name.startswith(("kedro-boot-prefetch", "kedro-boot-artifacts"))
+        ]
+        session.start_artifacts_background_tasks()
+
+    for _ in range(50):
+        if session.get_artifacts_readiness().loaded_artifacts == 2:
+            break
+        time.sleep(0.02)
+    assert session.get_artifacts_readiness() == (True, 2, 2, {})
+    assert "kedro-boot-artifacts-watcher" in [
+        thread.name for thread in threading.enumerate()
+    ]
+    session._context._artifacts.stop_watching()
+
+
+def test_session_lazy_artifacts_prefetch_failure(artifacts_session, monkeypatch):
+    from kedro_boot.framework.context import artifacts as artifacts_module
+
+    class FlakyDataset(SlowDataset):
+        def __init__(self, data, failures):
+            super().__init__(data)
+            self.failures = failures
+
+        def load(self):
+            if self.loads < self.failures:
+                self.loads += 1
+                raise ConnectionError("artifact store unavailable")
+            return super().load()
+
+    monkeypatch.setattr(artifacts_module, "PREFETCH_RETRIES", 1)
+    monkeypatch.setattr(artifacts_module, "PREFETCH_RETRY_DELAY", 0.01)
+
+    # A transient failure is retried
+    flaky_artifact = FlakyDataset(1, failures=1)
+    session = artifacts_session({"n1": {"flaky_artifact": flaky_artifact}})
+    session.compile(
+        artifacts_specs(["n1"]),
+        materialization_spec=MaterializationSpec(policy="lazy", workers=1),
+        start_background_tasks=False,
+    )
+    session._context._artifacts._prefetch(wait=True)
+    assert session.get_artifacts_readiness() == (True, 1, 1, {})
+    assert flaky_artifact.loads == 2
+
+    # A failure that outlasts the retries is reported until the artifact is loaded at its first use
+    flaky_artifact = FlakyDataset(1, failures=2)
+    session = artifacts_session({"n1": {"flaky_artifact": flaky_artifact}})
+    session.compile(
+        artifacts_specs(["n1"]),
+        materialization_spec=MaterializationSpec(policy="lazy", workers=1),
+        start_background_tasks=False,
+    )
+    session._context._artifacts._prefetch(wait=True)
+    readiness = session.get_artifacts_readiness()
+    assert readiness[:3] == (False, 0, 1)
+    assert (
+        "artifact store unavailable" in readiness.failed_artifacts["n1.flaky_artifact"]
+    )
+
+    assert session.run(namespace="n1", inputs={"features": 1}) == 2
+    assert session.get_artifacts_readiness() == (True, 1, 1, {})
+
+
+def test_session_refresh_artifacts(tmp_path):
+    import threading
+
+    from kedro_datasets.pickle import PickleDataset
+
+    node_started, refreshed = threading.Event(), threading.Event()
+
+    def wait_refresh(x):
+        node_started.set()
+        refreshed.wait(timeout=5)
+        return x
+
+    model_dataset = PickleDataset(filepath=str(tmp_path / "model.pkl"))
+    model_dataset.save(3)
+    session = KedroBootSession(
+        pipeline=pipeline(
+            [
+                node(wait_refresh, "A", "B"),
+                node(multiply, ["B", "model"], "C"),
+            ],
+            namespace="n1",
+        ),
+        catalog=DataCatalog(
+            {
+                "n1.A": MemoryDataset(),
+                "n1.B": MemoryDataset(),
+                "n1.model": PickleDataset(filepath=str(tmp_path / "model.pkl")),
+                "n1.C": MemoryDataset(),
+            }
+        ),
+        hook_manager=_NullPluginManager(),
+        session_id="test1234",
+        app_runtime_params={},
+        config_loader=OmegaConfigLoader(""),
+    )
+    session.compile(
+        [CompilationSpec(namespace="n1", inputs=["A"], outputs=["C"])],
+        materialization_spec=MaterializationSpec(watch_interval=0.05),
+    )
+
+    # The running iteration keeps the previous version of the artifact
+    in_flight_results = []
+    in_flight_run = threading.Thread(
+        target=lambda: in_flight_results.append(
+            session.run(namespace="n1", inputs={"A": 2})
+        )
+    )
+    in_flight_run.start()
+    node_started.wait(timeout=5)
+    model_dataset.save(4)
+    assert session.refresh_artifacts(["n1.model"]) == ["n1.model"]
+    refreshed.set()
+    in_flight_run.join()
+    assert in_flight_results == [6]
+    assert session.run(namespace="n1", inputs={"A": 2}) == 8
+
+    # The watcher reload the changed artifacts
+    time.sleep(0.01)
+    model_dataset.save(5)
+    for _ in range(100):
+        if session.run(namespace="n1", inputs={"A": 2}) == 10:
+            break
+        time.sleep(0.02)
+    assert session.run(namespace="n1", inputs={"A": 2}) == 10
+
+    with pytest.raises(Exception, match="not artifacts"):
+        session.refresh_artifacts(["n1.A"])
+    session._context._artifacts.stop_watching()
+
+
+def test_artifacts_watcher_after_fork():
+    import multiprocessing
+
+    from kedro_boot.framework.context.artifacts import ArtifactsWatcher
+
+    artifacts_watcher = ArtifactsWatcher(
+        get_fingerprints=dict, refresh=lambda names: names, interval=60
+    )
+    artifacts_watcher.start()
+
+    def report_watcher(results):
+        results.put(artifacts_watcher._thread.is_alive())
+
+    # A forked process doesn't watch the artifacts
+    fork_context = multiprocessing.get_context("fork")
+    results = fork_context.Queue()
+    process = fork_context.Process(target=report_watcher, args=(results,))
+    process.start()
+    assert results.get(timeout=10) is False
+    process.join()
+    assert artifacts_watcher._thread.is_alive()
+    artifacts_watcher.stop()
+
+
+def test_session_artifacts_memory_budget(artifacts_session):
+    namespaces = ["n1", "n2", "n3"]
+    model_datasets = {namespace: SlowDataset(np.ones(1000)) for namespace in namespaces}
+    session = artifacts_session(
+        {namespace: {"model": model_datasets[namespace]} for namespace in namespaces}
+    )
+    # Each model is 8000 bytes, the budget holds two of them
+    session.compile(
+        artifacts_specs(namespaces),
+        materialization_spec=MaterializationSpec(memory_budget="20KB"),
+    )
+    # The compile time prefetch stops at the budget, the overflowing artifact is the one evicted
+    assert session.get_artifacts_memory_info() == (20480, 16000, 2, 1, 0, 0.0, 0.0)
+    assert session.get_artifacts_readiness().ready
+    assert model_datasets["n3"].loads == 1
+
+    # n1 and n2 are evicted in turn to load n3 then n1 again, n1 stays resident as the most recently used
+    for namespace in ["n2", "n3", "n1", "n1"]:
+        assert session.run(namespace=namespace, inputs={"features": 1}) == 1001
+
+    memory_info = session.get_artifacts_memory_info()
+    assert memory_info.resident_bytes == 16000
+    assert memory_info.resident_artifacts == 2
+    assert memory_info.evictions == 3
+    assert memory_info.reloads == 2
+    assert [model_datasets[namespace].loads for namespace in namespaces] == [2, 1, 2]
+
+
+def test_artifacts_source_key(tmp_path):
+    from kedro_datasets.pickle import PickleDataset
+
+    from kedro_boot.framework.context.artifacts import source_key
+
+    filepath = str(tmp_path / "model.pkl")
+    source = source_key(PickleDataset(filepath=filepath))
+    assert source_key(PickleDataset(filepath=filepath)) == source
+    # The datasets reading the same file with another load config are not the same source
+    for dataset in [
+        PickleDataset(filepath=filepath, backend="cloudpickle"),
+        PickleDataset(filepath=filepath, load_args={"encoding": "latin1"}),
+        PickleDataset(filepath=filepath, fs_args={"open_args_load": {"mode": "r"}}),
+        PickleDataset(filepath=filepath, credentials={"token": "secret"}),
+    ]:
+        assert source_key(dataset) != source
+    assert source_key(MemoryDataset(1)) is None
+
+
+def test_artifacts_remote_source_key(tmp_path, monkeypatch, caplog):
+    from kedro_datasets.pickle import PickleDataset
+
+    from kedro_boot.framework.context.artifacts import ArtifactStore, artifact_key
+
+    model_dataset = PickleDataset(filepath=f"memory:///{tmp_path.name}/model.pkl")
+    model_dataset.save(np.arange(3.0))
+    key = artifact_key("model", model_dataset)
+    assert artifact_key("model", model_dataset) == key
+    # The remote sources are stat'ed through their filesystem
+    model_dataset.save(np.arange(4.0))
+    assert artifact_key("model", model_dataset) != key
+
+    # A source that can't be stat'ed is not stored, its stored version could be stale
+    def fail_info(path, **kwargs):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(model_dataset._fs, "info", fail_info)
+    artifact_store = ArtifactStore(str(tmp_path / "store"))
+    with caplog.at_level("WARNING"):
+        model = artifact_store.load("model", model_dataset)
+    assert model.tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert not isinstance(model, np.memmap)
+    assert "model is loaded in the process memory" in caplog.text
+    assert list((tmp_path / "store").iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "deduplication, expected_aliases",
+    [
+        ("off", {}),
+        ("source", {"n2.model": "n1.model"}),
+        ("content", {"n2.model": "n1.model", "n3.model": "n1.model"}),
+    ],
+)
+def test_session_artifacts_deduplication(
+    tmp_path, artifacts_session, deduplication, expected_aliases
+):
+    from kedro_datasets.pickle import PickleDataset
+
+    namespaces = ["n1", "n2", "n3"]
+    PickleDataset(filepath=str(tmp_path / "model.pkl")).save(np.ones(1000))
+    PickleDataset(filepath=str(tmp_path / "model_copy.pkl")).save(np.ones(1000))
+    # n1 and n2 read the same file under different names, n3 reads a copy of it
+    session = artifacts_session(
+        {
+            namespace: {"model": PickleDataset(filepath=str(tmp_path / model_file))}
+            for namespace, model_file in zip(
+                namespaces, ["model.pkl", "model.pkl", "model_copy.pkl"]
+            )
+        }
+    )
+    session.compile(
+        artifacts_specs(namespaces),
+        materialization_spec=MaterializationSpec(deduplication=deduplication),
+    )
+
+    assert session.get_artifacts_deduplication() == (
+        expected_aliases,
+        8000 * len(expected_aliases),
+    )
+    assert set(session.get_artifacts_load_times()) == {
+        f"{namespace}.model" for namespace in namespaces
+    } - set(expected_aliases)
+    for namespace in namespaces:
+        assert session.run(namespace=namespace, inputs={"features": 2}) == 1002
+
+    # A refresh reloads the artifacts sharing the same source together
+    PickleDataset(filepath=str(tmp_path / "model.pkl")).save(np.ones(1000) * 2)
+    refreshed_artifacts = session.refresh_artifacts(["n2.model"])
+    assert set(refreshed_artifacts) == (
+        {"n2.model"} if deduplication == "off" else {"n1.model", "n2.model"}
+    )
+    assert [
+        session.run(namespace=namespace, inputs={"features": 2})
+        for namespace in namespaces
+    ] == ([1002, 2002, 1002] if deduplication == "off" else [2002, 2002, 1002])
+    assert session.get_artifacts_deduplication().aliases == (
+        {"n2.model": "n1.model"} if deduplication != "off" else {}
+    )
+
+
+def test_index_pipeline_namespaces():
+    from kedro_boot.framework.compiler.specs import (
+        filter_pipeline,
+        index_pipeline_namespaces,
+    )
+
+    namespaces_pipeline = (
+        pipeline([node(multiply, ["A", "params:B"], "C")], namespace="n1")
+        + pipeline([node(multiply, ["A", "B"], "C")], namespace="n2")
+        + Pipeline([node(multiply, ["A", "B"], "C", name="no_namespace")])
+    )
+    namespaces_pipelines = index_pipeline_namespaces(namespaces_pipeline)
+
+    assert set(namespaces_pipelines) == {"n1", "n2", None}
+    for namespace, namespace_pipeline in namespaces_pipelines.items():
+        assert namespace_pipeline.nodes == (
+            filter_pipeline(namespaces_pipeline, namespace).nodes
+        )
+
+    compilation_specs = CompilationSpec.infer_compilation_specs(
+        namespaces_pipeline, namespaces_pipelines
+    )
+    assert {
+        compilation_spec.namespace: (
+            sorted(compilation_spec.inputs),
+            compilation_spec.parameters,
+        )
+        for compilation_spec in compilation_specs
+    } == {"n1": (["A"], ["B"]), "n2": (["A", "B"], []), None: ([], [])}